@@ -1,8 +1,23 @@
 from athena_mvsh.connection import Athena
-from athena_mvsh.cursores import CursorParquet, CursorParquetDuckdb, CursorPython
+from athena_mvsh.cursores import (
+    CursorParquet,
+    CursorParquetDuckdb,
+    CursorPython,
+    UnloadOptions,
+    ResourceProfile,
+    WriteOptions,
+)
 
 __version__ = '0.0.28'
 __author__ = 'Marcus Holanda'
 __appname__ = 'athena'
 
-__all__ = ['Athena', 'CursorParquetDuckdb', 'CursorPython', 'CursorParquet']
+__all__ = [
+    'Athena',
+    'CursorParquetDuckdb',
+    'CursorPython',
+    'CursorParquet',
+    'UnloadOptions',
+    'ResourceProfile',
+    'WriteOptions',
+]
@@ -20,11 +20,18 @@ Métodos:
     - **fetchall**: Retorna todas as linhas do resultado.
     - **fetchmany**: Retorna um número especificado de linhas.
     - **to_arrow**: Converte os resultados para um formato Arrow.
+    - **to_arrow_reader**: Retorna os resultados em lotes através de um `pa.RecordBatchReader`.
+    - **to_polars**: Converte os resultados para um DataFrame Polars sem cópia.
+    - **to_duckdb**: Retorna uma relação DuckDB sobre os resultados, sem materializar os dados.
+    - **__arrow_c_stream__**: Exporta os resultados pela interface Arrow PyCapsule.
     - **to_parquet**: Converte os resultados para o formato Parquet.
     - **to_csv**: Converte os resultados para um arquivo CSV.
+    - **to_ipc**: Converte os resultados para um arquivo Arrow IPC (Feather).
+    - **to_ipc_stream**: Converte os resultados para um stream Arrow IPC.
     - **to_create_table_db**: Cria uma tabela no banco de dados usando os resultados.
     - **to_partition_create_table_db**: Cria uma tabela particionada no banco de dados.
     - **to_insert_table_db**: Insere dados em uma tabela do banco de dados.
+    - **sync_to_duckdb**: Sincroniza de forma incremental os resultados com uma tabela do DuckDB.
     - **write_dataframe**: Escreve um DataFrame em uma tabela no banco de dados.
     - **write_arrow**: Escreve um Table Arrow em uma tabela no banco de dados.
     - **write_parquet**: Escreve dados em formato Parquet no banco de dados.
@@ -72,19 +79,24 @@ Exemplo de uso:
         )
     ```
 """
+
 from __future__ import annotations
 from athena_mvsh.dbathena import DBAthena
 from athena_mvsh.cursores import (
+    ChunkIterator,
     CursorIterator,
     CursorBaseParquet,
     CursorParquetDuckdb,
     CursorPython,
     CursorParquet,
 )
+from athena_mvsh.cursores.cursorparquetduckdb import DataStream
 import pyarrow as pa
 import pyarrow.csv as csv_arrow
+import pyarrow.ipc as ipc
 from athena_mvsh.error import ProgrammingError
 import pandas as pd
+import duckdb
 import os
 from itertools import islice
 from athena_mvsh.formatador import cast_format
@@ -94,6 +106,7 @@ from typing import Literal
 
 
 WORKERS = min([4, os.cpu_count()])
+BATCH_SIZE = DBAthena.BATCH_SIZE
 
 
 class Athena(CursorIterator):
@@ -119,6 +132,7 @@ class Athena(CursorIterator):
 
         self.cursor = cursor
         self.row_cursor = None
+        self.__fetch_started = False
 
     def execute(
         self,
@@ -215,6 +229,7 @@ class Athena(CursorIterator):
             query = cast_format(query, *args, **kwargs)
 
         self.row_cursor = self.cursor.execute(query, result_reuse_enable)
+        self.__fetch_started = False
 
         self.query = query
         self.result_reuse_enable = result_reuse_enable
@@ -308,6 +323,8 @@ class Athena(CursorIterator):
             ```
         """
 
+        self.__fetch_started = True
+
         try:
             row = next(self.row_cursor)
         except StopIteration:
@@ -335,8 +352,39 @@ class Athena(CursorIterator):
             ```
         """
 
+        self.__fetch_started = True
+
+        if isinstance(self.row_cursor, ChunkIterator):
+            return self.row_cursor.fetchall()
+
         return list(self.row_cursor)
 
+    def __is_preview(self, size: int) -> bool:
+        return (
+            not self.__fetch_started
+            and isinstance(self.cursor, CursorBaseParquet)
+            and self.cursor.unload_mode == 'auto'
+            and size <= self.cursor.SMALL_RESULT_ROWS
+        )
+
+    def __fetch_preview(self, size: int) -> list | None:
+        # NOTE: Uma linha a mais indica se o resultado completo cabe na previa
+        query = self.query.strip().rstrip(';')
+        pages = self.cursor.execute_paged(
+            f'SELECT * FROM (\n{query}\n) LIMIT {size + 1}', self.result_reuse_enable
+        )
+
+        # NOTE: Resultado maior que a previa ou com colunas complexas e lido pelo UNLOAD
+        if pages is None:
+            return None
+
+        rows = [row for page in pages for row in page]
+        if len(rows) > size:
+            return None
+
+        self.row_cursor = iter([])
+        return rows
+
     def fetchmany(self, size: int = 1):
         """
         Retorna um número especificado de linhas do cursor.
@@ -345,6 +393,12 @@ class Athena(CursorIterator):
         Se o número de linhas disponíveis for menor que o valor de `size`, ele retorna
         o número de linhas restantes. O valor padrão de `size` é 1.
 
+        Com os cursores Parquet no modo `unload_mode='auto'`, se a primeira leitura for um
+        `fetchmany` pequeno (prévia), a consulta é lida pela API paginada do Athena com
+        `LIMIT size + 1`. Se o resultado completo couber na prévia, as linhas são retornadas
+        sem UNLOAD e o cursor termina. Caso contrário a prévia é descartada e todas as linhas
+        vêm de uma única execução com UNLOAD.
+
         Args:
             size (int, opcional): O número de linhas a serem retornadas. O valor padrão é 1.
 
@@ -361,6 +415,16 @@ class Athena(CursorIterator):
             ```
         """
 
+        if self.__is_preview(size):
+            self.__fetch_started = True
+            if (rows := self.__fetch_preview(size)) is not None:
+                return rows
+
+        self.__fetch_started = True
+
+        if isinstance(self.row_cursor, ChunkIterator):
+            return self.row_cursor.fetchmany(size)
+
         return list(islice(self.row_cursor, size))
 
     def to_arrow(self) -> pa.Table:
@@ -394,6 +458,160 @@ class Athena(CursorIterator):
 
         return self.cursor.to_arrow(self.query, self.result_reuse_enable)
 
+    def to_arrow_reader(self, batch_size: int = BATCH_SIZE) -> pa.RecordBatchReader:
+        """
+        Retorna os resultados da consulta como um `pa.RecordBatchReader` (PyArrow).
+
+        Diferente de `to_arrow`, os dados não são materializados de uma única vez:
+        cada lote (`pa.RecordBatch`) é lido sob demanda, permitindo processar resultados
+        de qualquer tamanho com uso de memória constante e código vetorizado.
+
+        - Para o cursor `CursorParquet`, os lotes são lidos do dataset Parquet gerado pelo UNLOAD.
+        - Para o cursor `CursorParquetDuckdb`, os lotes são obtidos com `to_arrow_reader` do DuckDB.
+        - Para o cursor `CursorPython`, as páginas de `get_query_results` são decodificadas em lotes.
+
+        Args:
+            batch_size (int, opcional): Número máximo de linhas por lote. O valor padrão é `BATCH_SIZE`.
+
+        Retorno:
+            pa.RecordBatchReader: Um leitor de lotes com os resultados da consulta.
+
+        Exemplo:
+            ```python
+            cursor = CursorParquetDuckdb(...)
+            with Athena(cursor) as athena:
+                athena.execute("SELECT id, name FROM users")
+                for batch in athena.to_arrow_reader(batch_size=50_000):
+                    print(batch.num_rows)
+            ```
+        """
+
+        return self.cursor.to_arrow_reader(
+            self.query, self.result_reuse_enable, batch_size
+        )
+
+    def __arrow_c_stream__(self, requested_schema: object = None) -> object:
+        """
+        Exporta os resultados da consulta pela interface Arrow PyCapsule (`ArrowArrayStream`).
+
+        Permite que bibliotecas compatíveis com Arrow (Polars, DuckDB, PyArrow, etc.) consumam
+        os resultados diretamente, sem cópia e sem passar por um DataFrame pandas. Os lotes
+        são produzidos sob demanda por `to_arrow_reader`.
+
+        Args:
+            requested_schema (object, opcional): PyCapsule com o schema solicitado pelo consumidor.
+
+        Exceções:
+            ProgrammingError: Se a versão do PyArrow instalada for anterior à 14.
+
+        Retorno:
+            object: Um PyCapsule contendo um `ArrowArrayStream`.
+
+        Exemplo:
+            ```python
+            import polars as pl
+
+            cursor = CursorParquetDuckdb(...)
+            with Athena(cursor) as athena:
+                athena.execute("SELECT id, name FROM users")
+                df = pl.DataFrame(athena)
+            ```
+        """
+
+        reader = self.to_arrow_reader()
+
+        # NOTE: A interface PyCapsule do RecordBatchReader existe a partir do pyarrow 14
+        if not hasattr(reader, '__arrow_c_stream__'):
+            raise ProgrammingError('__arrow_c_stream__ requires pyarrow>=14 !')
+
+        return reader.__arrow_c_stream__(requested_schema)
+
+    def to_polars(self, rechunk: bool = False):
+        """
+        Converte os resultados da consulta para um DataFrame Polars.
+
+        Para os cursores `CursorParquet` e `CursorParquetDuckdb`, o `pa.Table` produzido a partir
+        do UNLOAD é entregue ao Polars sem cópia. Para o cursor `CursorPython`, os lotes de
+        `to_arrow_reader` são agrupados em uma tabela antes da conversão.
+
+        Args:
+            rechunk (bool, opcional): Indica se as colunas devem ser reagrupadas em um único bloco
+                contíguo (gera cópia). O valor padrão é `False`.
+
+        Exceções:
+            ImportError: Se o pacote `polars` não estiver instalado.
+
+        Retorno:
+            polars.DataFrame: Um DataFrame Polars contendo os resultados da consulta.
+
+        Exemplo:
+            ```python
+            cursor = CursorParquet(...)
+            with Athena(cursor) as athena:
+                athena.execute("SELECT id, name FROM users")
+                df = athena.to_polars()
+            ```
+        """
+
+        try:
+            import polars as pl
+        except ImportError as error:
+            raise ImportError(
+                'Package polars is not installed, use: pip install polars'
+            ) from error
+
+        if isinstance(self.cursor, CursorBaseParquet):
+            tbl = self.to_arrow()
+        else:
+            tbl = self.to_arrow_reader().read_all()
+
+        return pl.from_arrow(tbl, rechunk=rechunk)
+
+    def to_duckdb(
+        self, con: duckdb.DuckDBPyConnection = None
+    ) -> duckdb.DuckDBPyRelation:
+        """
+        Retorna uma relação DuckDB sobre os arquivos Parquet gerados pelo UNLOAD da consulta.
+
+        Nenhum dado é lido no momento da chamada. Filtros, projeções, agregações e junções com
+        tabelas locais aplicados na relação são executados pelo DuckDB, que lê do S3 somente as
+        colunas e os row groups necessários.
+
+        Se `con` não for informada, uma conexão em memória é criada com o `ResourceProfile` do cursor
+        e permanece aberta enquanto a relação existir. Se informada, a conexão recebe a extensão
+        `httpfs` e as credenciais do S3, e não é fechada pelo método.
+
+        Args:
+            con (duckdb.DuckDBPyConnection, opcional): Conexão DuckDB onde a relação será criada,
+                útil para juntar os resultados com tabelas locais. O valor padrão é `None`.
+
+        Exceções:
+            ProgrammingError: Se o cursor não for uma instância de `CursorParquetDuckdb`.
+            DatabaseError: Se a consulta não gerar arquivos.
+
+        Retorno:
+            duckdb.DuckDBPyRelation: Relação DuckDB sobre os resultados da consulta.
+
+        Exemplo:
+            ```python
+            cursor = CursorParquetDuckdb(...)
+            con = duckdb.connect('db.duckdb')
+
+            with Athena(cursor) as athena:
+                athena.execute("SELECT * FROM sales_data")
+                vendas = athena.to_duckdb(con)
+                con.sql(
+                    "SELECT c.regiao, sum(v.valor) "
+                    "FROM vendas v JOIN clientes c USING (id_cliente) GROUP BY ALL"
+                ).show()
+            ```
+        """
+
+        if not isinstance(self.cursor, CursorParquetDuckdb):
+            raise ProgrammingError('Function not implemented for cursor !')
+
+        return self.cursor.to_duckdb(self.query, self.result_reuse_enable, con)
+
     def to_parquet(self, *args, **kwargs) -> None:
         """
         Converte os resultados da consulta para o formato Parquet.
@@ -509,6 +727,91 @@ class Athena(CursorIterator):
 
         self.cursor.to_csv(*args, **kwargs)
 
+    def __write_ipc(
+        self,
+        new_writer,
+        sink: str | Path | pa.NativeFile,
+        compression: Literal['lz4', 'zstd'] | None,
+        batch_size: int,
+    ) -> None:
+        if isinstance(sink, Path):
+            sink = str(sink)
+
+        reader = self.to_arrow_reader(batch_size)
+        options = ipc.IpcWriteOptions(compression=compression)
+
+        with new_writer(sink, reader.schema, options=options) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+
+    def to_ipc(
+        self,
+        path_or_sink: str | Path | pa.NativeFile,
+        compression: Literal['lz4', 'zstd'] | None = None,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        """
+        Converte os resultados da consulta para um arquivo Arrow IPC (formato Feather V2).
+
+        Os lotes de `to_arrow_reader` são gravados um a um, sem materializar o resultado
+        completo. Sem compressão, o arquivo gerado pode ser mapeado em memória por outros
+        processos (`pa.memory_map` + `pa.ipc.open_file`) sem nenhuma desserialização.
+
+        Args:
+            path_or_sink (str | Path | pa.NativeFile): Caminho do arquivo ou sink de saída.
+            compression (Literal['lz4', 'zstd'] | None, opcional): Compressão dos buffers. O valor
+                padrão é `None`, necessário para a leitura sem cópia via memory-map.
+            batch_size (int, opcional): Número máximo de linhas por lote. O valor padrão é `BATCH_SIZE`.
+
+        Retorno:
+            None: Este método não retorna valor, mas grava os dados no formato Arrow IPC.
+
+        Exemplo:
+            ```python
+            cursor = CursorParquetDuckdb(...)
+            with Athena(cursor) as athena:
+                athena.execute("SELECT id, name FROM users")
+                athena.to_ipc('/path/to/file.arrow')
+
+            with pa.memory_map('/path/to/file.arrow') as source:
+                tbl = pa.ipc.open_file(source).read_all()
+            ```
+        """
+
+        self.__write_ipc(ipc.new_file, path_or_sink, compression, batch_size)
+
+    def to_ipc_stream(
+        self,
+        path_or_sink: str | Path | pa.NativeFile,
+        compression: Literal['lz4', 'zstd'] | None = None,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        """
+        Converte os resultados da consulta para um stream Arrow IPC.
+
+        Variante em streaming de `to_ipc`: os lotes são gravados sequencialmente, permitindo
+        enviar os resultados por pipes, sockets ou qualquer `pa.NativeFile` para outro processo,
+        que os lê com `pa.ipc.open_stream`.
+
+        Args:
+            path_or_sink (str | Path | pa.NativeFile): Caminho do arquivo ou sink de saída.
+            compression (Literal['lz4', 'zstd'] | None, opcional): Compressão dos buffers. O valor padrão é `None`.
+            batch_size (int, opcional): Número máximo de linhas por lote. O valor padrão é `BATCH_SIZE`.
+
+        Retorno:
+            None: Este método não retorna valor, mas grava os dados no formato de stream Arrow IPC.
+
+        Exemplo:
+            ```python
+            cursor = CursorParquet(...)
+            with Athena(cursor) as athena:
+                athena.execute("SELECT id, name FROM users")
+                athena.to_ipc_stream('/path/to/file.arrows', compression='lz4')
+            ```
+        """
+
+        self.__write_ipc(ipc.new_stream, path_or_sink, compression, batch_size)
+
     def to_create_table_db(
         self, table_name: str, *, database: str = 'db.duckdb'
     ) -> None:
@@ -556,22 +859,25 @@ class Athena(CursorIterator):
 
         Este método executa uma consulta no Athena para gerar arquivos Parquet que são armazenados no S3.
         Após a consulta, os arquivos Parquet são lidos e os dados são inseridos na tabela especificada no DuckDB.
-        A inserção dos dados é paralelizada utilizando múltiplos trabalhadores (threads) para otimizar o desempenho.
+        A leitura dos arquivos é paralelizada utilizando múltiplos trabalhadores (threads), e a escrita
+        é feita por um único escritor em lotes grandes, evitando a disputa pela tabela destino.
 
         O método realiza os seguintes passos:
         - Executa a consulta fornecida no Athena para gerar os arquivos Parquet.
-        - Descarrega os arquivos Parquet do S3 a partir do manifest gerado pela consulta.
-        - Para cada arquivo Parquet, insere os dados na tabela especificada no DuckDB, utilizando
-        `ThreadPoolExecutor` para paralelizar as inserções.
+        - Lê e decodifica os arquivos Parquet do manifest em paralelo, com no máximo `workers * 2`
+        arquivos em memória. Cada arquivo é lido novamente em caso de falha (`LOAD_RETRIES`).
+        - Insere os dados na tabela em lotes de `LOAD_BATCH_ROWS` linhas, registrando nos logs
+        o progresso de arquivos, linhas e MB/s.
+        - A carga é feita em uma transação, em caso de erro a tabela anterior é mantida.
 
         Args:
             table_name (str): O nome da tabela onde os dados serão inseridos no DuckDB.
             database (str, opcional): O nome do banco de dados DuckDB. O valor padrão é 'db.duckdb'.
-            workers (int, opcional): O número de trabalhadores (threads) a serem usados para paralelizar a inserção dos arquivos Parquet. O valor padrão é `WORKERS`.
+            workers (int, opcional): O número de trabalhadores (threads) a serem usados para paralelizar a leitura dos arquivos Parquet. O valor padrão é `WORKERS`.
 
         Exceções:
             ProgrammingError: Se o cursor não for do tipo `CursorParquetDuckdb`.
-            Exception: Se ocorrer um erro durante a execução da inserção dos dados.
+            DatabaseError: Se um arquivo não puder ser lido após todas as tentativas.
 
         Retorno:
             None: O método não retorna valor, mas insere os dados na tabela do banco de dados DuckDB.
@@ -638,6 +944,71 @@ class Athena(CursorIterator):
             database, self.query, self.result_reuse_enable, table_name=table_name
         )
 
+    def sync_to_duckdb(
+        self,
+        table_name: str,
+        *,
+        key: str | list[str],
+        watermark: str,
+        database: str = 'db.duckdb',
+    ) -> int:
+        """
+        Sincroniza de forma incremental os resultados da consulta executada com uma tabela no DuckDB.
+
+        Na primeira execução a tabela é criada com todos os resultados da consulta. Nas execuções
+        seguintes somente as linhas com a coluna `watermark` maior que o último valor sincronizado
+        são buscadas no Athena (via UNLOAD), e então mescladas na tabela pela chave `key`: as linhas
+        existentes com a mesma chave são substituídas e as novas são inseridas.
+
+        O último valor de `watermark` de cada tabela é mantido no próprio arquivo do DuckDB, na
+        tabela `__athena_sync_state`. Se a tabela destino for removida, a carga é refeita por completo.
+
+        O método realiza os seguintes passos:
+        - Lê a marca d'água salva para a tabela no banco DuckDB.
+        - Executa a consulta no Athena filtrada por `watermark > último valor`.
+        - Mantém somente a versão mais recente de cada chave nos dados novos.
+        - Em uma transação, remove as linhas com as mesmas chaves, insere os dados novos e atualiza
+        a marca d'água.
+
+        Args:
+            table_name (str): O nome da tabela de destino no DuckDB.
+            key (str | list[str]): Coluna ou colunas que identificam unicamente uma linha.
+            watermark (str): Coluna crescente usada para identificar as linhas novas ou alteradas,
+                geralmente a data de atualização do registro.
+            database (str, opcional): O caminho do banco de dados DuckDB. O valor padrão é `'db.duckdb'`.
+
+        Exceções:
+            ProgrammingError: Se o cursor não for uma instância de `CursorParquetDuckdb`.
+
+        Retorno:
+            int: O número de linhas sincronizadas.
+
+        Exemplo:
+            ```python
+            cursor = CursorParquetDuckdb(...)
+            with Athena(cursor) as athena:
+                athena.execute("SELECT id, valor, atualizado_em FROM vendas")
+                athena.sync_to_duckdb(
+                    'vendas',
+                    key='id',
+                    watermark='atualizado_em',
+                    database='replica.duckdb'
+                )
+            ```
+        """
+
+        if not isinstance(self.cursor, CursorParquetDuckdb):
+            raise ProgrammingError('Function not implemented for cursor !')
+
+        return self.cursor.sync_to_duckdb(
+            database,
+            self.query,
+            key,
+            watermark,
+            self.result_reuse_enable,
+            table_name=table_name,
+        )
+
     def write_dataframe(
         self,
         df: pd.DataFrame,
@@ -647,7 +1018,8 @@ class Athena(CursorIterator):
         partitions: list[str] = None,
         catalog_name: str = 'awsdatacatalog',
         compression: Literal['GZIP', 'SNAPPY', 'ZSTD'] = 'ZSTD',
-        is_uuid_complete_path: bool = False
+        is_uuid_complete_path: bool = False,
+        if_exists: Literal['replace', 'append'] = 'replace',
     ) -> None:
         """
         Escreve um DataFrame pandas em uma tabela externa no Athena usando o DuckDB.
@@ -665,9 +1037,13 @@ class Athena(CursorIterator):
             catalog_name (str, optional): O nome do catálogo de dados a ser utilizado. O valor padrão é `'awsdatacatalog'`.
             compression (Literal['ZSTD', 'SNAPPY', 'GZIP'], optional): O algoritmo de compressão a ser utilizado nos dados. O valor padrão é `'ZSTD'`.
             is_uuid_complete_path (bool, optional): Indica se o caminho do bucket deve ser concatenado com um UUID, para evitar conflitos de nomes. O valor padrão é `False`.
+            if_exists (Literal['replace', 'append'], optional): Define se a tabela existente deve ser substituída (`'replace'`)
+                ou receber os novos arquivos no seu local (`'append'`), registrando somente as partições gravadas. No append as
+                colunas e partições devem ser as mesmas da tabela. O valor padrão é `'replace'`.
 
         Exceções:
             ProgrammingError: Se a função for chamada com um cursor incompatível.
+            ProgrammingError: Se, no append, as colunas ou partições forem diferentes das da tabela existente.
 
         Detalhes:
             - O DataFrame pandas fornecido será convertido e escrito como uma tabela externa no Athena.
@@ -711,19 +1087,29 @@ class Athena(CursorIterator):
             raise ProgrammingError('Function not implemented for cursor !')
 
         self.cursor.write_dataframe(
-            df, table_name, schema, location, partitions, catalog_name, compression, is_uuid_complete_path
+            df,
+            table_name,
+            schema,
+            location,
+            partitions,
+            catalog_name,
+            compression,
+            is_uuid_complete_path,
+            if_exists,
         )
 
     def write_arrow(
         self,
-        tbl: pa.Table,
+        tbl: pa.Table | DataStream,
         table_name: str,
         schema: str,
         location: str = None,
         partitions: list[str] = None,
         catalog_name: str = 'awsdatacatalog',
         compression: Literal['GZIP', 'SNAPPY', 'ZSTD'] = 'ZSTD',
-        is_uuid_complete_path: bool = False
+        is_uuid_complete_path: bool = False,
+        engine: Literal['duckdb', 'pyarrow'] = 'duckdb',
+        if_exists: Literal['replace', 'append'] = 'replace',
     ) -> None:
         """
         Escreve um Table Arrow em uma tabela externa no Athena usando o DuckDB.
@@ -733,7 +1119,9 @@ class Athena(CursorIterator):
         compatível, um erro será lançado.
 
         Args:
-            tbl (pa.Table): O Table Arrow que será escrito na tabela externa no Athena.
+            tbl (pa.Table | DataStream): O Table Arrow que será escrito na tabela externa no Athena. Também aceita
+                um `pa.RecordBatchReader`, uma relação DuckDB ou um iterável de `pa.RecordBatch`, `pa.Table`
+                ou `pd.DataFrame`, gravados em fluxo sem carregar todos os dados em memória.
             table_name (str): O nome da tabela externa de destino no Athena.
             schema (str): O esquema onde a tabela será criada ou atualizada no Athena.
             location (str, optional): O local onde os dados serão armazenados (geralmente um bucket S3), se aplicável.
@@ -741,9 +1129,16 @@ class Athena(CursorIterator):
             catalog_name (str, optional): O nome do catálogo de dados a ser utilizado. O valor padrão é `'awsdatacatalog'`.
             compression (Literal['ZSTD', 'SNAPPY', 'GZIP'], optional): O algoritmo de compressão a ser utilizado nos dados. O valor padrão é `'ZSTD'`.
             is_uuid_complete_path (bool, optional): Indica se o caminho do bucket deve ser concatenado com um UUID, para evitar conflitos de nomes. O valor padrão é `False`.
+            engine (Literal['duckdb', 'pyarrow'], optional): Motor de escrita dos arquivos. Com `'pyarrow'` os dados são gravados
+                com `pyarrow.dataset.write_dataset`, sem passar pelo DuckDB, e os tipos são mapeados diretamente do schema Arrow.
+                `max_rows_per_file` e `max_open_files` de `WriteOptions` são aplicados. O valor padrão é `'duckdb'`.
+            if_exists (Literal['replace', 'append'], optional): Define se a tabela existente deve ser substituída (`'replace'`)
+                ou receber os novos arquivos no seu local (`'append'`), registrando somente as partições gravadas. No append as
+                colunas e partições devem ser as mesmas da tabela. O valor padrão é `'replace'`.
 
         Exceções:
             ProgrammingError: Se a função for chamada com um cursor incompatível.
+            ProgrammingError: Se, no append, as colunas ou partições forem diferentes das da tabela existente.
 
         Detalhes:
             - O Table Arrow fornecido será convertido e escrito como uma tabela externa no Athena.
@@ -787,7 +1182,16 @@ class Athena(CursorIterator):
             raise ProgrammingError('Function not implemented for cursor !')
 
         self.cursor.write_arrow(
-            tbl, table_name, schema, location, partitions, catalog_name, compression, is_uuid_complete_path
+            tbl,
+            table_name,
+            schema,
+            location,
+            partitions,
+            catalog_name,
+            compression,
+            is_uuid_complete_path,
+            engine=engine,
+            if_exists=if_exists,
         )
 
     def write_parquet(
@@ -799,7 +1203,8 @@ class Athena(CursorIterator):
         partitions: list[str] = None,
         catalog_name: str = 'awsdatacatalog',
         compression: Literal['GZIP', 'SNAPPY', 'ZSTD'] = 'ZSTD',
-        is_uuid_complete_path: bool = False
+        is_uuid_complete_path: bool = False,
+        if_exists: Literal['replace', 'append'] = 'replace',
     ) -> None:
         """
         Cria uma tabela externa no Athena a partir de um ou vários arquivos Parquet.
@@ -818,12 +1223,18 @@ class Athena(CursorIterator):
             catalog_name (str, optional): O nome do catálogo de dados a ser utilizado. O valor padrão é `'awsdatacatalog'`.
             compression (Literal['ZSTD', 'SNAPPY', 'GZIP'], optional): O algoritmo de compressão a ser utilizado nos dados. O valor padrão é `'ZSTD'`.
             is_uuid_complete_path (bool, optional): Indica se o caminho do bucket deve ser concatenado com um UUID, para evitar conflitos de nomes. O valor padrão é `False`.
+            if_exists (Literal['replace', 'append'], optional): Define se a tabela existente deve ser substituída (`'replace'`)
+                ou receber os novos arquivos no seu local (`'append'`), registrando somente as partições gravadas. No append as
+                colunas e partições devem ser as mesmas da tabela. O valor padrão é `'replace'`.
 
         Exceções:
             ProgrammingError: Se a função for chamada com um cursor incompatível.
+            ProgrammingError: Se, no append, as colunas ou partições forem diferentes das da tabela existente.
 
         Detalhes:
             - O(s) arquivo(s) Parquet fornecido(s) serão usados para criar uma tabela externa no Athena.
+            - Arquivos locais sem particionamento, com o mesmo schema, tipos aceitos pelo Athena e já comprimidos com o codec
+              `compression` são enviados ao S3 sem reescrita, em paralelo. Somente o rodapé dos arquivos é lido na verificação.
             - A opção de particionamento permite distribuir os dados em várias pastas ou arquivos no S3, facilitando o gerenciamento de grandes volumes de dados.
             - A compressão `ZSTD` pode ser usada para reduzir o tamanho dos arquivos Parquet gerados, com outras opções como `SNAPPY` também sendo suportadas.
             - O catálogo de dados `awsdatacatalog` pode ser alterado para refletir configurações específicas do ambiente de execução.
@@ -861,21 +1272,30 @@ class Athena(CursorIterator):
             raise ProgrammingError('Function not implemented for cursor !')
 
         self.cursor.write_parquet(
-            file, table_name, schema, location, partitions, catalog_name, compression, is_uuid_complete_path
+            file,
+            table_name,
+            schema,
+            location,
+            partitions,
+            catalog_name,
+            compression,
+            is_uuid_complete_path,
+            if_exists,
         )
 
     def write_table_iceberg(
         self,
-        data: pd.DataFrame | list[str | Path] | str | Path | pa.Table,
+        data: pd.DataFrame | list[str | Path] | str | Path | pa.Table | DataStream,
         table_name: str,
         schema: str,
         location: str = None,
         partitions: list[str] = None,
         catalog_name: str = 'awsdatacatalog',
         compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
-        if_exists: Literal['replace', 'append'] = 'replace',
+        if_exists: Literal['replace', 'append', 'overwrite_partitions'] = 'replace',
         sync_schema: bool = False,
-        is_uuid_complete_path: bool = False
+        is_uuid_complete_path: bool = False,
+        max_concurrent_inserts: int = None,
     ) -> None:
         """
         Cria ou insere dados em uma tabela Iceberg no Athena a partir de um DataFrame pandas, Table Arrow ou arquivos Parquet.
@@ -885,7 +1305,8 @@ class Athena(CursorIterator):
         A operação pode substituir a tabela existente ou adicionar novos dados, dependendo do valor de `if_exists`.
 
         Args:
-            data (pd.DataFrame | list[str | Path] | str | Path | pa.Table): Dados a serem inseridos ou criados na tabela Iceberg.
+            data (pd.DataFrame | list[str | Path] | str | Path | pa.Table | DataStream): Dados a serem inseridos ou criados na tabela Iceberg.
+                Fontes em fluxo (`pa.RecordBatchReader`, relação DuckDB ou iterável de lotes) são gravadas sem carregar todos os dados em memória.
                 Pode ser um DataFrame pandas, Table Arrow ou um ou mais arquivos Parquet (caminhos em formato string ou Path).
             table_name (str): O nome da tabela Iceberg a ser criada ou inserida no Athena.
             schema (str): O esquema onde a tabela Iceberg será criada ou atualizada no Athena.
@@ -893,14 +1314,24 @@ class Athena(CursorIterator):
             partitions (list[str], optional): Lista de colunas para particionamento dos dados na tabela.
             catalog_name (str, optional): O nome do catálogo de dados a ser utilizado. O valor padrão é `'awsdatacatalog'`.
             compression (Literal['ZSTD', 'SNAPPY', 'GZIP'], optional): O algoritmo de compressão a ser utilizado nos dados. O valor padrão é `'ZSTD'`.
-            if_exists (Literal['replace', 'append'], optional): Define se os dados devem substituir a tabela existente
-                (`'replace'`) ou ser adicionados (`'append'`). O valor padrão é `'replace'`.
+            if_exists (Literal['replace', 'append', 'overwrite_partitions'], optional): Define se os dados devem substituir a tabela existente
+                (`'replace'`), ser adicionados (`'append'`) ou substituir somente as partições presentes nos dados novos
+                (`'overwrite_partitions'`, exige `partitions` apenas com colunas de identidade ou year/month/day/hour).
+                O valor padrão é `'replace'`.
             sync_schema (bool, optional): Indica se o esquema da tabela de destino deve ser sincronizado com os dados de origem. O valor padrão é `False`.
             is_uuid_complete_path (bool, optional): Indica se o caminho do bucket deve ser concatenado com um UUID, para evitar conflitos de nomes. O valor padrão é `False`.
+            max_concurrent_inserts (int, optional): Divide o INSERT na tabela Iceberg por valores das partições (colunas ou
+                transformações `year`, `month`, `day` e `hour` de `partitions`), com no máximo 100 partições por INSERT,
+                executando até `max_concurrent_inserts` INSERTs em paralelo. Cada parte é repetida individualmente em caso
+                de falha e o tempo de cada uma é registrado nos logs. Não aceita partições `bucket` ou `truncate`.
+                O valor padrão é `None` (um único INSERT).
 
 
         Exceções:
             ProgrammingError: Se a função for chamada com um cursor incompatível.
+            ProgrammingError: Se `if_exists='overwrite_partitions'` for usado sem `partitions` ou com bucket/truncate.
+            ProgrammingError: Se `max_concurrent_inserts` for usado com partições bucket/truncate.
+            DatabaseError: Se alguma parte do INSERT falhar após todas as tentativas (`max_concurrent_inserts`).
 
         Detalhes:
             - A tabela Iceberg será criada ou atualizada no Athena com os dados fornecidos.
@@ -955,13 +1386,19 @@ class Athena(CursorIterator):
             compression,
             if_exists,
             sync_schema,
-            is_uuid_complete_path
+            is_uuid_complete_path,
+            max_concurrent_inserts,
         )
 
     def merge_table_iceberg(
         self,
         target_table: str,
-        source_data: pd.DataFrame | list[str | Path] | str | Path | pa.Table,
+        source_data: pd.DataFrame
+        | list[str | Path]
+        | str
+        | Path
+        | pa.Table
+        | DataStream,
         schema: str,
         predicate: str,
         delete_condition: str = None,
@@ -971,6 +1408,10 @@ class Athena(CursorIterator):
         sync_schema: bool = False,
         location: str = None,
         catalog_name: str = 'awsdatacatalog',
+        prune_by: list[str] = None,
+        prune_mode: Literal['range', 'values'] = 'range',
+        dedupe_by: list[str] = None,
+        order_by: list[str] = None,
     ) -> None:
         """
         Executa um merge (UPSERT) em uma tabela Iceberg no Athena, utilizando uma tabela temporária criada no Athena.
@@ -982,7 +1423,8 @@ class Athena(CursorIterator):
 
         Args:
             target_table (str): O nome da tabela de destino do tipo Iceberg no Athena, onde os dados serão mesclados.
-            source_data (pd.DataFrame | list[str | Path] | str | Path | pa.Table): Dados de origem a serem mesclados com a tabela de destino.
+            source_data (pd.DataFrame | list[str | Path] | str | Path | pa.Table | DataStream): Dados de origem a serem mesclados com a tabela de destino.
+                Fontes em fluxo (`pa.RecordBatchReader`, relação DuckDB ou iterável de lotes) são gravadas sem carregar todos os dados em memória.
                 Pode ser um DataFrame pandas, Table Arrow ou um ou mais arquivos Parquet (caminhos em formato string ou Path).
             schema (str): O esquema onde a tabela Iceberg será manipulada no Athena.
             predicate (str): A condição de junção (predicate) que define a lógica de correspondência entre os dados de origem
@@ -995,9 +1437,22 @@ class Athena(CursorIterator):
             sync_schema (bool, optional): Indica se o esquema da tabela de destino deve ser sincronizado com os dados de origem. O valor padrão é `False`.
             location (str, optional): O local no S3 onde os dados serão armazenados, se aplicável.
             catalog_name (str, optional): O nome do catálogo de dados a ser utilizado. O valor padrão é `'awsdatacatalog'`.
+            prune_by (list[str], optional): Colunas (geralmente de partição) cujos limites são calculados localmente
+                a partir de `source_data` e adicionados à condição `ON` sobre a tabela destino, para que o Athena leia somente
+                os arquivos das partições afetadas. As linhas da tabela destino que devem ser encontradas pelo MERGE precisam
+                estar dentro desses limites. Não suportado para fontes em fluxo. O valor padrão é `None`.
+            prune_mode (Literal['range', 'values'], optional): `'range'` adiciona `BETWEEN min AND max` e `'values'` adiciona
+                `IN (...)` com os valores distintos (até 1.000 valores, acima disso usa o intervalo). O valor padrão é `'range'`.
+            dedupe_by (list[str], optional): Colunas chave usadas para deduplicar `source_data` localmente com o DuckDB
+                antes do upload, mantendo uma única linha por chave. Todas as colunas devem aparecer em `predicate` com o
+                alias da origem, senão várias linhas da origem podem corresponder à mesma linha destino. O valor padrão é `None`.
+            order_by (list[str], optional): Colunas que definem a linha mais recente de cada chave (ordem decrescente,
+                nulos por último) quando `dedupe_by` é informado. Se omitido, é mantida uma linha qualquer da chave.
+                O valor padrão é `None`.
 
         Exceções:
             ProgrammingError: Se a função for chamada com um cursor incompatível.
+            ProgrammingError: Se alguma coluna de `dedupe_by` não for usada em `predicate`.
 
         Detalhes:
             - O método cria uma **tabela temporária** no Athena com os dados fornecidos (DataFrame pandas, Table Arrow ou arquivos Parquet)
@@ -1053,6 +1508,10 @@ class Athena(CursorIterator):
             sync_schema,
             location,
             catalog_name,
+            prune_by,
+            prune_mode,
+            dedupe_by,
+            order_by,
         )
 
     def to_pandas(self, *args, **kwargs) -> pd.DataFrame:
@@ -1121,6 +1580,7 @@ class Athena(CursorIterator):
         self.cursor.get_query_execution = None
         if self.row_cursor:
             self.row_cursor = None
+        self.__fetch_started = False
 
     def __enter__(self):
         return self
@@ -1,16 +1,22 @@
 from __future__ import annotations
 import binascii
+import os
 import json
 from datetime import date, datetime, time
 from decimal import Decimal
 from typing import Any
 import pandas as pd
-from duckdb import DuckDBPyConnection
+from duckdb import DuckDBPyConnection, DuckDBPyRelation
 from typing import cast
 from pyarrow import Schema, DataType
+from pyarrow.fs import FileSystem
 import pyarrow as pa
+import pyarrow.parquet as pq
 import re
-from functools import reduce
+from functools import reduce, lru_cache
+from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from athena_mvsh.error import ProgrammingError
 
 
 def partition_func_iceberg(columns: list[str]) -> list[str]:
@@ -45,6 +51,22 @@ def partition_func_iceberg(columns: list[str]) -> list[str]:
     return rst
 
 
+def partition_slice_iceberg(columns: list[str]) -> list[str]:
+    """Expressoes SQL do Athena que identificam as particoes Iceberg de cada linha.
+
+    Transformacoes de tempo viram `date_trunc`, `bucket` e `truncate` sao ignoradas.
+    """
+
+    rst = []
+    for column in partition_func_iceberg(columns):
+        if match := re.match(r'(year|month|day|hour)\(`(.+)`\)$', column, re.I):
+            rst.append(f'date_trunc(\'{match.group(1).lower()}\', "{match.group(2)}")')
+        elif match := re.match(r'`(.+)`$', column):
+            rst.append(f'"{match.group(1)}"')
+
+    return rst
+
+
 def to_column_info_arrow(schema: Schema) -> tuple[dict]:
     columns = []
     for field in schema:
@@ -107,9 +129,138 @@ def get_athena_type(type_: DataType) -> tuple[str, int, int]:
         return 'string', 2147483647, 0
 
 
-def convert_df_athena(col: pd.Series) -> str:
-    col_type = pd.api.types.infer_dtype(col, skipna=True)
+def is_athena_compatible(type_: DataType) -> bool:
+    """Verifica se o tipo Parquet/Arrow pode ser lido pelo Athena sem conversao."""
+
+    if (
+        pa.types.is_unsigned_integer(type_)
+        or pa.types.is_float16(type_)
+        or pa.types.is_time(type_)
+        or pa.types.is_duration(type_)
+        or pa.types.is_null(type_)
+    ):
+        return False
+
+    if pa.types.is_timestamp(type_):
+        return type_.unit != 'ns'
+
+    if pa.types.is_dictionary(type_):
+        return is_athena_compatible(type_.value_type)
+
+    if pa.types.is_map(type_):
+        return is_athena_compatible(type_.key_type) and is_athena_compatible(
+            type_.item_type
+        )
+
+    if pa.types.is_list(type_) or pa.types.is_large_list(type_):
+        return is_athena_compatible(type_.value_type)
+
+    if pa.types.is_struct(type_):
+        return all(
+            is_athena_compatible(type_.field(i).type) for i in range(type_.num_fields)
+        )
+
+    return True
+
+
+MAP_ATHENA_DDL = {
+    'boolean': 'BOOLEAN',
+    'tinyint': 'TINYINT',
+    'smallint': 'SMALLINT',
+    'integer': 'INT',
+    'bigint': 'BIGINT',
+    'float': 'FLOAT',
+    'double': 'DOUBLE',
+    'varchar': 'STRING',
+    'varbinary': 'BINARY',
+    'date': 'DATE',
+    'timestamp': 'TIMESTAMP',
+}
+
+
+def normalize_type_ddl(tipo: str) -> str:
+    """Tipo do DDL em uma forma comparavel com os tipos do catalogo (Glue)."""
+
+    tipo = re.sub(r'\s+', '', tipo).lower()
+
+    # NOTE: Sinonimos do Athena guardados com outro nome no catalogo
+    return re.sub(
+        r'\b(integer|varchar)\b(?!\()',
+        lambda m: {'integer': 'int', 'varchar': 'string'}[m.group(1)],
+        tipo,
+    )
+
+
+def to_athena_type_ddl(type_: DataType) -> str:
+    """Tipo da coluna no DDL do Athena a partir do tipo Arrow, inclusive tipos aninhados."""
+
+    name, precision, scale = get_athena_type(type_)
+
+    if name == 'decimal':
+        return f'DECIMAL({precision},{scale})'
+
+    if name == 'array':
+        return f'ARRAY<{to_athena_type_ddl(type_.value_type)}>'
 
+    if name == 'map':
+        return f'MAP<{to_athena_type_ddl(type_.key_type)},{to_athena_type_ddl(type_.item_type)}>'
+
+    if name == 'row':
+        fields = ','.join(
+            f'{field.name}:{to_athena_type_ddl(field.type)}' for field in type_
+        )
+        return f'STRUCT<{fields}>'
+
+    return MAP_ATHENA_DDL.get(name, 'STRING')
+
+
+def to_athena_arrow_type(type_: DataType) -> DataType:
+    """Converte o tipo Arrow para um tipo equivalente que o Athena consegue ler no Parquet."""
+
+    if pa.types.is_unsigned_integer(type_):
+        return {8: pa.int16(), 16: pa.int32()}.get(type_.bit_width, pa.int64())
+
+    if pa.types.is_float16(type_):
+        return pa.float32()
+
+    if pa.types.is_timestamp(type_) and type_.unit == 'ns':
+        return pa.timestamp('us', tz=type_.tz)
+
+    if pa.types.is_duration(type_):
+        return pa.int64()
+
+    if pa.types.is_time(type_) or pa.types.is_null(type_):
+        return pa.string()
+
+    if pa.types.is_dictionary(type_):
+        return to_athena_arrow_type(type_.value_type)
+
+    if pa.types.is_list(type_):
+        return pa.list_(to_athena_arrow_type(type_.value_type))
+
+    if pa.types.is_large_list(type_):
+        return pa.large_list(to_athena_arrow_type(type_.value_type))
+
+    if pa.types.is_map(type_):
+        return pa.map_(
+            to_athena_arrow_type(type_.key_type), to_athena_arrow_type(type_.item_type)
+        )
+
+    if pa.types.is_struct(type_):
+        return pa.struct(
+            [field.with_type(to_athena_arrow_type(field.type)) for field in type_]
+        )
+
+    return type_
+
+
+def to_athena_arrow_schema(schema: Schema) -> Schema:
+    return pa.schema(
+        [field.with_type(to_athena_arrow_type(field.type)) for field in schema]
+    )
+
+
+def athena_type_df(col_type: str, dtype) -> str:
     if col_type == 'datetime64' or col_type == 'datetime':
         return 'TIMESTAMP'
 
@@ -121,14 +272,14 @@ def convert_df_athena(col: pd.Series) -> str:
 
     elif col_type == 'floating':
         dtype_float = ['float16', 'float32']
-        if col.dtype in dtype_float:
+        if dtype in dtype_float:
             return 'FLOAT'
         else:
             return 'DOUBLE'
 
     elif col_type == 'integer':
         dtype_ints = ['int8', 'int16', 'int32', 'uint8', 'uint16', 'uint32']
-        if col.dtype in dtype_ints:
+        if dtype in dtype_ints:
             return 'INT'
         else:
             return 'BIGINT'
@@ -148,6 +299,44 @@ def convert_df_athena(col: pd.Series) -> str:
     return 'STRING'
 
 
+SAMPLE_DF_ROWS = 1_000
+
+
+@lru_cache(maxsize=None)
+def convert_dtype_athena(dtype) -> str | None:
+    """Tipo Athena decidido somente pelo dtype, `None` quando depende dos valores (object)."""
+
+    if pd.api.types.is_object_dtype(dtype):
+        return None
+
+    # NOTE: Para dtypes tipados o infer_dtype depende apenas do dtype
+    col_type = pd.api.types.infer_dtype(pd.Series([], dtype=dtype), skipna=True)
+
+    return athena_type_df(col_type, dtype)
+
+
+def sample_df_column(col: pd.Series, size: int = SAMPLE_DF_ROWS) -> pd.Series:
+    if len(col) <= size:
+        return col.dropna()
+
+    # NOTE: Amostra espacada ao longo da coluna, como a analise do duckdb
+    values = col.iloc[:: -(-len(col) // size)].dropna()
+
+    if values.empty:
+        values = col.dropna().iloc[:size]
+
+    return values
+
+
+def convert_df_athena(col: pd.Series) -> str:
+    if col_type := convert_dtype_athena(col.dtype):
+        return col_type
+
+    col_type = pd.api.types.infer_dtype(sample_df_column(col), skipna=True)
+
+    return athena_type_df(col_type, col.dtype)
+
+
 def map_convert_df_athena(df: pd.DataFrame):
     return [(c, convert_df_athena(df[c])) for c in df.columns]
 
@@ -186,17 +375,79 @@ def convert_tp_duckdb(col_type: str) -> str:
     return col_type
 
 
-def map_convert_duckdb_athena(con: DuckDBPyConnection, file: list[str] | str):
-    temp_tbl = f"""
-        CREATE OR REPLACE TEMP TABLE validade_type 
-        AS FROM read_parquet({file!r}) LIMIT 1;
+def read_parquet_schema(
+    files: list[str], workers: int = 8, filesystem: FileSystem = None
+) -> Schema:
+    """Le somente o rodape (footer) dos arquivos Parquet, em paralelo, e unifica os schemas.
+
+    Arquivos do S3 (`s3://`) sao lidos com `filesystem`. Arquivos com colunas diferentes
+    ou tipos incompativeis geram `ProgrammingError`.
     """
-    con.sql(temp_tbl)
 
-    stmt = """SELECT column_name, data_type
-      FROM information_schema.columns
-      where table_name = 'validade_type'
-	  ORDER BY ordinal_position;
+    def read_schema(file: str) -> Schema:
+        if filesystem is not None and file.startswith('s3://'):
+            schema = pq.read_schema(file.removeprefix('s3://'), filesystem=filesystem)
+        else:
+            schema = pq.read_schema(file)
+
+        schema = schema.remove_metadata()
+        # NOTE: Categorias do pandas sao gravadas como o tipo dos valores
+        return pa.schema(
+            field.with_type(field.type.value_type)
+            if pa.types.is_dictionary(field.type)
+            else field
+            for field in schema
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        schemas = list(executor.map(read_schema, files))
+
+    unified = schemas[0]
+    for file, schema in zip(files[1:], schemas[1:]):
+        if schema.names != unified.names:
+            raise ProgrammingError(
+                f'Parquet file {file!r} has columns {schema.names}, expected {unified.names} !'
+            )
+
+        try:
+            unified = pa.unify_schemas([unified, schema])
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ProgrammingError(
+                f'Parquet file {file!r} conflicts with {files[0]!r}: {e}'
+            ) from e
+
+    return unified
+
+
+def expand_parquet_files(con: DuckDBPyConnection, file: list[str] | str) -> list[str]:
+    """Arquivos de uma lista de caminhos, com os padroes glob expandidos pelo DuckDB."""
+
+    files = []
+    for path in file if isinstance(file, list) else [file]:
+        if re.search(r'[*?\[]', path):
+            files += [row[0] for row in con.execute('FROM glob(?)', [path]).fetchall()]
+        else:
+            files.append(path)
+
+    return files
+
+
+def map_convert_duckdb_athena(
+    con: DuckDBPyConnection, file: list[str] | str, filesystem: FileSystem = None
+):
+    files = expand_parquet_files(con, file)
+
+    # NOTE: Locais e do S3 (com `filesystem`), o schema e lido somente pelo rodape de cada arquivo
+    if files and all(
+        os.path.isfile(f) or (filesystem is not None and f.startswith('s3://'))
+        for f in files
+    ):
+        data = read_parquet_schema(files, filesystem=filesystem).empty_table()
+        return map_convert_duckdb_athena_pandas_arrow(con, data)
+
+    # NOTE: Demais origens, o DESCRIBE do duckdb le apenas os metadados
+    stmt = f"""FROM (DESCRIBE FROM read_parquet({file!r}))
+    select column_name, column_type
     """
 
     rst = con.sql(stmt).fetchall()
@@ -216,6 +467,67 @@ def map_convert_duckdb_athena_pandas_arrow(
     return [(col, convert_tp_duckdb(tep)) for col, tep in rst]
 
 
+def relation_reader(
+    rel: DuckDBPyRelation, batch_size: int = 1_000_000
+) -> pa.RecordBatchReader:
+    """Leitor de lotes de uma relacao DuckDB, compativel com versoes antigas do DuckDB."""
+
+    # NOTE: fetch_record_batch e obsoleto no duckdb 1.5, substituido por to_arrow_reader
+    if hasattr(rel, 'to_arrow_reader'):
+        return rel.to_arrow_reader(batch_size)
+
+    return rel.fetch_record_batch(batch_size)
+
+
+def to_record_batch_reader(
+    data: pa.RecordBatchReader | DuckDBPyRelation | Iterable,
+    batch_size: int = 1_000_000,
+) -> pa.RecordBatchReader:
+    """Normaliza fontes em fluxo para um `pa.RecordBatchReader`, sem materializar os dados.
+
+    Aceita um `pa.RecordBatchReader`, uma relacao DuckDB ou um iteravel de
+    `pa.RecordBatch`, `pa.Table` ou `pd.DataFrame`. O schema e definido pelo primeiro item.
+    """
+
+    if isinstance(data, pa.RecordBatchReader):
+        return data
+
+    if isinstance(data, DuckDBPyRelation):
+        return relation_reader(data, batch_size)
+
+    items = iter(data)
+    first = next(items, None)
+
+    if first is None:
+        raise ProgrammingError('Iterable of batches is empty !')
+
+    def to_batches(item) -> list[pa.RecordBatch]:
+        if isinstance(item, pd.DataFrame):
+            return [pa.RecordBatch.from_pandas(item, preserve_index=False)]
+        if isinstance(item, pa.Table):
+            return item.to_batches()
+        if isinstance(item, pa.RecordBatch):
+            return [item]
+
+        raise ProgrammingError(
+            f'Type {type(item).__name__} is not supported as a batch !'
+        )
+
+    first_batches = to_batches(first)
+    schema = first_batches[0].schema if first_batches else first.schema
+
+    def batches():
+        yield from first_batches
+        for item in items:
+            for batch in to_batches(item):
+                if batch.schema != schema:
+                    yield from pa.Table.from_batches([batch]).cast(schema).to_batches()
+                else:
+                    yield batch
+
+    return pa.RecordBatchReader.from_batches(schema, batches())
+
+
 def strtobool(val):
     val = val.lower()
     if val in ('y', 'yes', 't', 'true', 'on', '1'):
@@ -306,3 +618,42 @@ MAP_CONVERT = {
     'decimal': _to_decimal,
     'json': _to_json,
 }
+
+
+MAP_CONVERT_ARROW = MAP_CONVERT | {'json': _to_default}
+
+
+MAP_ARROW = {
+    'boolean': pa.bool_(),
+    'tinyint': pa.int8(),
+    'smallint': pa.int16(),
+    'integer': pa.int32(),
+    'bigint': pa.int64(),
+    'float': pa.float32(),
+    'real': pa.float32(),
+    'double': pa.float64(),
+    'char': pa.string(),
+    'varchar': pa.string(),
+    'string': pa.string(),
+    'timestamp': pa.timestamp('us'),
+    'date': pa.date32(),
+    'time': pa.time64('us'),
+    'varbinary': pa.binary(),
+    'array': pa.string(),
+    'map': pa.string(),
+    'row': pa.string(),
+    'json': pa.string(),
+}
+
+
+def to_arrow_schema(column_info: tuple[dict]) -> Schema:
+    fields = []
+    for c in column_info:
+        if c['Type'] == 'decimal':
+            type_ = pa.decimal128(c['Precision'], c['Scale'])
+        else:
+            type_ = MAP_ARROW.get(c['Type'], pa.string())
+
+        fields.append(pa.field(c['Name'], type_, c.get('Nullable') != 'NOT_NULL'))
+
+    return pa.schema(fields)
@@ -1,7 +1,16 @@
 from athena_mvsh.cursores.cursorparquet import CursorParquet
-from athena_mvsh.cursores.cursorparquetduckdb import CursorParquetDuckdb
+from athena_mvsh.cursores.cursorparquetduckdb import (
+    CursorParquetDuckdb,
+    ResourceProfile,
+    WriteOptions,
+)
 from athena_mvsh.cursores.cursorpython import CursorPython
-from athena_mvsh.cursores.cursores import CursorBaseParquet, CursorIterator
+from athena_mvsh.cursores.cursores import (
+    ChunkIterator,
+    CursorBaseParquet,
+    CursorIterator,
+    UnloadOptions,
+)
 
 __all__ = [
     'CursorParquet',
@@ -9,4 +18,8 @@ __all__ = [
     'CursorPython',
     'CursorBaseParquet',
     'CursorIterator',
+    'ChunkIterator',
+    'UnloadOptions',
+    'ResourceProfile',
+    'WriteOptions',
 ]
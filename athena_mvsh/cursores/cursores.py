@@ -2,11 +2,19 @@ from __future__ import annotations
 from athena_mvsh.dbathena import DBAthena
 from abc import ABC, abstractmethod
 import boto3
-from athena_mvsh.utils import parse_output_location
+import pyarrow.fs as fs
+from athena_mvsh.utils import (
+    parse_output_location,
+    estimate_result_rows,
+    query_is_ddl,
+)
 from datetime import datetime, timezone
 import uuid
 import textwrap
 from athena_mvsh.error import ProgrammingError
+from dataclasses import dataclass
+from typing import Literal, Generator
+from collections import deque
 
 
 class CursorIterator(ABC):
@@ -30,9 +38,110 @@ class CursorIterator(ABC):
         return self
 
 
+class ChunkIterator:
+    """Iterador de linhas alimentado por blocos (listas de tuplas).
+
+    O gerador de blocos recebe via `send` a quantidade de linhas desejada,
+    assim `fetchmany(n)` busca o restante em uma unica chamada ao backend.
+    """
+
+    def __init__(self, chunks: Generator[list[tuple], int, None]) -> None:
+        self.__chunks = chunks
+        self.__buffer = deque()
+        self.__started = False
+        self.__done = False
+
+    def __read(self, size: int = None) -> bool:
+        if self.__done:
+            return False
+
+        try:
+            if self.__started:
+                rows = self.__chunks.send(size)
+            else:
+                self.__started = True
+                rows = next(self.__chunks)
+        except StopIteration:
+            self.__done = True
+            return False
+
+        self.__buffer.extend(rows)
+        return True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> tuple:
+        while not self.__buffer:
+            if not self.__read():
+                raise StopIteration
+
+        return self.__buffer.popleft()
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        while len(self.__buffer) < size:
+            if not self.__read(size - len(self.__buffer)):
+                break
+
+        size = min(size, len(self.__buffer))
+        return [self.__buffer.popleft() for __ in range(size)]
+
+    def fetchall(self) -> list[tuple]:
+        while self.__read():
+            ...
+
+        rows = list(self.__buffer)
+        self.__buffer.clear()
+        return rows
+
+
+@dataclass(frozen=True)
+class UnloadOptions:
+    """Opcoes do comando UNLOAD usado pelos cursores Parquet.
+
+    - compression: codec dos arquivos gerados pelo Athena, `SNAPPY` e `LZ4`
+      sao mais rapidos de decodificar localmente, `ZSTD` e `GZIP` geram arquivos menores.
+    - compression_level: nivel de compressao, aceito apenas para `ZSTD` (1 a 22).
+    - partitioned_by: colunas de particionamento no estilo hive, devem ser as
+      ultimas colunas do SELECT.
+    """
+
+    compression: Literal['ZSTD', 'SNAPPY', 'GZIP', 'LZ4'] = 'ZSTD'
+    compression_level: int = None
+    partitioned_by: tuple[str, ...] = None
+
+    def __post_init__(self):
+        if self.compression_level is not None:
+            if self.compression.upper() != 'ZSTD':
+                raise ProgrammingError('compression_level is only supported for ZSTD')
+
+            if not 1 <= self.compression_level <= 22:
+                raise ProgrammingError('compression_level must be between 1 and 22')
+
+        if self.partitioned_by:
+            object.__setattr__(self, 'partitioned_by', tuple(self.partitioned_by))
+
+    def properties(self, format: str = 'PARQUET') -> list[str]:
+        props = [
+            f"format = '{format}'",
+            f"compression = '{self.compression.upper()}'",
+        ]
+
+        if self.compression_level is not None:
+            props.append(f'compression_level = {self.compression_level}')
+
+        if self.partitioned_by:
+            cols = ', '.join(f"'{col}'" for col in self.partitioned_by)
+            props.append(f'partitioned_by = ARRAY[{cols}]')
+
+        return props
+
+
 class CursorBaseParquet(DBAthena):
     FORMAT: str = 'PARQUET'
     COMPRESS: str = 'ZSTD'
+    SMALL_RESULT_ROWS: int = 1_000
+    COMPLEX_TYPES: frozenset[str] = frozenset({'array', 'map', 'row', 'json'})
 
     def __init__(
         self,
@@ -43,6 +152,8 @@ class CursorBaseParquet(DBAthena):
         poll_interval: float = 1,
         result_reuse_enable: bool = False,
         *args,
+        unload_options: UnloadOptions = None,
+        unload_mode: Literal['always', 'auto'] = 'always',
         **kwargs,
     ) -> None:
         super().__init__(
@@ -55,12 +166,52 @@ class CursorBaseParquet(DBAthena):
             *args,
             **kwargs,
         )
+        self.unload_options = unload_options or UnloadOptions(compression=self.COMPRESS)
+        self.unload_mode = unload_mode
+        self.__filesystem = None
+
+    @property
+    def is_partitioned(self) -> bool:
+        return bool(self.unload_options.partitioned_by)
+
+    def is_small_result(self, query: str) -> bool:
+        """No modo `auto`, indica se o resultado estimado e pequeno o suficiente
+        para ser lido pela API paginada, sem o custo do UNLOAD.
+        """
+
+        if self.unload_mode != 'auto' or query_is_ddl(query):
+            return False
+
+        rows = estimate_result_rows(query)
+        return rows is not None and rows <= self.SMALL_RESULT_ROWS
+
+    def execute_paged(
+        self, query: str, result_reuse_enable: bool = False
+    ) -> list[list[tuple]] | None:
+        """Paginas do resultado lidas pela API paginada do Athena.
+
+        Retorna `None` se o resultado tiver colunas complexas (array, map, row ou json),
+        que a API entrega como texto e o UNLOAD como listas e structs.
+        """
+
+        id_exec = self.start_query_execution(query, result_reuse_enable)
+
+        pages = []
+        for rows in self.iter_query_results(id_exec):
+            if any(col.get('Type') in self.COMPLEX_TYPES for col in self.metadata):
+                return None
+            pages.append(rows)
+
+        return pages
 
     def format_unload(self, query):
         local = self.s3_staging_dir
 
         now = datetime.now(timezone.utc).strftime('%Y%m%d')
         location = f'{local}unload/{now}/{str(uuid.uuid4())}/'
+        props = ',\n'.join(
+            f'\t{prop}' for prop in self.unload_options.properties(self.FORMAT)
+        )
         quey = textwrap.dedent(
             f"""
                 UNLOAD (
@@ -68,8 +219,7 @@ class CursorBaseParquet(DBAthena):
                 )
                 TO '{location}'
                 WITH (
-                \tformat = '{self.FORMAT}',
-                \tcompression = '{self.COMPRESS}'
+                {props}
                 )
                 """
         )
@@ -88,14 +238,28 @@ class CursorBaseParquet(DBAthena):
 
         raise ProgrammingError('Data location does not exist')
 
-    def get_bucket_s3(self):
-        cliente_s3 = boto3.client(
+    def get_filesystem_fs(self) -> fs.S3FileSystem:
+        # NOTE: Uma instancia por cursor, as conexoes com o S3 sao reaproveitadas
+        if self.__filesystem is None:
+            self.__filesystem = fs.S3FileSystem(
+                access_key=self.config['aws_access_key_id'],
+                secret_key=self.config['aws_secret_access_key'],
+                region=self.config['region_name'],
+            )
+
+        return self.__filesystem
+
+    def get_client_s3(self):
+        return boto3.client(
             's3',
             aws_access_key_id=self.config['aws_access_key_id'],
             aws_secret_access_key=self.config['aws_secret_access_key'],
             region_name=self.config['region_name'],
         )
 
+    def get_bucket_s3(self):
+        cliente_s3 = self.get_client_s3()
+
         data_manifest_local = self.get_manifest_local()
         bucket, key = parse_output_location(data_manifest_local)
 
@@ -117,7 +281,13 @@ class CursorBaseParquet(DBAthena):
         manifest = bucket_s3['Body'].read().decode('utf-8').strip()
         manifest = manifest.split('\n') if manifest else []
 
-        _unload_location = '/'.join(manifest[0].split('/')[:-1]) + '/'
+        # NOTE: Consulta sem resultado, o manifesto fica vazio
+        if not manifest:
+            return None, None, manifest
+
+        # NOTE: Com particionamento os arquivos ficam em subpastas `coluna=valor`
+        levels = len(self.unload_options.partitioned_by or ()) + 1
+        _unload_location = '/'.join(manifest[0].split('/')[:-levels]) + '/'
         bucket, key = parse_output_location(_unload_location)
 
         return bucket, key, manifest
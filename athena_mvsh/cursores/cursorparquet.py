@@ -1,14 +1,15 @@
 from __future__ import annotations
-from athena_mvsh.cursores.cursores import CursorBaseParquet
-import pyarrow.fs as fs
+from athena_mvsh.cursores.cursores import CursorBaseParquet, UnloadOptions
 import pyarrow as pa
 import pyarrow.parquet as pq
+import pyarrow.dataset as ds
 import pyarrow.csv as csv_arrow
 from athena_mvsh.error import ProgrammingError
 from itertools import filterfalse
 import pandas as pd
 from athena_mvsh.utils import query_is_ddl
 from athena_mvsh.converter import to_column_info_arrow
+from typing import Literal
 
 
 class CursorParquet(CursorBaseParquet):
@@ -21,6 +22,8 @@ class CursorParquet(CursorBaseParquet):
         poll_interval: float = 1,
         result_reuse_enable: bool = False,
         *args,
+        unload_options: UnloadOptions = None,
+        unload_mode: Literal['always', 'auto'] = 'always',
         **kwargs,
     ) -> None:
         super().__init__(
@@ -31,16 +34,11 @@ class CursorParquet(CursorBaseParquet):
             poll_interval,
             result_reuse_enable,
             *args,
+            unload_options=unload_options,
+            unload_mode=unload_mode,
             **kwargs,
         )
 
-    def get_filesystem_fs(self):
-        return fs.S3FileSystem(
-            access_key=self.config['aws_access_key_id'],
-            secret_key=self.config['aws_secret_access_key'],
-            region=self.config['region_name'],
-        )
-
     def rowcount(self):
         return self.getrowcount
 
@@ -67,7 +65,9 @@ class CursorParquet(CursorBaseParquet):
 
         fs_s3 = self.get_filesystem_fs()
 
-        dataset = pq.ParquetDataset(f'{bucket}/{key}', filesystem=fs_s3)
+        dataset = pq.ParquetDataset(
+            f'{bucket}/{key}', filesystem=fs_s3, partitioning='hive'
+        )
 
         # ADICIONAR OS METADADOS -- NESSA PARTE
         # add description
@@ -82,7 +82,29 @@ class CursorParquet(CursorBaseParquet):
 
         return dataset.read(use_threads=True)
 
+    def __read_dataset(self) -> ds.Dataset:
+        bucket_s3 = self.get_bucket_s3()
+        bucket, key, __ = self.unload_location(bucket_s3)
+
+        fs_s3 = self.get_filesystem_fs()
+
+        dataset = ds.dataset(
+            f'{bucket}/{key}', filesystem=fs_s3, format='parquet', partitioning='hive'
+        )
+
+        self.metadata = to_column_info_arrow(dataset.schema)
+        self.getrowcount = dataset.count_rows()
+
+        return dataset
+
     def execute(self, query: str, result_reuse_enable: bool = False):
+        # NOTE: Com colunas complexas o resultado vem do UNLOAD, com os mesmos tipos
+        if self.is_small_result(query):
+            if (pages := self.execute_paged(query, result_reuse_enable)) is not None:
+                for rows in pages:
+                    yield from rows
+                return
+
         if not query_is_ddl(query):
             query, __ = self.format_unload(query)
 
@@ -108,6 +130,20 @@ class CursorParquet(CursorBaseParquet):
         except Exception:
             return pa.Table.from_pydict(dict())
 
+    def to_arrow_reader(
+        self, query: str, result_reuse_enable: bool = False, batch_size: int = None
+    ) -> pa.RecordBatchReader:
+        batch_size = batch_size or self.BATCH_SIZE
+        query, __ = self.format_unload(query)
+        __ = self.start_query_execution(query, result_reuse_enable)
+
+        try:
+            dataset = self.__read_dataset()
+        except Exception:
+            return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+
+        return dataset.scanner(batch_size=batch_size, use_threads=True).to_reader()
+
     def to_parquet(self, *args, **kwargs):
         pq.write_table(*args, **kwargs)
 
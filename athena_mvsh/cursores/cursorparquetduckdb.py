@@ -1,33 +1,199 @@
 from __future__ import annotations
-from athena_mvsh.cursores.cursores import CursorBaseParquet
+from athena_mvsh.cursores.cursores import (
+    CursorBaseParquet,
+    ChunkIterator,
+    UnloadOptions,
+)
 import duckdb
 import pyarrow as pa
+import pyarrow.parquet as pq
+import pyarrow.dataset as ds
+from boto3.s3.transfer import TransferConfig
 from contextlib import contextmanager
 import os
+import threading
+import time
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
-from functools import partial
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+    Future,
+    wait,
+    FIRST_COMPLETED,
+)
 from athena_mvsh.error import DatabaseError, ProgrammingError
-from athena_mvsh.utils import parse_output_location, query_is_ddl
+from athena_mvsh.utils import (
+    parse_output_location,
+    query_is_ddl,
+    logs_print,
+    query_watermark,
+    predicate_columns,
+    hive_partitions,
+    TaskGraph,
+)
+from athena_mvsh.formatador import (
+    get_value_format,
+    format_rows_predicate,
+    format_between,
+    format_in,
+    format_partition_spec,
+)
 import uuid
+import hashlib
 from athena_mvsh.converter import (
     map_convert_df_athena,
     map_convert_duckdb_athena,
     partition_func_iceberg,
+    partition_slice_iceberg,
     map_convert_duckdb_athena_pandas_arrow,
+    to_record_batch_reader,
+    relation_reader,
+    is_athena_compatible,
+    to_athena_arrow_schema,
+    to_athena_type_ddl,
+    normalize_type_ddl,
 )
 import logging
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Generator, Iterable, Union, Callable
+from dataclasses import dataclass
 
 
 logger = logging.getLogger(__name__)
 
+# NOTE: Fontes lidas em fluxo, sem materializar os dados em memoria
+DataStream = Union[pa.RecordBatchReader, duckdb.DuckDBPyRelation, Iterable]
+
 """@Experimental
 """
 
 
+@dataclass(frozen=True)
+class ResourceProfile:
+    """Limites de recursos aplicados em todas as conexoes DuckDB do cursor.
+
+    - threads: numero de threads, o padrao e `cpu_count * 5`.
+    - memory_limit: limite de memoria (ex.: `'8GB'`), acima dele o DuckDB grava em disco.
+    - temp_directory: diretorio usado para gravar os dados que excedem o limite de memoria.
+    - max_temp_directory_size: tamanho maximo do diretorio temporario (ex.: `'100GB'`).
+    - max_s3_requests: numero maximo de requisicoes simultaneas ao S3: threads de upload do
+      DuckDB e tamanho dos pools de leitura, envio e remocao de arquivos do cursor.
+    - http_timeout: timeout das requisicoes HTTP/S3.
+    - http_retries: numero de tentativas das requisicoes HTTP/S3.
+    """
+
+    threads: int = None
+    memory_limit: str = None
+    temp_directory: str = None
+    max_temp_directory_size: str = None
+    max_s3_requests: int = None
+    http_timeout: int = None
+    http_retries: int = None
+
+    def config(self) -> dict:
+        config = {
+            'preserve_insertion_order': False,
+            'threads': self.threads or (os.cpu_count() or 1) * 5,
+            'memory_limit': self.memory_limit,
+            'temp_directory': self.temp_directory,
+            'max_temp_directory_size': self.max_temp_directory_size,
+        }
+
+        return {k: v for k, v in config.items() if v is not None}
+
+    def http_settings(self) -> dict:
+        settings = {
+            's3_uploader_thread_limit': self.max_s3_requests,
+            'http_timeout': self.http_timeout,
+            'http_retries': self.http_retries,
+        }
+
+        return {k: v for k, v in settings.items() if v is not None}
+
+    def s3_workers(self, workers: int) -> int:
+        """Numero de threads de um pool com acesso ao S3, limitado por `max_s3_requests`."""
+
+        if self.max_s3_requests:
+            return max(1, min(workers, self.max_s3_requests))
+
+        return workers
+
+
+@dataclass(frozen=True)
+class WriteOptions:
+    """Opcoes dos arquivos Parquet gravados no S3 pelos metodos `write_*`.
+
+    - file_size_bytes: tamanho alvo de cada arquivo (ex.: `'256MB'` ou `268435456`).
+    - row_group_size: numero de linhas de cada row group.
+    - row_groups_per_file: numero de row groups de cada arquivo.
+    - per_thread_output: grava um arquivo por thread, enviados ao S3 em paralelo.
+    - max_rows_per_file: numero maximo de linhas de cada arquivo (engine `pyarrow`).
+    - max_open_files: numero maximo de arquivos abertos ao mesmo tempo (engine `pyarrow`).
+    - background_delete: apaga em segundo plano os arquivos da tabela substituida, apos o DROP.
+      A nova tabela e gravada em um prefixo UUID, sem misturar arquivos novos e antigos.
+    - persistent_staging: grava os dados de `write_table_iceberg` e `merge_table_iceberg` em um
+      lote (particao) de uma tabela de staging permanente, em vez de recriar a tabela temporaria.
+      Cada layout de colunas usa a sua tabela de staging, que nunca e apagada.
+
+    Sem opcoes e gravado um unico arquivo por tabela. Com particoes somente `row_group_size`
+    e aplicado, cada particao ja e gravada em um arquivo proprio.
+    """
+
+    file_size_bytes: int | str = None
+    row_group_size: int = None
+    row_groups_per_file: int = None
+    per_thread_output: bool = False
+    max_rows_per_file: int = None
+    max_open_files: int = None
+    background_delete: bool = False
+    persistent_staging: bool = False
+
+    @property
+    def is_multi_file(self) -> bool:
+        return bool(
+            self.file_size_bytes or self.row_groups_per_file or self.per_thread_output
+        )
+
+    def copy_options(self, partitioned: bool = False) -> list[str]:
+        options = []
+
+        if self.row_group_size:
+            options.append(f'ROW_GROUP_SIZE {self.row_group_size}')
+
+        # NOTE: O DuckDB nao combina PARTITION_BY com a divisao dos arquivos
+        if partitioned or not self.is_multi_file:
+            return options
+
+        if self.file_size_bytes:
+            options.append(f'FILE_SIZE_BYTES {self.file_size_bytes!r}')
+
+        if self.row_groups_per_file:
+            options.append(f'ROW_GROUPS_PER_FILE {self.row_groups_per_file}')
+
+        if self.per_thread_output:
+            options.append('PER_THREAD_OUTPUT true')
+
+        # NOTE: Varios arquivos no mesmo diretorio, nomes unicos evitam sobrescrita
+        options.append("FILENAME_PATTERN 'part_{uuid}'")
+        options.append('OVERWRITE_OR_IGNORE true')
+
+        return options
+
+
 class CursorParquetDuckdb(CursorBaseParquet):
+    CHUNK_SIZE: int = 10_000
+    LOAD_BATCH_ROWS: int = 1_000_000
+    LOAD_RETRIES: int = 3
+    SYNC_STATE_TABLE: str = '__athena_sync_state'
+    UPLOAD_WORKERS: int = 8
+    PARTITIONS_PER_INSERT: int = 100
+    PRUNE_MAX_VALUES: int = 1_000
+    PARTITIONS_PER_ALTER: int = 500
+    DELETE_WORKERS: int = 8
+    STAGE_BATCH_COLUMN: str = '__batch_id'
+    # NOTE: RETURN_FILES no COPY disponivel a partir do duckdb 1.1
+    RETURN_FILES: bool = tuple(map(int, duckdb.__version__.split('.')[:2])) >= (1, 1)
+
     def __init__(
         self,
         s3_staging_dir: str,
@@ -37,6 +203,11 @@ class CursorParquetDuckdb(CursorBaseParquet):
         poll_interval: float = 1,
         result_reuse_enable: bool = False,
         *args,
+        unload_options: UnloadOptions = None,
+        unload_mode: Literal['always', 'auto'] = 'always',
+        chunk_size: int = CHUNK_SIZE,
+        resources: ResourceProfile = None,
+        write_options: WriteOptions = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -47,59 +218,100 @@ class CursorParquetDuckdb(CursorBaseParquet):
             poll_interval,
             result_reuse_enable,
             *args,
+            unload_options=unload_options,
+            unload_mode=unload_mode,
             **kwargs,
         )
-
-    @contextmanager
-    def __connect_duckdb(self, database: str = 'db.duckdb'):
+        self.chunk_size = chunk_size
+        self.resources = resources or ResourceProfile()
+        self.write_options = write_options or WriteOptions()
+        self.__delete_executor: ThreadPoolExecutor = None
+        self.__stage_tables: set[str] = set()
+        self.__stage_lock = threading.Lock()
+
+    def __configure_duckdb(self, con: duckdb.DuckDBPyConnection) -> None:
         self.home_duckdb = 'duckdb_home'
         os.makedirs(self.home_duckdb, exist_ok=True)
 
-        try:
-            config = {
-                'preserve_insertion_order': False,
-                'threads': (os.cpu_count() or 1) * 5,
-            }
-            con = duckdb.connect(database, config=config)
+        # diretorio de extensoes
+        if os.path.isdir(self.home_duckdb):
+            con.sql(f"SET home_directory='{self.home_duckdb}'")
 
-            # diretorio de extensoes
-            if os.path.isdir(self.home_duckdb):
-                con.sql(f"SET home_directory='{self.home_duckdb}'")
+        con.install_extension('httpfs')
+        con.load_extension('httpfs')
 
-            con.install_extension('httpfs')
-            con.load_extension('httpfs')
+        for name, value in self.resources.http_settings().items():
+            con.sql(f"SET {name} = '{value}'")
 
-            con.sql(f"""
-                CREATE SECRET IF NOT EXISTS(
-                   TYPE s3,
-                   KEY_ID '{self.config['aws_access_key_id']}',
-                   SECRET '{self.config['aws_secret_access_key']}',
-                   REGION '{self.config['region_name']}'
-            )
-            """)
+        self.__log_resources(con)
+
+        con.sql(f"""
+            CREATE SECRET IF NOT EXISTS(
+               TYPE s3,
+               KEY_ID '{self.config['aws_access_key_id']}',
+               SECRET '{self.config['aws_secret_access_key']}',
+               REGION '{self.config['region_name']}'
+        )
+        """)
+
+    @contextmanager
+    def __connect_duckdb(self, database: str = 'db.duckdb'):
+        try:
+            config = self.resources.config()
+            con = duckdb.connect(database, config=config)
+            self.__configure_duckdb(con)
             yield con
         except:
             raise
         finally:
             con.close()
 
+    def __log_resources(self, con: duckdb.DuckDBPyConnection) -> None:
+        names = [*self.resources.config(), *self.resources.http_settings()]
+        rst = con.execute(
+            'SELECT name, value FROM duckdb_settings() WHERE list_contains($1, name)',
+            [names],
+        ).fetchall()
+
+        logs_print({'DuckDBResources': dict(rst)}, logger)
+
+    def __read_manifest(
+        self, con: duckdb.DuckDBPyConnection, manifest: list[str] | str
+    ) -> duckdb.DuckDBPyRelation:
+        return con.read_parquet(manifest, hive_partitioning=self.is_partitioned)
+
     def __read_duckdb(self):
         bucket_s3 = self.get_bucket_s3()
         *__, manifest = self.unload_location(bucket_s3)
 
         with self.__connect_duckdb() as con:
-            view = con.read_parquet(manifest)
-            while row := view.fetchone():
-                yield row
+            view = self.__read_manifest(con, manifest)
+
+            # NOTE: Busca em blocos, o tamanho pode ser enviado pelo `fetchmany`
+            size = None
+            while rows := view.fetchmany(size or self.chunk_size):
+                size = yield rows
 
     def __read_arrow(self):
         bucket_s3 = self.get_bucket_s3()
         *__, manifest = self.unload_location(bucket_s3)
 
         with self.__connect_duckdb() as con:
-            view = con.read_parquet(manifest)
+            view = self.__read_manifest(con, manifest)
             return view.arrow()
 
+    def __read_record_batch(self, batch_size: int):
+        bucket_s3 = self.get_bucket_s3()
+        *__, manifest = self.unload_location(bucket_s3)
+
+        with self.__connect_duckdb() as con:
+            view = self.__read_manifest(con, manifest)
+            reader = relation_reader(view, batch_size)
+
+            # NOTE: O primeiro item e o schema, o restante sao os lotes
+            yield reader.schema
+            yield from reader
+
     def __pre_execute(
         self, query: str, result_reuse_enable: bool = False, unload: bool = True
     ):
@@ -110,7 +322,13 @@ class CursorParquetDuckdb(CursorBaseParquet):
 
         return id_exec
 
-    def execute(self, query: str, result_reuse_enable: bool = False):
+    def __execute_chunks(self, query: str, result_reuse_enable: bool = False):
+        # NOTE: Com colunas complexas o resultado vem do UNLOAD, com os mesmos tipos
+        if self.is_small_result(query):
+            if (pages := self.execute_paged(query, result_reuse_enable)) is not None:
+                yield from pages
+                return
+
         unload = True
         if query_is_ddl(query):
             unload = False
@@ -122,6 +340,9 @@ class CursorParquetDuckdb(CursorBaseParquet):
         except Exception:
             return
 
+    def execute(self, query: str, result_reuse_enable: bool = False) -> ChunkIterator:
+        return ChunkIterator(self.__execute_chunks(query, result_reuse_enable))
+
     def to_arrow(self, query: str, result_reuse_enable: bool = False):
         __ = self.__pre_execute(query, result_reuse_enable)
 
@@ -130,6 +351,43 @@ class CursorParquetDuckdb(CursorBaseParquet):
         except Exception:
             return pa.Table.from_dict(dict())
 
+    def to_arrow_reader(
+        self, query: str, result_reuse_enable: bool = False, batch_size: int = None
+    ) -> pa.RecordBatchReader:
+        batch_size = batch_size or self.BATCH_SIZE
+        __ = self.__pre_execute(query, result_reuse_enable)
+
+        batches = self.__read_record_batch(batch_size)
+
+        try:
+            schema = next(batches)
+        except Exception:
+            return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+
+        return pa.RecordBatchReader.from_batches(schema, batches)
+
+    def to_duckdb(
+        self,
+        query: str,
+        result_reuse_enable: bool = False,
+        con: duckdb.DuckDBPyConnection = None,
+    ) -> duckdb.DuckDBPyRelation:
+        __ = self.__pre_execute(query, result_reuse_enable)
+
+        bucket_s3 = self.get_bucket_s3()
+        *__, manifest = self.unload_location(bucket_s3)
+
+        if not manifest:
+            raise DatabaseError('Query returned no files to read !')
+
+        # NOTE: A conexao nao e fechada, a relacao depende dela
+        if con is None:
+            con = duckdb.connect(':memory:', config=self.resources.config())
+
+        self.__configure_duckdb(con)
+
+        return self.__read_manifest(con, manifest)
+
     def to_parquet(
         self, query: str, result_reuse_enable: bool = False, *args, **kwargs
     ):
@@ -140,7 +398,7 @@ class CursorParquetDuckdb(CursorBaseParquet):
             *__, manifest = self.unload_location(bucket_s3)
 
             with self.__connect_duckdb() as con:
-                view = con.read_parquet(manifest)
+                view = self.__read_manifest(con, manifest)
                 view.write_parquet(*args, **kwargs)
 
         except Exception:
@@ -154,7 +412,7 @@ class CursorParquetDuckdb(CursorBaseParquet):
             *__, manifest = self.unload_location(bucket_s3)
 
             with self.__connect_duckdb() as con:
-                view = con.read_parquet(manifest)
+                view = self.__read_manifest(con, manifest)
                 view.write_csv(*args, **kwargs)
 
         except Exception:
@@ -170,7 +428,7 @@ class CursorParquetDuckdb(CursorBaseParquet):
             *__, manifest = self.unload_location(bucket_s3)
 
             with self.__connect_duckdb() as con:
-                view = con.read_parquet(manifest)
+                view = self.__read_manifest(con, manifest)
                 return view.df(*args, **kwargs)
         except Exception:
             return pd.DataFrame()
@@ -190,13 +448,68 @@ class CursorParquetDuckdb(CursorBaseParquet):
             *__, manifest = self.unload_location(bucket_s3)
 
             with self.__connect_duckdb(database) as con:
-                view = con.read_parquet(manifest)
+                view = self.__read_manifest(con, manifest)
                 con.sql(f'DROP TABLE IF EXISTS {kwargs["table_name"]}')
                 view.create(*args, **kwargs)
 
         except Exception:
             ...
 
+    def __read_file(self, con: duckdb.DuckDBPyConnection, file: str) -> pa.Table:
+        # NOTE: Cada arquivo e lido em um cursor proprio, sem disputar a tabela destino
+        for attempt in range(1, self.LOAD_RETRIES + 1):
+            try:
+                with con.cursor() as cursor:
+                    view = self.__read_manifest(cursor, file)
+                    return relation_reader(view, self.BATCH_SIZE).read_all()
+            except Exception as error:
+                if attempt == self.LOAD_RETRIES:
+                    raise DatabaseError(
+                        f'Failed to read file {os.path.basename(file)}: {error}'
+                    ) from error
+
+                logger.warning(
+                    f'Retry {attempt}/{self.LOAD_RETRIES} file: {os.path.basename(file)} - {error}'
+                )
+                time.sleep(self.poll_interval * attempt)
+
+    def __read_files(
+        self, con: duckdb.DuckDBPyConnection, manifest: list[str], workers: int
+    ) -> Generator[pa.Table, None, None]:
+        # NOTE: Janela limitada de arquivos em memoria, `workers * 2`
+        workers = self.resources.s3_workers(workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: set[Future] = set()
+
+            for file in manifest:
+                pending.add(executor.submit(self.__read_file, con, file))
+
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield fut.result()
+
+            for fut in as_completed(pending):
+                yield fut.result()
+
+    def __append_tables(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        table_name: str,
+        tables: list[pa.Table],
+        create: bool,
+    ) -> None:
+        data = pa.concat_tables(tables)
+
+        con.register('__load_batch', data)
+        try:
+            if create:
+                con.sql(f'CREATE TABLE {table_name} AS FROM __load_batch')
+            else:
+                con.sql(f'INSERT INTO {table_name} FROM __load_batch')
+        finally:
+            con.unregister('__load_batch')
+
     def to_partition_create_table_db(
         self,
         database: str,
@@ -206,50 +519,56 @@ class CursorParquetDuckdb(CursorBaseParquet):
         *args,
         **kwargs,
     ):
-        """Consulta com menor desempenho"""
-
-        # NOTE: Inserir por arquivo
-        def insert_part(con, file):
-            cursor = con.cursor()
-            cursor.sql(f"""
-                INSERT INTO {kwargs['table_name']} 
-                FROM read_parquet('{file}')
-            """)
-            return f'File read_insert: {os.path.basename(file)}'
+        """Carga paralela, os arquivos sao lidos em paralelo e inseridos em lotes"""
 
+        table_name = kwargs['table_name']
         __ = self.__pre_execute(query, result_reuse_enable)
 
-        try:
-            bucket_s3 = self.get_bucket_s3()
-            *__, manifest = self.unload_location(bucket_s3)
-
-            with self.__connect_duckdb(database) as con:
-                start_file = manifest[0]
-                view = con.read_parquet(start_file)
-                con.sql(f'DROP TABLE IF EXISTS {kwargs["table_name"]}')
-                view.create(*args, **kwargs)
-
-                logger.info(f'Start create table: {kwargs["table_name"]}')
-
-                # NOTE: Considerar arquivos apartir da segunda posicao
-                rest_file = list(manifest[1:])
-
-                logger.info(f'Length files: {len(rest_file)}')
-
-                with ThreadPoolExecutor(max_workers=workers) as executor:
-                    futures: list[Future] = []
-                    fun_part = partial(insert_part, con)
-
-                    for rst in rest_file:
-                        futures.append(executor.submit(fun_part, rst))
-
-                    for fut in as_completed(futures):
-                        result = fut.result()
+        bucket_s3 = self.get_bucket_s3()
+        *__, manifest = self.unload_location(bucket_s3)
 
-                        logger.info(result)
+        if not manifest:
+            logger.warning(f'Query returned no files, table {table_name} not created !')
+            return
 
-        except Exception:
-            ...
+        with self.__connect_duckdb(database) as con:
+            # NOTE: Carga em uma transacao, em caso de erro a tabela anterior e mantida
+            con.begin()
+            try:
+                con.sql(f'DROP TABLE IF EXISTS {table_name}')
+
+                logger.info(f'Start create table: {table_name}')
+                logger.info(f'Length files: {len(manifest)}')
+
+                start = time.perf_counter()
+                files = rows = nbytes = 0
+                tables, batch_rows, created = [], 0, False
+
+                # NOTE: Um unico escritor, os lotes sao inseridos pela conexao principal
+                for tbl in self.__read_files(con, manifest, workers):
+                    tables.append(tbl)
+                    batch_rows += tbl.num_rows
+                    files += 1
+                    rows += tbl.num_rows
+                    nbytes += tbl.nbytes
+
+                    if batch_rows >= self.LOAD_BATCH_ROWS:
+                        self.__append_tables(con, table_name, tables, not created)
+                        tables, batch_rows, created = [], 0, True
+
+                    elapsed = time.perf_counter() - start
+                    logger.info(
+                        f'Files: {files}/{len(manifest)} | Rows: {rows} | '
+                        f'{nbytes / 1024**2 / max(elapsed, 1e-6):.2f} MB/s'
+                    )
+
+                if tables:
+                    self.__append_tables(con, table_name, tables, not created)
+            except Exception:
+                con.rollback()
+                raise
+
+            con.commit()
 
     def to_insert_table_db(
         self, database: str, query: str, result_reuse_enable: bool = False, **kwargs
@@ -277,32 +596,155 @@ class CursorParquetDuckdb(CursorBaseParquet):
             *__, manifest = self.unload_location(bucket_s3)
 
             with self.__connect_duckdb(database) as con:
-                con.sql(f"""
-                    INSERT INTO {kwargs['table_name']}
-                    FROM read_parquet({manifest})
-                """)
+                view = self.__read_manifest(con, manifest)
+                view.insert_into(kwargs['table_name'])
 
         except Exception:
             ...
 
-    def __get_table_exists(self, catalog_name: str, schema: str, table_name: str, work_group: str = None):
+    def __get_watermark(
+        self, con: duckdb.DuckDBPyConnection, table_name: str
+    ) -> str | None:
+        con.sql(f"""
+            CREATE TABLE IF NOT EXISTS {self.SYNC_STATE_TABLE} (
+                table_name VARCHAR PRIMARY KEY,
+                watermark VARCHAR,
+                updated_at TIMESTAMP
+            )
+        """)
+
+        row = con.execute(
+            f'SELECT watermark FROM {self.SYNC_STATE_TABLE} WHERE table_name = ?',
+            [table_name],
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def sync_to_duckdb(
+        self,
+        database: str,
+        query: str,
+        key: str | list[str],
+        watermark: str,
+        result_reuse_enable: bool = False,
+        **kwargs,
+    ) -> int:
+        table_name = kwargs['table_name']
+        keys = [key] if isinstance(key, str) else list(key)
+
+        with self.__connect_duckdb(database) as con:
+            rst = con.execute(
+                'SELECT 1 FROM information_schema.tables WHERE table_name = ?',
+                [table_name],
+            )
+            exists = rst.fetchone() is not None
+            last = self.__get_watermark(con, table_name)
+
+        # NOTE: Tabela removida, a carga e refeita por completo
+        if not exists:
+            last = None
+
+        # NOTE: Somente as linhas posteriores a marca d'agua salva
+        __ = self.__pre_execute(
+            query_watermark(query, watermark, last), result_reuse_enable
+        )
+
+        bucket_s3 = self.get_bucket_s3()
+        *__, manifest = self.unload_location(bucket_s3)
+
+        if not manifest:
+            logger.info(f'Sync table {table_name}: no new rows')
+            return 0
+
+        cols_key = ', '.join(f'"{col}"' for col in keys)
+        on_key = ' AND '.join(f't."{col}" = s."{col}"' for col in keys)
+
+        with self.__connect_duckdb(database) as con:
+            con.begin()
+            try:
+                # NOTE: Mantem somente a versao mais recente de cada chave, nulos por ultimo
+                self.__read_manifest(con, manifest).create_view('__sync_source')
+                con.sql(f"""
+                    CREATE OR REPLACE TEMP TABLE __sync_batch AS
+                    FROM __sync_source
+                    QUALIFY row_number() OVER (
+                        PARTITION BY {cols_key}
+                        ORDER BY "{watermark}" IS NULL, "{watermark}" DESC
+                    ) = 1
+                """)
+
+                rows, value = con.sql(
+                    f'SELECT count(*), max("{watermark}") FROM __sync_batch'
+                ).fetchone()
+
+                # NOTE: A marca d'agua e salva como literal SQL, tipos sem literal nao sao aceitos
+                literal = get_value_format(value)
+                if value is not None and literal is None:
+                    tipo = con.sql(f'SELECT "{watermark}" FROM __sync_batch').types[0]
+                    raise ProgrammingError(
+                        f'Watermark column {watermark} type {tipo} is not supported !'
+                    )
+
+                if exists:
+                    con.sql(
+                        f'DELETE FROM {table_name} t USING __sync_batch s WHERE {on_key}'
+                    )
+                    con.sql(f'INSERT INTO {table_name} BY NAME FROM __sync_batch')
+                else:
+                    con.sql(f'CREATE TABLE {table_name} AS FROM __sync_batch')
+
+                # NOTE: Sem novos valores a marca d'agua anterior e mantida
+                if value is not None:
+                    con.execute(
+                        f"""
+                        INSERT OR REPLACE INTO {self.SYNC_STATE_TABLE}
+                        VALUES (?, ?, current_timestamp)
+                        """,
+                        [table_name, str(literal)],
+                    )
+
+                con.sql('DROP TABLE __sync_batch')
+                con.sql('DROP VIEW __sync_source')
+            except Exception:
+                con.rollback()
+                raise
+
+            con.commit()
+
+        logger.info(f'Sync table {table_name}: {rows} rows, watermark {value}')
+
+        return rows
+
+    def __get_table_exists(
+        self, catalog_name: str, schema: str, table_name: str, work_group: str = None
+    ):
+        # NOTE: Somente a tabela inexistente retorna vazio, outros erros nao sao ignorados
         response_meta = self.get_table_metadata(
-            catalog_name=catalog_name, database_name=schema, table_name=table_name, work_group=work_group
+            catalog_name=catalog_name,
+            database_name=schema,
+            table_name=table_name,
+            work_group=work_group,
+            strict=True,
         )
 
         return response_meta
 
     def __sync_table_schema(
-        self, cols_map: list[tuple], catalog_name: str, schema: str, table_name: str, work_group: str = None
+        self,
+        cols_map: list[tuple],
+        catalog_name: str,
+        schema: str,
+        table_name: str,
+        work_group: str = None,
     ) -> list[tuple] | None:
         key_type = dict(cols_map)
         cols_temp = set(col for col, __ in cols_map)
 
         cols_target = set(
             row['Name']
-            for row in self.__get_table_exists(catalog_name, schema, table_name, work_group)[
-                'Columns'
-            ]
+            for row in self.__get_table_exists(
+                catalog_name, schema, table_name, work_group
+            )['Columns']
         )
 
         if diff_cols := cols_temp - cols_target:
@@ -319,8 +761,19 @@ class CursorParquetDuckdb(CursorBaseParquet):
 
             return add_cols
 
-    def __delete_table(self, catalog_name: str, schema: str, table_name: str, work_group: str = None) -> None:
-        response_meta = self.__get_table_exists(catalog_name, schema, table_name, work_group)
+    def __delete_table(
+        self, catalog_name: str, schema: str, table_name: str, work_group: str = None
+    ) -> None:
+        self.__purge_objects(
+            self.__drop_table(catalog_name, schema, table_name, work_group)
+        )
+
+    def __drop_table(
+        self, catalog_name: str, schema: str, table_name: str, work_group: str = None
+    ) -> tuple[str, Iterable[list[str]]] | None:
+        response_meta = self.__get_table_exists(
+            catalog_name, schema, table_name, work_group
+        )
 
         if response_meta:
             # TODO: Deletar a tabela
@@ -339,25 +792,265 @@ class CursorParquetDuckdb(CursorBaseParquet):
                 keys += '/'
 
             if not keys or keys == '/':
-                logger.warning(f'Location {location_table} is not valid to delete files in S3 !')
+                logger.warning(
+                    f'Location {location_table} is not valid to delete files in S3 !'
+                )
                 return
 
             # TODO: Localizar e deletar o bucket associado a tabela
-            bucket = self.get_bucket_resource(bucket_name)
-            objects = bucket.objects.filter(Prefix=keys)
+            return bucket_name, self.__list_objects(bucket_name, keys)
+
+    def __drop_table_snapshot(
+        self, catalog_name: str, schema: str, table_name: str
+    ) -> tuple[str, list[list[str]]] | None:
+        # NOTE: A listagem termina no DROP, arquivos gravados pelos passos seguintes nao sao apagados
+        if dropped := self.__drop_table(catalog_name, schema, table_name):
+            bucket_name, pages = dropped
+            return bucket_name, list(pages)
+
+    def __purge_objects(self, dropped: tuple[str, Iterable[list[str]]] | None) -> None:
+        if not dropped:
+            return
+
+        bucket_name, pages = dropped
+
+        if not self.write_options.background_delete:
+            self.__delete_objects(bucket_name, pages)
+            return
+
+        # NOTE: A listagem e feita antes, arquivos gravados depois do DROP nao sao apagados
+        self.__submit_background(self.__delete_objects, bucket_name, list(pages))
+
+    def __submit_background(self, func: Callable, *args) -> Future:
+        if self.__delete_executor is None:
+            self.__delete_executor = ThreadPoolExecutor(max_workers=1)
+
+        fut = self.__delete_executor.submit(func, *args)
+        fut.add_done_callback(self.__log_delete_error)
+
+        return fut
+
+    @staticmethod
+    def __log_delete_error(fut: Future) -> None:
+        if error := fut.exception():
+            logger.error(str(error))
+
+    def __list_objects(
+        self, bucket_name: str, prefix: str
+    ) -> Generator[list[str], None, None]:
+        paginator = self.get_client_s3().get_paginator('list_objects_v2')
+
+        # NOTE: Cada pagina possui no maximo 1000 chaves, o limite do delete_objects
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            if keys := [obj['Key'] for obj in page.get('Contents', [])]:
+                yield keys
+
+    def __delete_objects(self, bucket_name: str, pages: Iterable[list[str]]) -> int:
+        cliente_s3 = self.get_client_s3()
+
+        def delete(keys: list[str]) -> list[dict]:
+            response = cliente_s3.delete_objects(
+                Bucket=bucket_name,
+                Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True},
+            )
+            return response.get('Errors', [])
+
+        deleted, errors = 0, []
+        workers = self.resources.s3_workers(self.DELETE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: dict[Future, int] = {}
+
+            def collect(done: Iterable[Future]) -> None:
+                nonlocal deleted
+                for fut in done:
+                    failed = fut.result()
+                    errors.extend(failed)
+                    deleted += pending.pop(fut) - len(failed)
+
+            for keys in pages:
+                pending[executor.submit(delete, keys)] = len(keys)
+
+                # NOTE: A listagem alimenta os workers sem acumular todas as chaves
+                if len(pending) >= workers * 2:
+                    done, __ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+            collect(list(as_completed(pending)))
+
+        logger.info(f'Objects deleted in s3://{bucket_name}/: {deleted}')
+
+        if errors:
+            error = errors[0]
+            raise DatabaseError(
+                f'Failed to delete {len(errors)} objects in s3://{bucket_name}/: '
+                f'{error.get("Key")} {error.get("Message")} !'
+            )
+
+        return deleted
+
+    def __fresh_location(self, is_uuid_complete_path: bool) -> bool:
+        # NOTE: Com a remocao em segundo plano o local antigo ainda tem arquivos, a tabela criada
+        # usa um prefixo UUID. O append grava no local da tabela existente e nao e afetado
+        return is_uuid_complete_path or self.write_options.background_delete
+
+    def __run_graph(self, graph: TaskGraph, name: str) -> dict:
+        start = time.perf_counter()
+        results = graph.run()
+
+        path = ' -> '.join(
+            f'{step} {secs:.2f}s' for step, secs in graph.critical_path()
+        )
+        logger.info(
+            f'{name} in {time.perf_counter() - start:.2f}s | Critical path: {path}'
+        )
+
+        return results
+
+    def __write_external(
+        self,
+        catalog_name: str,
+        schema: str,
+        table_name: str,
+        if_exists: Literal['replace', 'append'],
+        write: Callable[[dict | None], list[tuple]],
+    ) -> list[tuple]:
+        if if_exists not in ('replace', 'append'):
+            raise ProgrammingError(
+                f'Parameter if_exists={if_exists!r} is not supported |'
+            )
+
+        graph = TaskGraph()
+
+        # NOTE: O append nunca apaga a tabela, sem a tabela ela e criada pela escrita
+        if if_exists == 'append':
+            table_meta = self.__get_table_exists(catalog_name, schema, table_name)
+            graph.add('write', lambda: write(table_meta or None))
+        else:
+            # NOTE: Os arquivos novos tem nomes unicos, os antigos sao apagados durante a escrita.
+            # A escrita espera a listagem do DROP mesmo com prefixo UUID: o local antigo pode ser
+            # o diretorio pai do novo prefixo e a listagem incluiria os arquivos novos.
+            graph.add(
+                'drop',
+                lambda: self.__drop_table_snapshot(catalog_name, schema, table_name),
+            )
+            graph.add(
+                'purge',
+                lambda: self.__purge_objects(graph.results['drop']),
+                after=['drop'],
+            )
+            graph.add('write', lambda: write(None), after=['drop'])
+
+        return self.__run_graph(graph, f'Write {schema}.{table_name}')['write']
+
+    def __is_stream(self, output) -> bool:
+        if isinstance(output, (pa.RecordBatchReader, duckdb.DuckDBPyRelation)):
+            return True
+
+        return isinstance(output, Iterable) and not isinstance(
+            output, (str, Path, list, pd.DataFrame, pa.Table)
+        )
+
+    def __normalize_path(
+        self, output: list[str | Path] | str | Path
+    ) -> list[str] | str:
+        # NOTE: Normaliza o caminho para o duckdb
+        # correcao para o windows, onde o separador de caminho é diferente do s3
+        def normaliza_path(f):
+            return str(f).replace(os.sep, os.altsep or os.sep)
+
+        if isinstance(output, list):
+            return list(map(normaliza_path, output))
+
+        return normaliza_path(output)
+
+    def __source_relation(
+        self, con: duckdb.DuckDBPyConnection, data
+    ) -> duckdb.DuckDBPyRelation:
+        if isinstance(data, pd.DataFrame):
+            return con.from_df(data)
+
+        if isinstance(data, pa.Table):
+            return con.from_arrow(data)
+
+        if self.__is_stream(data):
+            return con.from_arrow(to_record_batch_reader(data))
+
+        return con.read_parquet(self.__normalize_path(data))
+
+    def __dedupe_relation(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        data,
+        keys: list[str],
+        order_by: list[str] = None,
+    ) -> duckdb.DuckDBPyRelation:
+        partition = ', '.join(f'"{col}"' for col in keys)
+
+        # NOTE: `IS NULL` explicito, o DuckDB reescreve `DESC NULLS LAST` de uma coluna como
+        # arg_max, que com nulos nao retorna a linha de maior valor
+        order = ', '.join(f'"{col}" IS NULL, "{col}" DESC' for col in order_by or keys)
+
+        # NOTE: Mantem somente a linha mais recente de cada chave
+        return self.__source_relation(con, data).query(
+            'source_data',
+            f"""
+            FROM source_data
+            QUALIFY row_number() OVER (PARTITION BY {partition} ORDER BY {order}) = 1
+            """,
+        )
+
+    def __prune_conditions(
+        self,
+        source_data: pd.DataFrame | list[str | Path] | str | Path | pa.Table,
+        columns: list[str],
+        mode: Literal['range', 'values'],
+        alias: str,
+    ) -> list[str]:
+        if self.__is_stream(source_data):
+            raise ProgrammingError('Parameter prune_by is not supported for streams |')
+
+        conds = []
+        with self.__connect_duckdb() as con:
+            rel = self.__source_relation(con, source_data)
+
+            for col in columns:
+                target_col = f'{alias}."{col}"'
+
+                if mode == 'values':
+                    values = [
+                        value
+                        for (value,) in rel.filter(f'"{col}" IS NOT NULL')
+                        .select(f'"{col}"')
+                        .distinct()
+                        .limit(self.PRUNE_MAX_VALUES + 1)
+                        .fetchall()
+                    ]
+
+                    # NOTE: Muitos valores, o intervalo gera um predicado menor
+                    if values and len(values) <= self.PRUNE_MAX_VALUES:
+                        conds.append(format_in(target_col, sorted(values)))
+                        continue
 
-            if list(objects.limit(1)):
-                objects.delete()
+                lower, upper = rel.aggregate(f'min("{col}"), max("{col}")').fetchone()
+
+                if lower is not None:
+                    conds.append(format_between(target_col, lower, upper))
+
+        logs_print({'PruneConditions': conds}, logger)
+
+        return conds
 
     def __create_table_external(
         self,
         schema: str,
         table_name: str,
         location: str,
-        output: pd.DataFrame | list[str | Path] | str | Path | pa.Table,
+        output: pd.DataFrame | list[str | Path] | str | Path | pa.Table | DataStream,
         partitions: list[str] = None,
         compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
         is_uuid_complete_path: bool = False,
+        table_meta: dict = None,
+        register: bool = True,
     ):
         # NOTE: LER DATAFRAME DUCKDB ou PARQUET
         with self.__connect_duckdb() as db:
@@ -372,123 +1065,676 @@ class CursorParquetDuckdb(CursorBaseParquet):
             elif isinstance(output, pa.Table):
                 cols_map = map_convert_duckdb_athena_pandas_arrow(db, output)
 
+            elif self.__is_stream(output):
+                # NOTE: O tipo vem do schema, os dados sao lidos somente no COPY
+                output = to_record_batch_reader(output)
+                cols_map = map_convert_duckdb_athena_pandas_arrow(
+                    db, output.schema.empty_table()
+                )
+
             else:
-                # NOTE: Normaliza o caminho para o duckdb
-                # correcao para o windows, onde o separador de caminho é diferente do s3
-                def normaliza_path(f):
-                    return str(f).replace(os.sep, os.altsep or os.sep)
+                output = self.__normalize_path(output)
+                cols_map = map_convert_duckdb_athena(
+                    db, output, self.get_filesystem_fs()
+                )
 
-                if isinstance(output, list):
-                    output = list(map(normaliza_path, output))
+            if table_meta:
+                s3_dir = self.__append_location(table_meta, cols_map, partitions)
+                s3_dir_file = f'{s3_dir}{uuid.uuid4()}.parquet'
 
-                if isinstance(output, (str, Path)):
-                    output = normaliza_path(output)
+            parts_duck = ''
+            copy_options = self.write_options.copy_options(bool(partitions))
+
+            # NOTE: Nomes unicos, as particoes podem ja ter arquivos (append ou delete em segundo plano)
+            if partitions:
+                copy_options += [
+                    "FILENAME_PATTERN 'part_{uuid}'",
+                    'OVERWRITE_OR_IGNORE true',
+                ]
 
-                cols_map = map_convert_duckdb_athena(db, output)
+            options = ''.join(f', {opt}' for opt in copy_options)
 
-            parts_duck = parts_athena = ''
+            if partitions and self.write_options.is_multi_file:
+                logger.warning('File size options are ignored for partitioned writes !')
+
+            # NOTE: Com particoes ou varios arquivos o destino e o diretorio
+            s3_target = s3_dir_file
+            if partitions or self.write_options.is_multi_file:
+                s3_target = s3_dir
+
+            return_files = bool(partitions) and self.RETURN_FILES
 
             if partitions:
                 parts_duck = f"""
                 , PARTITION_BY ({','.join(partitions)})
                 """
 
-                parts_athena = f"""
-                PARTITIONED BY (
-                    {','.join([f'`{col}` {tipo}' for col, tipo in cols_map if col in partitions])}
-                )
-                """
+            # NOTE: Os arquivos gravados definem as particoes a registrar
+            if return_files:
+                parts_duck += ', RETURN_FILES true'
 
-            if isinstance(output, (pd.DataFrame, pa.Table)):
-                db.sql(f"""
+            if isinstance(output, (pd.DataFrame, pa.Table, pa.RecordBatchReader)):
+                rst = db.sql(f"""
                 COPY output 
-                TO '{s3_dir if partitions else s3_dir_file}'
-                (FORMAT PARQUET, COMPRESSION {compression}{parts_duck})
+                TO '{s3_target}'
+                (FORMAT PARQUET, COMPRESSION {compression}{options}{parts_duck})
                 """)
             else:
-                db.sql(f"""
+                rst = db.sql(f"""
                 COPY (from read_parquet({output!r})) 
-                TO '{s3_dir if partitions else s3_dir_file}'
-                (FORMAT PARQUET, COMPRESSION {compression}{parts_duck})
+                TO '{s3_target}'
+                (FORMAT PARQUET, COMPRESSION {compression}{options}{parts_duck})
                 """)
 
-            if partitions is None:
-                partitions = list()
+            files = None
+            if return_files:
+                __, files = rst.fetchone()
+
+            # NOTE: Lotes do staging permanente sao registrados pelo chamador
+            if not register:
+                return cols_map
+
+            self.__create_table_ddl(
+                schema,
+                table_name,
+                s3_dir,
+                cols_map,
+                partitions,
+                compression,
+                files,
+                append=bool(table_meta),
+            )
+
+        return cols_map
+
+    def __append_location(
+        self, table_meta: dict, cols_map: list[tuple], partitions: list[str] = None
+    ) -> str:
+        # NOTE: Os novos arquivos precisam seguir o schema da tabela existente
+        if table_meta['Parameters'].get('table_type', '').upper() == 'ICEBERG':
+            raise ProgrammingError(
+                "if_exists='append' is not supported for Iceberg tables |"
+            )
+
+        keys = [col['Name'] for col in table_meta.get('PartitionKeys', [])]
+        if keys != [col.lower() for col in partitions or []]:
+            raise ProgrammingError(
+                f'Partitions {partitions} do not match the table partitions {keys} |'
+            )
+
+        # NOTE: O Athena guarda os nomes das colunas em minusculo
+        cols_table = {col['Name'] for col in table_meta['Columns']}
+        cols_data = {col.lower() for col, __ in cols_map} - set(keys)
+        if cols_data != cols_table:
+            raise ProgrammingError(
+                f'Columns {sorted(cols_data)} do not match the table columns {sorted(cols_table)} |'
+            )
+
+        types_table = {
+            col['Name']: normalize_type_ddl(col['Type'])
+            for col in [*table_meta['Columns'], *table_meta.get('PartitionKeys', [])]
+        }
+        if diff_types := [
+            f'{col} {tipo} != {types_table[col.lower()]}'
+            for col, tipo in cols_map
+            if normalize_type_ddl(tipo) != types_table[col.lower()]
+        ]:
+            raise ProgrammingError(
+                f'Column types do not match the table types: {", ".join(diff_types)} |'
+            )
+
+        location = table_meta['Parameters']['location']
+
+        return location if location.endswith('/') else location + '/'
+
+    def __create_table_ddl(
+        self,
+        schema: str,
+        table_name: str,
+        s3_dir: str,
+        cols_map: list[tuple],
+        partitions: list[str] = None,
+        compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
+        files: list[str] = None,
+        append: bool = False,
+    ) -> None:
+        parts_athena = ''
 
-            cols = ',\n'.join(
-                [f'`{col}` {tipo}' for col, tipo in cols_map if col not in partitions]
+        if partitions:
+            parts_athena = f"""
+            PARTITIONED BY (
+                {','.join([f'`{col}` {tipo}' for col, tipo in cols_map if col in partitions])}
             )
+            """
+
+        if partitions is None:
+            partitions = list()
+
+        cols = ',\n'.join(
+            [f'`{col}` {tipo}' for col, tipo in cols_map if col not in partitions]
+        )
 
+        stmt = f"""
+            CREATE EXTERNAL TABLE `{schema}`.`{table_name}` (
+            {cols}
+            )
+            {parts_athena}
+            STORED AS PARQUET
+            LOCATION '{s3_dir}'
+            TBLPROPERTIES ('parquet.compress'='{compression}')
+        """
+
+        # NOTE: No append a tabela ja existe, somente as particoes sao registradas
+        if not append:
+            __ = self.__pre_execute(stmt, unload=False)
+
+        if partitions and files is not None:
+            self.__add_partitions(schema, table_name, partitions, files)
+        elif partitions:
+            hive_parts = f"""MSCK REPAIR TABLE `{schema}`.`{table_name}`"""
+            __ = self.__pre_execute(hive_parts, unload=False)
+
+    def __add_partitions(
+        self, schema: str, table_name: str, partitions: list[str], files: list[str]
+    ) -> None:
+        # NOTE: Registra somente as particoes gravadas, sem listar o S3 como o MSCK
+        specs = [
+            format_partition_spec(values, location)
+            for location, values in hive_partitions(files, partitions).items()
+        ]
+
+        for start in range(0, len(specs), self.PARTITIONS_PER_ALTER):
+            batch = '\n'.join(specs[start : start + self.PARTITIONS_PER_ALTER])
             stmt = f"""
-                CREATE EXTERNAL TABLE `{schema}`.`{table_name}` (
-                {cols}
-                )
-                {parts_athena}
-                STORED AS PARQUET
-                LOCATION '{s3_dir}'
-                TBLPROPERTIES ('parquet.compress'='{compression}')
+                ALTER TABLE `{schema}`.`{table_name}` ADD IF NOT EXISTS
+                {batch}
             """
             __ = self.__pre_execute(stmt, unload=False)
 
-            if partitions:
-                hive_parts = f"""MSCK REPAIR TABLE `{schema}`.`{table_name}`"""
-                __ = self.__pre_execute(hive_parts, unload=False)
+        logs_print({'AddPartitions': len(specs)}, logger)
+
+    def __is_upload_direct(
+        self,
+        files: list[str | Path] | str | Path,
+        partitions: list[str] = None,
+        compression: str = 'ZSTD',
+    ) -> bool:
+        """Arquivos locais, com o mesmo schema, tipos aceitos pelo Athena e o codec pedido"""
+
+        if partitions or self.write_options.row_group_size:
+            return False
+
+        files = files if isinstance(files, list) else [files]
+
+        if not files or not all(os.path.isfile(file) for file in files):
+            return False
+
+        schema = None
+        for file in files:
+            # NOTE: Somente o rodape do arquivo e lido
+            meta = pq.read_metadata(file)
+            schema_file = meta.schema.to_arrow_schema()
+
+            if schema is None:
+                schema = schema_file
+            elif not schema.equals(schema_file):
+                return False
+
+            codecs = set(
+                meta.row_group(i).column(j).compression
+                for i in range(meta.num_row_groups)
+                for j in range(meta.num_columns)
+            )
+
+            if codecs - {compression.upper()}:
+                return False
+
+        return all(is_athena_compatible(field.type) for field in schema)
+
+    def __upload_table_external(
+        self,
+        schema: str,
+        table_name: str,
+        location: str,
+        files: list[str | Path] | str | Path,
+        compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
+        is_uuid_complete_path: bool = False,
+        table_meta: dict = None,
+    ):
+        files = [str(file) for file in (files if isinstance(files, list) else [files])]
+
+        s3_dir = f'{location}'
+        if is_uuid_complete_path:
+            s3_dir = f'{location}{uuid.uuid4()}/'
+
+        with self.__connect_duckdb() as db:
+            cols_map = map_convert_duckdb_athena(db, files, self.get_filesystem_fs())
+
+        if table_meta:
+            s3_dir = self.__append_location(table_meta, cols_map)
+
+        # NOTE: Arquivos enviados sem alteracao, em paralelo e com multipart
+        bucket, key = parse_output_location(s3_dir)
+        cliente_s3 = self.get_client_s3()
+        workers = self.resources.s3_workers(self.UPLOAD_WORKERS)
+        config = TransferConfig(max_concurrency=workers)
+
+        def upload(file: str) -> str:
+            cliente_s3.upload_file(
+                file, bucket, f'{key}{uuid.uuid4()}.parquet', Config=config
+            )
+            return f'File upload: {os.path.basename(file)}'
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(upload, file) for file in files]
+
+            for fut in as_completed(futures):
+                logger.info(fut.result())
+
+        self.__create_table_ddl(
+            schema,
+            table_name,
+            s3_dir,
+            cols_map,
+            None,
+            compression,
+            append=bool(table_meta),
+        )
 
         return cols_map
 
-    def __create_table_iceberg(
+    def __write_dataset_external(
         self,
         schema: str,
         table_name: str,
         location: str,
-        cols_map,
+        output: pa.Table | DataStream,
         partitions: list[str] = None,
-        catalog_name: str = 'awsdatacatalog',
         compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
-        if_exists: Literal['replace', 'append'] = 'replace',
-        sync_schema: bool = False,
         is_uuid_complete_path: bool = False,
-    ) -> None:
-        if if_exists == 'replace':
-            # NOTE: DELETAR SE EXISTIR
-            self.__delete_table(catalog_name, schema, table_name)
+        table_meta: dict = None,
+    ):
+        s3_dir = f'{location}'
+        if is_uuid_complete_path:
+            s3_dir = f'{location}{uuid.uuid4()}/'
+
+        # NOTE: Tipos nao suportados pelo Athena sao convertidos antes da escrita
+        if isinstance(output, pa.Table):
+            schema_arrow = to_athena_arrow_schema(output.schema)
+            data = output.cast(schema_arrow)
+        else:
+            reader = to_record_batch_reader(output)
+            schema_arrow = to_athena_arrow_schema(reader.schema)
+            data = pa.RecordBatchReader.from_batches(
+                schema_arrow,
+                (
+                    cast_batch
+                    for batch in reader
+                    for cast_batch in pa.Table.from_batches([batch])
+                    .cast(schema_arrow)
+                    .to_batches()
+                ),
+            )
 
-            s3_dir = f'{location}'
-            if is_uuid_complete_path:
-                s3_dir = f'{location}{uuid.uuid4()}/'
+        cols_map = [
+            (field.name, to_athena_type_ddl(field.type)) for field in schema_arrow
+        ]
 
-            parts_athena = ''
+        if table_meta:
+            s3_dir = self.__append_location(table_meta, cols_map, partitions)
 
-            if partitions:
-                parts_athena = f"""
-                PARTITIONED BY (
-                    {','.join(partition_func_iceberg(partitions))}
+        options = self.write_options
+        max_rows_per_file = options.max_rows_per_file or 0
+        max_rows_per_group = options.row_group_size or 1024 * 1024
+        if max_rows_per_file:
+            max_rows_per_group = min(max_rows_per_group, max_rows_per_file)
+
+        file_options = ds.ParquetFileFormat().make_write_options(
+            compression=compression.lower(),
+            coerce_timestamps='us',
+            allow_truncated_timestamps=True,
+        )
+
+        bucket, key = parse_output_location(s3_dir)
+
+        files = []
+
+        ds.write_dataset(
+            data,
+            f'{bucket}/{key}',
+            format='parquet',
+            filesystem=self.get_filesystem_fs(),
+            file_options=file_options,
+            partitioning=partitions,
+            partitioning_flavor='hive' if partitions else None,
+            basename_template=f'part_{uuid.uuid4()}_{{i}}.parquet',
+            max_rows_per_file=max_rows_per_file,
+            max_rows_per_group=max_rows_per_group,
+            max_open_files=options.max_open_files or 1024,
+            existing_data_behavior='overwrite_or_ignore',
+            file_visitor=lambda file: files.append(f's3://{file.path}'),
+        )
+
+        self.__create_table_ddl(
+            schema,
+            table_name,
+            s3_dir,
+            cols_map,
+            partitions,
+            compression,
+            files,
+            append=bool(table_meta),
+        )
+
+        return cols_map
+
+    def __insert_slice(self, stmt: str, slice_name: str) -> str:
+        for attempt in range(1, self.LOAD_RETRIES + 1):
+            start = time.perf_counter()
+            try:
+                __ = self.__pre_execute(stmt, unload=False)
+                return f'{slice_name} inserted in {time.perf_counter() - start:.2f}s'
+            except DatabaseError as error:
+                # NOTE: Status FAILED ou CANCELLED, o INSERT nao foi aplicado e pode ser repetido
+                if attempt == self.LOAD_RETRIES:
+                    raise DatabaseError(f'{slice_name} failed: {error}') from error
+
+                logger.warning(
+                    f'Retry {attempt}/{self.LOAD_RETRIES} {slice_name} - {error}'
                 )
-                """
+                time.sleep(self.poll_interval * attempt)
+            except Exception as error:
+                # NOTE: Falha ambigua (ex.: no acompanhamento), o INSERT pode ter sido aplicado
+                raise DatabaseError(
+                    f'{slice_name} failed without retry, the insert may have been applied: {error}'
+                ) from error
+
+    def __partition_values(self, source_sql: str, cols_slice: list[str]) -> list[tuple]:
+        # NOTE: Valores de particao presentes nos dados novos (staging)
+        cols_select = ', '.join(cols_slice)
+        id_exec = self.start_query_execution(
+            f'SELECT DISTINCT {cols_select} FROM {source_sql} AS src'
+        )
 
-            if partitions is None:
-                partitions = list()
+        return [row for page in self.iter_query_results(id_exec) for row in page]
 
-            cols = ',\n'.join([f'`{col}` {tipo}' for col, tipo in cols_map])
+    def __delete_partitions(
+        self, schema: str, table_name: str, partitions: list[str], source_sql: str
+    ) -> None:
+        cols_slice = partition_slice_iceberg(partitions)
+        rows = self.__partition_values(source_sql, cols_slice)
 
+        size = self.PARTITIONS_PER_INSERT
+        for start in range(0, len(rows), size):
             stmt = f"""
-                CREATE TABLE `{schema}`.`{table_name}` (
-                {cols}
+            DELETE FROM "{schema}"."{table_name}"
+            WHERE {format_rows_predicate(cols_slice, rows[start : start + size])}
+            """
+            __ = self.__pre_execute(stmt, unload=False)
+
+        logger.info(f'Overwrite partitions: {len(rows)}')
+
+    def __insert_slices(
+        self,
+        source_sql: str,
+        stmt_insert: str,
+        partitions: list[str],
+        max_concurrent_inserts: int,
+    ) -> None:
+        # NOTE: Somente particoes de identidade ou de tempo, validadas no write_table_iceberg
+        cols_slice = partition_slice_iceberg(partitions)
+        rows = self.__partition_values(source_sql, cols_slice)
+
+        # NOTE: O Athena grava no maximo 100 particoes por INSERT
+        size = self.PARTITIONS_PER_INSERT
+        slices = [rows[i : i + size] for i in range(0, len(rows), size)]
+
+        logger.info(f'Insert slices: {len(slices)} | Partitions: {len(rows)}')
+
+        with ThreadPoolExecutor(max_workers=max_concurrent_inserts) as executor:
+            futures: dict[Future, str] = {}
+
+            for n, rows_slice in enumerate(slices, 1):
+                stmt = f"""{stmt_insert}
+        WHERE {format_rows_predicate(cols_slice, rows_slice)}
+        """
+                slice_name = f'Slice {n}/{len(slices)}'
+                futures[executor.submit(self.__insert_slice, stmt, slice_name)] = (
+                    slice_name
                 )
-                {parts_athena}
-                LOCATION '{s3_dir}'
-                TBLPROPERTIES (
-                    'table_type'='ICEBERG',
-                    'format'='parquet',
-                    'write_compression'='{compression}',
-                    'optimize_rewrite_delete_file_threshold'='10'
+
+            failed = []
+            for fut in as_completed(futures):
+                try:
+                    logger.info(fut.result())
+                except DatabaseError as error:
+                    logger.error(str(error))
+                    failed.append(futures[fut])
+
+        if failed:
+            raise DatabaseError(f'Insert failed for {", ".join(sorted(failed))} !')
+
+    def __stage_temp(
+        self,
+        catalog_name: str,
+        schema: str,
+        table_name: str,
+        data: pd.DataFrame | list[str | Path] | str | Path | pa.Table | DataStream,
+    ) -> tuple[list[tuple], str, tuple]:
+        temp_table_name = f'temp__{table_name}'
+        location_temp = f'{self.s3_staging_dir}temp/{temp_table_name}/'
+
+        cols_map = self.__create_table_external(
+            schema, temp_table_name, location_temp, data, is_uuid_complete_path=True
+        )
+
+        return cols_map, f'"{schema}"."{temp_table_name}"', None
+
+    def __stage_batch(
+        self,
+        catalog_name: str,
+        schema: str,
+        table_name: str,
+        data: pd.DataFrame | list[str | Path] | str | Path | pa.Table | DataStream,
+    ) -> tuple[list[tuple], str, tuple]:
+        location_stage = f'{self.s3_staging_dir}stage/stage__{table_name}/'
+        batch_col = self.STAGE_BATCH_COLUMN
+        batch_id = uuid.uuid4().hex
+        s3_batch = f'{location_stage}{batch_col}={batch_id}/'
+
+        # NOTE: Cada escrita grava um lote proprio, sem DROP ou purge da tabela de staging
+        stage_table_name = None
+        try:
+            cols_map = self.__create_table_external(
+                schema, f'stage__{table_name}', s3_batch, data, register=False
+            )
+            stage_table_name = self.__stage_table(
+                catalog_name, schema, table_name, location_stage, cols_map
+            )
+
+            spec = format_partition_spec({batch_col: batch_id}, s3_batch)
+            __ = self.__pre_execute(
+                f'ALTER TABLE `{schema}`.`{stage_table_name}` ADD IF NOT EXISTS {spec}',
+                unload=False,
+            )
+        except Exception:
+            # NOTE: Arquivos ja gravados do lote (e a particao, se registrada) sao removidos
+            self.__submit_background(
+                self.__cleanup_batch, (schema, stage_table_name, batch_id, s3_batch)
+            )
+            raise
+
+        source_sql = (
+            f'(SELECT * FROM "{schema}"."{stage_table_name}" '
+            f'WHERE "{batch_col}" = {get_value_format(batch_id)})'
+        )
+
+        return cols_map, source_sql, (schema, stage_table_name, batch_id, s3_batch)
+
+    def __stage_table(
+        self,
+        catalog_name: str,
+        schema: str,
+        table_name: str,
+        location_stage: str,
+        cols_map: list[tuple],
+    ) -> str:
+        # NOTE: Cada layout de colunas tem a sua tabela, lotes de outro layout nao sao afetados
+        layout = ','.join(
+            f'{col.lower()} {normalize_type_ddl(tipo)}' for col, tipo in cols_map
+        )
+        stage_table_name = (
+            f'stage__{table_name}__{hashlib.md5(layout.encode()).hexdigest()[:8]}'
+        )
+
+        with self.__stage_lock:
+            if stage_table_name in self.__stage_tables:
+                return stage_table_name
+
+            table_meta = self.__get_table_exists(catalog_name, schema, stage_table_name)
+
+            if not table_meta:
+                try:
+                    self.__create_table_ddl(
+                        schema,
+                        stage_table_name,
+                        location_stage,
+                        [*cols_map, (self.STAGE_BATCH_COLUMN, 'STRING')],
+                        [self.STAGE_BATCH_COLUMN],
+                        files=[],
+                    )
+                except DatabaseError:
+                    # NOTE: Outra escrita pode ter criado a mesma tabela ao mesmo tempo
+                    table_meta = self.__get_table_exists(
+                        catalog_name, schema, stage_table_name
+                    )
+                    if not table_meta:
+                        raise
+
+            if table_meta and not self.__is_stage_compatible(table_meta, cols_map):
+                raise ProgrammingError(
+                    f'Staging table {schema}.{stage_table_name} does not match the data columns !'
                 )
+
+            self.__stage_tables.add(stage_table_name)
+
+        return stage_table_name
+
+    def __is_stage_compatible(self, table_meta: dict, cols_map: list[tuple]) -> bool:
+        keys = [col['Name'] for col in table_meta.get('PartitionKeys', [])]
+        cols_table = [
+            (col['Name'].lower(), normalize_type_ddl(col['Type']))
+            for col in table_meta['Columns']
+        ]
+        cols_data = [(col.lower(), normalize_type_ddl(tipo)) for col, tipo in cols_map]
+
+        return keys == [self.STAGE_BATCH_COLUMN] and cols_table == cols_data
+
+    def __cleanup_batch(self, batch: tuple) -> None:
+        schema, stage_table_name, batch_id, s3_batch = batch
+
+        # NOTE: Sem a tabela de staging o lote nao chegou a ser registrado
+        if stage_table_name:
+            __ = self.__pre_execute(
+                f"""
+                ALTER TABLE `{schema}`.`{stage_table_name}`
+                DROP IF EXISTS PARTITION (`{self.STAGE_BATCH_COLUMN}` = {get_value_format(batch_id)})
+                """,
+                unload=False,
+            )
+
+        bucket_name, keys = parse_output_location(s3_batch)
+        self.__delete_objects(bucket_name, self.__list_objects(bucket_name, keys))
+
+    def __stage_source(
+        self,
+        catalog_name: str,
+        schema: str,
+        table_name: str,
+        data: pd.DataFrame | list[str | Path] | str | Path | pa.Table | DataStream,
+    ) -> tuple[list[tuple], str, tuple]:
+        if self.write_options.persistent_staging:
+            return self.__stage_batch(catalog_name, schema, table_name, data)
+
+        return self.__stage_temp(catalog_name, schema, table_name, data)
+
+    def __cleanup_on_error(
+        self, catalog_name: str, schema: str, table_name: str, staged: tuple | None
+    ) -> None:
+        # NOTE: O erro original e mantido, falhas da limpeza somente no log
+        try:
+            self.__cleanup_source(
+                catalog_name, schema, table_name, staged[2] if staged else None
+            )
+        except Exception as error:
+            logger.error(
+                f'Failed to clean up staging of {schema}.{table_name}: {error}'
+            )
+
+    def __cleanup_source(
+        self, catalog_name: str, schema: str, table_name: str, batch: tuple | None
+    ) -> None:
+        # NOTE: O lote e removido em segundo plano, a proxima escrita usa outro lote
+        if batch:
+            self.__submit_background(self.__cleanup_batch, batch)
+        elif not self.write_options.persistent_staging:
+            self.__delete_table(catalog_name, schema, f'temp__{table_name}')
+
+    def __create_table_iceberg(
+        self,
+        schema: str,
+        table_name: str,
+        location: str,
+        cols_map,
+        partitions: list[str] = None,
+        compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
+        is_uuid_complete_path: bool = False,
+    ) -> None:
+        s3_dir = f'{location}'
+        if is_uuid_complete_path:
+            s3_dir = f'{location}{uuid.uuid4()}/'
+
+        parts_athena = ''
+
+        if partitions:
+            parts_athena = f"""
+            PARTITIONED BY (
+                {','.join(partition_func_iceberg(partitions))}
+            )
             """
 
-            # TODO: Criar a tabela
-            __ = self.__pre_execute(stmt, unload=False)
+        cols = ',\n'.join([f'`{col}` {tipo}' for col, tipo in cols_map])
 
-        if sync_schema and if_exists == 'append':
+        stmt = f"""
+            CREATE TABLE `{schema}`.`{table_name}` (
+            {cols}
+            )
+            {parts_athena}
+            LOCATION '{s3_dir}'
+            TBLPROPERTIES (
+                'table_type'='ICEBERG',
+                'format'='parquet',
+                'write_compression'='{compression}',
+                'optimize_rewrite_delete_file_threshold'='10'
+            )
+        """
+
+        # TODO: Criar a tabela
+        __ = self.__pre_execute(stmt, unload=False)
+
+    def __insert_table_iceberg(
+        self,
+        schema: str,
+        table_name: str,
+        cols_map,
+        source_sql: str,
+        partitions: list[str] = None,
+        catalog_name: str = 'awsdatacatalog',
+        if_exists: Literal['replace', 'append', 'overwrite_partitions'] = 'replace',
+        sync_schema: bool = False,
+        max_concurrent_inserts: int = None,
+    ) -> None:
+        if sync_schema and if_exists != 'replace':
             # NOTE: Sincronizar esquema com a tabela temporaria
             self.__sync_table_schema(cols_map, catalog_name, schema, table_name)
 
@@ -496,13 +1742,19 @@ class CursorParquetDuckdb(CursorBaseParquet):
 
         stmt_insert = f"""
         INSERT INTO "{schema}"."{table_name}" ({cols_insert})
-        SELECT {cols_insert} FROM "{schema}"."temp__{table_name}"
+        SELECT {cols_insert} FROM {source_sql} AS src
         """
 
-        __ = self.__pre_execute(stmt_insert, unload=False)
+        # NOTE: O Athena nao possui transacao, o DELETE e o INSERT sao executados em sequencia
+        if if_exists == 'overwrite_partitions':
+            self.__delete_partitions(schema, table_name, partitions, source_sql)
 
-        # TODO: Deletar tabela temporaria
-        self.__delete_table(catalog_name, schema, f'temp__{table_name}')
+        if max_concurrent_inserts and partitions:
+            self.__insert_slices(
+                source_sql, stmt_insert, partitions, max_concurrent_inserts
+            )
+        else:
+            __ = self.__pre_execute(stmt_insert, unload=False)
 
     def write_dataframe(
         self,
@@ -514,6 +1766,7 @@ class CursorParquetDuckdb(CursorBaseParquet):
         catalog_name: str = 'awsdatacatalog',
         compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
         is_uuid_complete_path: bool = False,
+        if_exists: Literal['replace', 'append'] = 'replace',
     ) -> None:
         if not isinstance(df, pd.DataFrame):
             raise ProgrammingError("Parameter 'df' is not a dataframe |")
@@ -526,22 +1779,26 @@ class CursorParquetDuckdb(CursorBaseParquet):
         else:
             location = self.s3_staging_dir
 
-        self.__delete_table(catalog_name, schema, table_name)
+        is_uuid_complete_path = self.__fresh_location(is_uuid_complete_path)
 
         # TODO: Criar tabela com o tipo correto
-        self.__create_table_external(
-            schema,
-            table_name,
-            location,
-            df,
-            partitions,
-            compression,
-            is_uuid_complete_path,
-        )
+        def write(table_meta: dict | None) -> list[tuple]:
+            return self.__create_table_external(
+                schema,
+                table_name,
+                location,
+                df,
+                partitions,
+                compression,
+                is_uuid_complete_path,
+                table_meta,
+            )
+
+        self.__write_external(catalog_name, schema, table_name, if_exists, write)
 
     def write_arrow(
         self,
-        tbl: pa.Table,
+        tbl: pa.Table | DataStream,
         table_name: str,
         schema: str,
         location: str = None,
@@ -549,11 +1806,16 @@ class CursorParquetDuckdb(CursorBaseParquet):
         catalog_name: str = 'awsdatacatalog',
         compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
         is_uuid_complete_path: bool = False,
+        if_exists: Literal['replace', 'append'] = 'replace',
+        engine: Literal['duckdb', 'pyarrow'] = 'duckdb',
     ) -> None:
-        if not isinstance(tbl, pa.Table):
-            raise ProgrammingError("Parameter 'tbl' is not a Table Arrow |")
+        if engine not in ('duckdb', 'pyarrow'):
+            raise ProgrammingError(f'Engine {engine} is not supported |')
+
+        if not isinstance(tbl, pa.Table) and not self.__is_stream(tbl):
+            raise ProgrammingError("Parameter 'tbl' is not a Table Arrow or a stream |")
 
-        if tbl.num_rows == 0:
+        if isinstance(tbl, pa.Table) and tbl.num_rows == 0:
             raise ProgrammingError('Table Arrow is empty |')
 
         if location:
@@ -561,17 +1823,25 @@ class CursorParquetDuckdb(CursorBaseParquet):
         else:
             location = self.s3_staging_dir
 
-        self.__delete_table(catalog_name, schema, table_name)
+        is_uuid_complete_path = self.__fresh_location(is_uuid_complete_path)
+
+        write_table = self.__create_table_external
+        if engine == 'pyarrow':
+            write_table = self.__write_dataset_external
+
+        def write(table_meta: dict | None) -> list[tuple]:
+            return write_table(
+                schema,
+                table_name,
+                location,
+                tbl,
+                partitions,
+                compression,
+                is_uuid_complete_path,
+                table_meta,
+            )
 
-        self.__create_table_external(
-            schema,
-            table_name,
-            location,
-            tbl,
-            partitions,
-            compression,
-            is_uuid_complete_path,
-        )
+        self.__write_external(catalog_name, schema, table_name, if_exists, write)
 
     def write_parquet(
         self,
@@ -583,73 +1853,193 @@ class CursorParquetDuckdb(CursorBaseParquet):
         catalog_name: str = 'awsdatacatalog',
         compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
         is_uuid_complete_path: bool = False,
+        if_exists: Literal['replace', 'append'] = 'replace',
     ) -> None:
         if location:
             location = location if location.endswith('/') else location + '/'
         else:
             location = self.s3_staging_dir
 
-        # TODO: Verificar se tabela existe
-        self.__delete_table(catalog_name, schema, table_name)
+        is_uuid_complete_path = self.__fresh_location(is_uuid_complete_path)
+
+        # NOTE: Arquivos ja compativeis sao enviados sem reescrita
+        upload_direct = self.__is_upload_direct(file, partitions, compression)
+
+        def write(table_meta: dict | None) -> list[tuple]:
+            if upload_direct:
+                return self.__upload_table_external(
+                    schema,
+                    table_name,
+                    location,
+                    file,
+                    compression,
+                    is_uuid_complete_path,
+                    table_meta,
+                )
 
-        # TODO: Criar tabela com o tipo correto
-        self.__create_table_external(
-            schema,
-            table_name,
-            location,
-            file,
-            partitions,
-            compression,
-            is_uuid_complete_path,
-        )
+            # TODO: Criar tabela com o tipo correto
+            return self.__create_table_external(
+                schema,
+                table_name,
+                location,
+                file,
+                partitions,
+                compression,
+                is_uuid_complete_path,
+                table_meta,
+            )
+
+        self.__write_external(catalog_name, schema, table_name, if_exists, write)
 
     def write_table_iceberg(
         self,
-        data: pd.DataFrame | list[str | Path] | str | Path | pa.Table,
+        data: pd.DataFrame | list[str | Path] | str | Path | pa.Table | DataStream,
         table_name: str,
         schema: str,
         location: str = None,
         partitions: list[str] = None,
         catalog_name: str = 'awsdatacatalog',
         compression: Literal['ZSTD', 'SNAPPY', 'GZIP'] = 'ZSTD',
-        if_exists: Literal['replace', 'append'] = 'replace',
+        if_exists: Literal['replace', 'append', 'overwrite_partitions'] = 'replace',
         sync_schema: bool = False,
         is_uuid_complete_path: bool = False,
+        max_concurrent_inserts: int = None,
     ) -> None:
+        if if_exists == 'overwrite_partitions':
+            if not partitions:
+                raise ProgrammingError(
+                    "Parameter partitions is required for if_exists='overwrite_partitions' |"
+                )
+
+            # NOTE: Bucket e truncate nao podem ser calculados a partir dos dados novos
+            if len(partition_slice_iceberg(partitions)) != len(partitions):
+                raise ProgrammingError(
+                    "if_exists='overwrite_partitions' supports only identity and time partitions |"
+                )
+
+        # NOTE: Com bucket ou truncate uma parte poderia gravar mais de 100 particoes
+        if max_concurrent_inserts and partitions:
+            if len(partition_slice_iceberg(partitions)) != len(partitions):
+                raise ProgrammingError(
+                    'max_concurrent_inserts supports only identity and time partitions |'
+                )
+
         # TODO: TABELA EXTERNA
         if location:
             location = location if location.endswith('/') else location + '/'
         else:
             location = self.s3_staging_dir
-        
+
+        is_uuid_complete_path = self.__fresh_location(is_uuid_complete_path)
+
         temp_table_name = f'temp__{table_name}'
-        location_temp = f'{self.s3_staging_dir}temp/{temp_table_name}/'
 
-        self.__delete_table(catalog_name, schema, temp_table_name)
+        # NOTE: Sem a tabela, sobrescrever particoes equivale a criar a tabela
+        if if_exists == 'overwrite_partitions' and not self.__get_table_exists(
+            catalog_name, schema, table_name
+        ):
+            if_exists = 'replace'
+
+        # NOTE: Passos independentes executados em paralelo, o staging usa um caminho UUID novo
+        graph = TaskGraph()
+
+        after_stage = None
+        if not self.write_options.persistent_staging:
+            graph.add(
+                'drop_temp',
+                lambda: self.__drop_table_snapshot(
+                    catalog_name, schema, temp_table_name
+                ),
+            )
+            graph.add(
+                'purge_temp',
+                lambda: self.__purge_objects(graph.results['drop_temp']),
+                after=['drop_temp'],
+            )
+            after_stage = ['drop_temp']
+
+        # TODO: Tabela ICEBERG
+        if if_exists == 'replace':
+            graph.add(
+                'drop_target',
+                lambda: self.__drop_table_snapshot(catalog_name, schema, table_name),
+            )
+            graph.add(
+                'purge_target',
+                lambda: self.__purge_objects(graph.results['drop_target']),
+                after=['drop_target'],
+            )
+
+            # NOTE: O local antigo pode ser o diretorio pai do staging (ex.: `s3_staging_dir`),
+            # o staging aguarda a listagem do DROP para que seus arquivos nao sejam apagados
+            after_stage = [*(after_stage or []), 'drop_target']
 
         # TODO: Criar tabela externa para staging dos dados e retornar o mapeamento de colunas
-        cols_map = self.__create_table_external(
-            schema, temp_table_name, location_temp, data, is_uuid_complete_path=True
+        graph.add(
+            'stage',
+            lambda: self.__stage_source(catalog_name, schema, table_name, data),
+            after=after_stage,
         )
 
-        # TODO: Tabela ICEBERG
-        self.__create_table_iceberg(
-            schema,
-            table_name,
-            location,
-            cols_map,
-            partitions,
-            catalog_name,
-            compression,
-            if_exists,
-            sync_schema,
-            is_uuid_complete_path,
+        after_insert = ['stage']
+        if if_exists == 'replace':
+            graph.add(
+                'create_target',
+                lambda: self.__create_table_iceberg(
+                    schema,
+                    table_name,
+                    location,
+                    graph.results['stage'][0],
+                    partitions,
+                    compression,
+                    is_uuid_complete_path,
+                ),
+                after=['purge_target', 'stage'],
+            )
+            after_insert = ['create_target']
+
+        graph.add(
+            'insert',
+            lambda: self.__insert_table_iceberg(
+                schema,
+                table_name,
+                *graph.results['stage'][:2],
+                partitions,
+                catalog_name,
+                if_exists,
+                sync_schema,
+                max_concurrent_inserts,
+            ),
+            after=after_insert,
+        )
+
+        # TODO: Deletar tabela temporaria
+        graph.add(
+            'drop_temp_end',
+            lambda: self.__cleanup_source(
+                catalog_name, schema, table_name, graph.results['stage'][2]
+            ),
+            after=['insert'],
         )
 
+        try:
+            self.__run_graph(graph, f'Write Iceberg {schema}.{table_name}')
+        except Exception:
+            # NOTE: Com erro a limpeza do staging nao foi executada pelo grafo
+            self.__cleanup_on_error(
+                catalog_name, schema, table_name, graph.results.get('stage')
+            )
+            raise
+
     def merge_table_iceberg(
         self,
         target_table: str,
-        source_data: pd.DataFrame | list[str | Path] | str | Path | pa.Table,
+        source_data: pd.DataFrame
+        | list[str | Path]
+        | str
+        | Path
+        | pa.Table
+        | DataStream,
         schema: str,
         predicate: str,
         delete_condition: str = None,
@@ -659,27 +2049,55 @@ class CursorParquetDuckdb(CursorBaseParquet):
         sync_schema: bool = False,
         location: str = None,
         catalog_name: str = 'awsdatacatalog',
+        prune_by: list[str] = None,
+        prune_mode: Literal['range', 'values'] = 'range',
+        dedupe_by: list[str] = None,
+        order_by: list[str] = None,
     ) -> None:
         if location:
             location = location if location.endswith('/') else location + '/'
         else:
             location = self.s3_staging_dir
 
-        temp_table_name = f'temp__{target_table}'
-        location_temp = f'{self.s3_staging_dir}temp/{temp_table_name}/'
+        target, source = alias
 
-        self.__delete_table(catalog_name, schema, temp_table_name)
+        # NOTE: Uma chave fora do ON deixa varias linhas da origem para a mesma linha destino
+        if dedupe_by:
+            cols_on = predicate_columns(predicate, source)
+            if missing := [col for col in dedupe_by if col.lower() not in cols_on]:
+                raise ProgrammingError(
+                    f'Columns of dedupe_by not used in predicate: {", ".join(missing)} |'
+                )
 
-        cols_map = self.__create_table_external(
-            schema, temp_table_name, location_temp, source_data, is_uuid_complete_path=True
-        )
+        # NOTE: Limites da origem restringem os arquivos lidos da tabela destino
+        prune_conds = []
+        if prune_by:
+            prune_conds = self.__prune_conditions(
+                source_data, prune_by, prune_mode, target
+            )
+
+        if not self.write_options.persistent_staging:
+            self.__delete_table(catalog_name, schema, f'temp__{target_table}')
 
-        if sync_schema:
-            self.__sync_table_schema(cols_map, catalog_name, schema, target_table)
+        if dedupe_by:
+            # NOTE: A origem e reduzida localmente antes do upload
+            with self.__connect_duckdb() as con:
+                source_rel = self.__dedupe_relation(
+                    con, source_data, dedupe_by, order_by
+                )
+                cols_map, source_sql, batch = self.__stage_source(
+                    catalog_name, schema, target_table, source_rel
+                )
+        else:
+            cols_map, source_sql, batch = self.__stage_source(
+                catalog_name, schema, target_table, source_data
+            )
 
         # TODO: Criar a consulta do tipo MERGE
         cols = list(map(lambda col: f'"{col[0]}"', cols_map))
-        target, source = alias
+        on_predicate = predicate
+        if prune_conds:
+            on_predicate = ' AND '.join([f'({predicate})', *prune_conds])
         update_cols = ', '.join(f'{col} = {source}.{col}' for col in cols)
         insert_cols = ', '.join(cols)
         values_cols = ', '.join(f'{source}.{col}' for col in cols)
@@ -698,8 +2116,8 @@ class CursorParquetDuckdb(CursorBaseParquet):
 
         stmt = f"""
             MERGE INTO "{schema}"."{target_table}" AS {target}
-            USING "{schema}"."{temp_table_name}" AS {source}
-            ON ({predicate})
+            USING {source_sql} AS {source}
+            ON ({on_predicate})
             {merge_del if delete_condition else ''}
             WHEN MATCHED {conds_up if update_condition else ''}
                THEN UPDATE SET {update_cols}
@@ -708,6 +2126,15 @@ class CursorParquetDuckdb(CursorBaseParquet):
         """
 
         # TODO: Executar consulta MERGE e deletar tabela temp
-        __ = self.__pre_execute(stmt, unload=False)
+        try:
+            if sync_schema:
+                self.__sync_table_schema(cols_map, catalog_name, schema, target_table)
+
+            __ = self.__pre_execute(stmt, unload=False)
+        except Exception:
+            self.__cleanup_on_error(
+                catalog_name, schema, target_table, (cols_map, source_sql, batch)
+            )
+            raise
 
-        self.__delete_table(catalog_name, schema, temp_table_name)
+        self.__cleanup_source(catalog_name, schema, target_table, batch)
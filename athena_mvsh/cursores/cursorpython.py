@@ -1,9 +1,11 @@
 from __future__ import annotations
 from athena_mvsh.dbathena import DBAthena
 from typing import Generator, Any
-from athena_mvsh.converter import MAP_CONVERT
+from athena_mvsh.converter import MAP_CONVERT_ARROW, to_arrow_schema
 from athena_mvsh.error import ProgrammingError
+from itertools import chain
 import pandas as pd
+import pyarrow as pa
 
 
 class CursorPython(DBAthena):
@@ -29,32 +31,6 @@ class CursorPython(DBAthena):
             **kwargs,
         )
 
-    def __get_rowcount(self, response) -> int:
-        updatecount = response.get('UpdateCount', -1)
-        if updatecount == 0:
-            return -1
-        return updatecount
-
-    def __get_metadata(self, response) -> tuple:
-        rst = response['ResultSet']
-        metadata = rst.get('ResultSetMetadata')
-        column_info = metadata.get('ColumnInfo')
-        return tuple(column_info)
-
-    def __get_rows_set(self, response) -> dict:
-        return response['ResultSet']['Rows']
-
-    def __get_rows_tuple(self, rows, offset) -> list[tuple]:
-        return [
-            tuple(
-                [
-                    MAP_CONVERT[meta.get('Type')](row.get('VarCharValue'))
-                    for meta, row in zip(self.metadata, rows[i].get('Data', []))
-                ]
-            )
-            for i in range(offset, len(rows))
-        ]
-
     def description(self):
         if self.metadata is None:
             return None
@@ -75,37 +51,43 @@ class CursorPython(DBAthena):
     def rowcount(self):
         return self.getrowcount
 
+    def __to_record_batch(self, rows: list[tuple], schema: pa.Schema) -> pa.RecordBatch:
+        return pa.RecordBatch.from_arrays(
+            [pa.array(col, type=field.type) for col, field in zip(zip(*rows), schema)],
+            schema=schema,
+        )
+
     def execute(
         self, query: str, result_reuse_enable: bool = False
     ) -> Generator[tuple, Any, None]:
         id_exec = self.start_query_execution(query, result_reuse_enable)
 
-        data_response = {'QueryExecutionId': id_exec, 'MaxResults': self.MAX_RESULTS}
-
-        self.token_next = None
-        offset = 1
+        for rows in self.iter_query_results(id_exec):
+            yield from rows
 
-        while True:
-            response = self.cliente.get_query_results(**data_response)
-
-            self.token_next = response.get('NextToken', None)
-            if offset == 1:
-                self.metadata = self.__get_metadata(response)
-                self.getrowcount = self.__get_rowcount(response)
-
-            rows = self.__get_rows_set(response)
+    def to_arrow_reader(
+        self, query: str, result_reuse_enable: bool = False, batch_size: int = None
+    ) -> pa.RecordBatchReader:
+        batch_size = batch_size or self.BATCH_SIZE
+        id_exec = self.start_query_execution(query, result_reuse_enable)
 
-            # retornar total de registros do select
+        # NOTE: A primeira pagina define os metadados e o schema
+        pages = self.iter_query_results(id_exec, MAP_CONVERT_ARROW)
+        first_page = next(pages)
+        schema = to_arrow_schema(self.metadata)
 
-            self.getrowcount += len(rows)
+        def batches():
+            buffer = []
+            for rows in chain([first_page], pages):
+                buffer.extend(rows)
+                while len(buffer) >= batch_size:
+                    yield self.__to_record_batch(buffer[:batch_size], schema)
+                    del buffer[:batch_size]
 
-            yield from self.__get_rows_tuple(rows, offset)
+            if buffer:
+                yield self.__to_record_batch(buffer, schema)
 
-            if self.token_next is None:
-                break
-            else:
-                data_response |= {'NextToken': self.token_next}
-                offset = 0
+        return pa.RecordBatchReader.from_batches(schema, batches())
 
     def to_arrow(self, *args, **kwargs):
         raise ProgrammingError('Function not implemented for cursor !')
@@ -3,9 +3,12 @@ from abc import ABC, abstractmethod
 import boto3
 from enum import Enum
 from time import sleep
+import threading
 from athena_mvsh.error import DatabaseError
 import logging
-from athena_mvsh.utils import logs_print
+from athena_mvsh.utils import logs_print, is_not_found_error
+from athena_mvsh.converter import MAP_CONVERT
+from typing import Generator, Any
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,7 @@ class DBAthena(ABC):
     MAX_RESULTS = 1_000
     MAX_RESULTS_TABLES = 50
     RESULT_SET_REUSE = 60
+    BATCH_SIZE = 100_000
 
     KWARGS_CLIENT = set(['region_name', 'aws_access_key_id', 'aws_secret_access_key'])
 
@@ -49,6 +53,8 @@ class DBAthena(ABC):
         self.token_next = None
         self.metadata = None
         self.getrowcount = -1
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
         self.get_query_execution = None
         self.datascannedinbytes = 0
         self.statement_type = None
@@ -71,6 +77,32 @@ class DBAthena(ABC):
 
         return data
 
+    # NOTE: Estado da ultima consulta por thread, os passos paralelos da escrita nao sobrescrevem
+    # o estado da thread do usuario. O `datascannedinbytes` soma todas as consultas.
+    @property
+    def get_query_execution(self) -> dict | None:
+        return getattr(self.__local, 'get_query_execution', None)
+
+    @get_query_execution.setter
+    def get_query_execution(self, value: dict | None) -> None:
+        self.__local.get_query_execution = value
+
+    @property
+    def statement_type(self) -> str | None:
+        return getattr(self.__local, 'statement_type', None)
+
+    @statement_type.setter
+    def statement_type(self, value: str | None) -> None:
+        self.__local.statement_type = value
+
+    @property
+    def substatement_type(self) -> str | None:
+        return getattr(self.__local, 'substatement_type', None)
+
+    @substatement_type.setter
+    def substatement_type(self, value: str | None) -> None:
+        self.__local.substatement_type = value
+
     def __set_datascannedinbytes(self, response: dict) -> None:
         bytes_scanned = (
             response.get('QueryExecution', {})
@@ -78,10 +110,11 @@ class DBAthena(ABC):
             .get('DataScannedInBytes')
         )
 
-        if bytes_scanned is not None:
-            self.datascannedinbytes += bytes_scanned
-        else:
-            self.datascannedinbytes += 0
+        with self.__lock:
+            if bytes_scanned is not None:
+                self.datascannedinbytes += bytes_scanned
+            else:
+                self.datascannedinbytes += 0
 
     def pool(self, id_executation) -> str:
         """Espera a requisicao até o status 'SUCCEEDED'
@@ -173,13 +206,76 @@ class DBAthena(ABC):
 
         return id_exec
 
+    def __get_rowcount(self, response) -> int:
+        updatecount = response.get('UpdateCount', -1)
+        if updatecount == 0:
+            return -1
+        return updatecount
+
+    def __get_metadata(self, response) -> tuple:
+        rst = response['ResultSet']
+        metadata = rst.get('ResultSetMetadata')
+        column_info = metadata.get('ColumnInfo')
+        return tuple(column_info)
+
+    def __get_rows_set(self, response) -> dict:
+        return response['ResultSet']['Rows']
+
+    def __get_rows_tuple(self, rows, offset, map_convert=MAP_CONVERT) -> list[tuple]:
+        return [
+            tuple(
+                [
+                    map_convert[meta.get('Type')](row.get('VarCharValue'))
+                    for meta, row in zip(self.metadata, rows[i].get('Data', []))
+                ]
+            )
+            for i in range(offset, len(rows))
+        ]
+
+    def iter_query_results(
+        self, id_exec: str, map_convert=MAP_CONVERT
+    ) -> Generator[list[tuple], Any, None]:
+        data_response = {'QueryExecutionId': id_exec, 'MaxResults': self.MAX_RESULTS}
+
+        self.token_next = None
+        offset = 1
+
+        while True:
+            response = self.cliente.get_query_results(**data_response)
+
+            self.token_next = response.get('NextToken', None)
+            if offset == 1:
+                self.metadata = self.__get_metadata(response)
+                self.getrowcount = self.__get_rowcount(response)
+
+            rows = self.__get_rows_set(response)
+
+            # retornar total de registros do select
+
+            self.getrowcount += len(rows)
+
+            yield self.__get_rows_tuple(rows, offset, map_convert)
+
+            if self.token_next is None:
+                break
+            else:
+                data_response |= {'NextToken': self.token_next}
+                offset = 0
+
     def get_table_metadata(
         self,
         catalog_name: str,
         database_name: str,
         table_name: str,
         work_group: str = None,
+        strict: bool = False,
     ) -> dict:
+        """Metadados da tabela, ou `{}` se a tabela nao existir.
+
+        Com `strict=False` qualquer erro retorna `{}`. Com `strict=True` somente a
+        tabela inexistente retorna `{}`, os demais erros geram `DatabaseError`.
+        """
+
         try:
             work_group = work_group or self.work_group
             data_response = dict(
@@ -192,7 +288,12 @@ class DBAthena(ABC):
                 data_response['WorkGroup'] = work_group
 
             response = self.cliente.get_table_metadata(**data_response)
-        except Exception:
+        except Exception as error:
+            if strict and not is_not_found_error(error):
+                raise DatabaseError(
+                    f'Failed to get metadata of table {database_name}.{table_name}: {error}'
+                ) from error
+
             return dict()
         else:
             return response['TableMetadata']
@@ -228,6 +329,9 @@ class DBAthena(ABC):
     @abstractmethod
     def to_arrow(self, *args, **kwargs): ...
 
+    @abstractmethod
+    def to_arrow_reader(self, *args, **kwargs): ...
+
     @abstractmethod
     def to_parquet(self, *args, **kwargs): ...
 
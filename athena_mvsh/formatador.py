@@ -77,3 +77,49 @@ def cast_format(consulta: str, *args, **kwargs) -> str:
                 kwargs[k] = get_value_format(v)
 
     return consulta.format(*args, **kwargs)
+
+
+def format_value(value) -> str:
+    value_format = get_value_format(value)
+
+    # NOTE: repr mantem a precisao do float
+    if isinstance(value_format, float):
+        return repr(value_format)
+
+    return f'{value_format}'
+
+
+def format_equals(column: str, value) -> str:
+    if value is None:
+        return f'{column} IS NULL'
+
+    return f'{column} = {format_value(value)}'
+
+
+def format_between(column: str, lower, upper) -> str:
+    return f'{column} BETWEEN {format_value(lower)} AND {format_value(upper)}'
+
+
+def format_in(column: str, values: list) -> str:
+    return f'{column} IN ({", ".join(format_value(value) for value in values)})'
+
+
+def format_rows_predicate(columns: list[str], rows: list[tuple]) -> str:
+    """Predicado que seleciona as linhas com os valores de `columns` iguais a uma das `rows`."""
+
+    conds = [
+        ' AND '.join(format_equals(col, val) for col, val in zip(columns, row))
+        for row in rows
+    ]
+
+    return ' OR '.join(f'({cond})' for cond in conds)
+
+
+def format_partition_spec(values: dict[str, str], location: str) -> str:
+    """Especificacao hive de uma particao para `ALTER TABLE ... ADD PARTITION`."""
+
+    spec = ', '.join(
+        f'`{col}` = {escape_hive(str(val))}' for col, val in values.items()
+    )
+
+    return f'PARTITION ({spec}) LOCATION {escape_hive(location)}'
@@ -1,6 +1,10 @@
 from __future__ import annotations
 import re
 import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Callable
+from urllib.parse import unquote
 
 
 PATTERN_OUTPUT_LOCATION = re.compile(r'^s3://(?P<bucket>[a-zA-Z0-9.\-_]+)/(?P<key>.+)$')
@@ -52,3 +56,209 @@ def query_is_ddl(stmt) -> bool:
 
     tok_regex = '|'.join('(?P<%s>%s)' % pair for pair in token_specification)
     return bool(list(re.finditer(tok_regex, code, re.I | re.X)))
+
+
+PATTERN_LIMIT = re.compile(
+    r'\b(?:LIMIT\s+(?P<limit>\d+)|FETCH\s+(?:FIRST|NEXT)\s+(?P<fetch>\d+)\s+ROWS?\s+ONLY)\s*$',
+    re.I,
+)
+PATTERN_AGGREGATE = re.compile(
+    r'^(count|count_if|sum|avg|min|max|min_by|max_by|arbitrary|any_value|'
+    r'approx_distinct|approx_percentile|bool_and|bool_or|every|checksum|'
+    r'array_agg|map_agg|histogram|stddev\w*|variance|var_\w+)\s*\(',
+    re.I,
+)
+
+
+def split_columns(cols: str) -> list[str]:
+    parts, depth, quote, start = [], 0, None, 0
+
+    for i, char in enumerate(cols):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ('"', "'", '`'):
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(cols[start:i].strip())
+            start = i + 1
+
+    parts.append(cols[start:].strip())
+    return parts
+
+
+def estimate_result_rows(stmt: str) -> int | None:
+    """Estima o numero maximo de linhas de um SELECT a partir do texto da consulta.
+
+    Retorna o valor do LIMIT/FETCH final, 1 para SELECT sem FROM ou com agregacao
+    global, ou None quando nao e possivel estimar.
+    """
+
+    code = textwrap.dedent(stmt.strip()).rstrip(';').strip()
+
+    if match := PATTERN_LIMIT.search(code):
+        return int(match.group('limit') or match.group('fetch'))
+
+    if re.search(r'\b(GROUP\s+BY|UNION|INTERSECT|EXCEPT)\b', code, re.I):
+        return None
+
+    select = re.match(
+        r'^SELECT\s+(?P<cols>.+?)(?P<source>\s+FROM\s+.+)?$', code, re.I | re.S
+    )
+    if not select:
+        return None
+
+    if not select.group('source'):
+        return 1
+
+    cols = split_columns(select.group('cols'))
+    if all(
+        PATTERN_AGGREGATE.match(col) and not re.search(r'\bOVER\b', col, re.I)
+        for col in cols
+    ):
+        return 1
+
+    return None
+
+
+def query_watermark(stmt: str, column: str, value: str | None) -> str:
+    """Filtra a consulta pelas linhas com `column` maior que o literal SQL `value`.
+
+    Sem valor (primeira carga) a consulta e retornada sem filtro.
+    """
+
+    code = textwrap.dedent(stmt.strip()).rstrip(';').strip()
+
+    if value is None:
+        return code
+
+    return f'SELECT * FROM (\n{code}\n) WHERE "{column}" > {value}'
+
+
+def predicate_columns(predicate: str, alias: str) -> set[str]:
+    """Colunas (em minusculas) referenciadas com o prefixo `alias` em uma condicao SQL."""
+
+    pattern = rf'\b{re.escape(alias)}\s*\.\s*(?:"([^"]+)"|`([^`]+)`|(\w+))'
+
+    return {''.join(match).lower() for match in re.findall(pattern, predicate, re.I)}
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """Indica se o erro do boto3 corresponde a uma tabela ou banco inexistente."""
+
+    detail = (getattr(error, 'response', None) or {}).get('Error', {})
+    code = detail.get('Code', '')
+    message = detail.get('Message', '').lower()
+
+    return code == 'EntityNotFoundException' or (
+        code == 'MetadataException' and 'not found' in message
+    )
+
+
+def hive_partitions(files: list[str], columns: list[str]) -> dict[str, dict[str, str]]:
+    """Diretorios das particoes hive (`col=valor`) dos arquivos gravados, com os valores decodificados."""
+
+    rst = {}
+    for file in files:
+        directory = file.replace('\\', '/').rsplit('/', 1)[0]
+        parts = directory.split('/')[-len(columns) :]
+
+        values = {}
+        for col, part in zip(columns, parts):
+            name, sep, value = part.partition('=')
+            if not sep or unquote(name) != col:
+                raise ValueError(f'File {file!r} is not partitioned by {columns} !')
+
+            values[col] = unquote(value)
+
+        rst[f'{directory}/'] = values
+
+    return rst
+
+
+class TaskGraph:
+    """Executa passos com dependencias (DAG) em paralelo e mede o caminho critico.
+
+    Cada passo e iniciado assim que os passos de `after` terminam. O resultado de um
+    passo fica em `results[nome]`. No primeiro erro nenhum passo novo e iniciado,
+    os passos em execucao sao aguardados e a excecao original e lancada.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self.tasks: dict[str, tuple[Callable[[], Any], tuple[str, ...]]] = {}
+        self.results: dict[str, Any] = {}
+        self.timings: dict[str, tuple[float, float]] = {}
+
+    def add(self, name: str, func: Callable[[], Any], after: list[str] = None) -> None:
+        after = tuple(after or ())
+
+        if name in self.tasks:
+            raise ValueError(f'Task {name!r} already exists !')
+
+        if missing := [dep for dep in after if dep not in self.tasks]:
+            raise ValueError(f'Task {name!r} depends on unknown tasks {missing} !')
+
+        self.tasks[name] = (func, after)
+
+    def __timed(self, name: str) -> Any:
+        start = time.perf_counter()
+        try:
+            return self.tasks[name][0]()
+        finally:
+            self.timings[name] = (start, time.perf_counter())
+
+    def run(self) -> dict[str, Any]:
+        pending = dict(self.tasks)
+        running: dict[Future, str] = {}
+        error = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                if error is None:
+                    ready = [
+                        name
+                        for name, (__, after) in pending.items()
+                        if all(dep in self.results for dep in after)
+                    ]
+                    for name in ready:
+                        del pending[name]
+                        running[executor.submit(self.__timed, name)] = name
+
+                if not running:
+                    break
+
+                done, __ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut)
+                    try:
+                        self.results[name] = fut.result()
+                    except Exception as exc:
+                        error = error or exc
+
+        if error is not None:
+            raise error
+
+        return self.results
+
+    def critical_path(self) -> list[tuple[str, float]]:
+        """Passos, com a duracao em segundos, da cadeia que definiu o tempo total."""
+
+        if not self.timings:
+            return []
+
+        path = []
+        name = max(self.timings, key=lambda task: self.timings[task][1])
+        while name is not None:
+            start, end = self.timings[name]
+            path.append((name, end - start))
+
+            # NOTE: O passo foi liberado pela dependencia que terminou por ultimo
+            after = [dep for dep in self.tasks[name][1] if dep in self.timings]
+            name = max(after, key=lambda task: self.timings[task][1], default=None)
+
+        return path[::-1]
@@ -0,0 +1,88 @@
+"""
+Compara o tempo de decodificacao local dos codecs aceitos pelo UNLOAD (`UnloadOptions`).
+
+Os arquivos sao gerados localmente com o pyarrow, simulando a saida do UNLOAD, e lidos
+com o pyarrow (CursorParquet) e com o DuckDB (CursorParquetDuckdb).
+
+Uso:
+    python benchmarks/bench_unload_codecs.py [linhas] [arquivos]
+"""
+
+from __future__ import annotations
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+COMBINACOES = [
+    ('ZSTD', None),
+    ('ZSTD', 1),
+    ('ZSTD', 9),
+    ('SNAPPY', None),
+    ('LZ4', None),
+    ('GZIP', None),
+]
+
+
+def gerar_tabela(linhas: int) -> pa.Table:
+    rng = np.random.default_rng(42)
+    return pa.table(
+        {
+            'id': np.arange(linhas, dtype='int64'),
+            'valor': rng.normal(size=linhas),
+            'qtd': rng.integers(0, 1_000, size=linhas, dtype='int32'),
+            'categoria': pa.array(rng.choice(['A', 'B', 'C', 'D'], size=linhas)),
+            'texto': pa.array([f'produto-{i % 50_000}' for i in range(linhas)]),
+        }
+    )
+
+
+def medir(func, *args, repeticoes: int = 3) -> float:
+    tempos = []
+    for __ in range(repeticoes):
+        inicio = time.perf_counter()
+        func(*args)
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main(linhas: int = 2_000_000, arquivos: int = 4) -> None:
+    tbl = gerar_tabela(linhas)
+    parte = linhas // arquivos
+
+    print(f'{"codec":<10} {"nivel":>5} {"MB":>8} {"pyarrow(s)":>11} {"duckdb(s)":>10}')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec, nivel in COMBINACOES:
+            pasta = Path(tmp) / f'{codec}_{nivel}'
+            pasta.mkdir()
+
+            for i in range(arquivos):
+                pq.write_table(
+                    tbl.slice(i * parte, parte),
+                    pasta / f'{i}.parquet',
+                    compression=codec,
+                    compression_level=nivel,
+                )
+
+            files = [str(f) for f in sorted(pasta.glob('*.parquet'))]
+            tamanho = sum(Path(f).stat().st_size for f in files) / 1024**2
+
+            t_arrow = medir(
+                lambda f: pq.ParquetDataset(f).read(use_threads=True), files
+            )
+            t_duck = medir(lambda f: duckdb.read_parquet(f).arrow(), files)
+
+            print(
+                f'{codec:<10} {nivel or "-":>5} {tamanho:>8.1f} {t_arrow:>11.3f} {t_duck:>10.3f}'
+            )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,96 @@
+"""
+Compara os motores de escrita do `write_arrow` (`engine='duckdb'` e `engine='pyarrow'`).
+
+Os arquivos sao gravados localmente, com a mesma tabela Arrow, simulando o envio ao S3:
+o DuckDB registra a tabela e executa `COPY`, o pyarrow usa `pyarrow.dataset.write_dataset`.
+
+Uso:
+    python benchmarks/bench_write_engines.py [linhas] [linhas_por_arquivo]
+"""
+
+from __future__ import annotations
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+
+CODECS = ['ZSTD', 'SNAPPY']
+
+
+def gerar_tabela(linhas: int) -> pa.Table:
+    rng = np.random.default_rng(42)
+    return pa.table(
+        {
+            'id': np.arange(linhas, dtype='int64'),
+            'valor': rng.normal(size=linhas),
+            'qtd': rng.integers(0, 1_000, size=linhas, dtype='int32'),
+            'categoria': pa.array(rng.choice(['A', 'B', 'C', 'D'], size=linhas)),
+            'texto': pa.array([f'produto-{i % 50_000}' for i in range(linhas)]),
+        }
+    )
+
+
+def medir(func, *args, repeticoes: int = 3) -> float:
+    tempos = []
+    for __ in range(repeticoes):
+        inicio = time.perf_counter()
+        func(*args)
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def escrever_duckdb(
+    tbl: pa.Table, pasta: Path, codec: str, linhas_arquivo: int
+) -> None:
+    con = duckdb.connect(config={'preserve_insertion_order': False})
+    con.sql(f"""
+        COPY tbl TO '{pasta}'
+        (FORMAT PARQUET, COMPRESSION {codec}, ROW_GROUP_SIZE {linhas_arquivo},
+        ROW_GROUPS_PER_FILE 1, FILENAME_PATTERN 'part_{{uuid}}', OVERWRITE_OR_IGNORE true)
+    """)
+    con.close()
+
+
+def escrever_pyarrow(
+    tbl: pa.Table, pasta: Path, codec: str, linhas_arquivo: int
+) -> None:
+    ds.write_dataset(
+        tbl,
+        pasta,
+        format='parquet',
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression=codec.lower()
+        ),
+        max_rows_per_file=linhas_arquivo,
+        max_rows_per_group=linhas_arquivo,
+        existing_data_behavior='overwrite_or_ignore',
+    )
+
+
+def main(linhas: int = 5_000_000, linhas_arquivo: int = 1_000_000) -> None:
+    tbl = gerar_tabela(linhas)
+
+    print(f'{"codec":<8} {"duckdb(s)":>10} {"pyarrow(s)":>11}')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec in CODECS:
+            tempos = []
+            for nome, func in [
+                ('duckdb', escrever_duckdb),
+                ('pyarrow', escrever_pyarrow),
+            ]:
+                pasta = Path(tmp) / f'{codec}_{nome}'
+                pasta.mkdir()
+                tempos.append(medir(func, tbl, pasta, codec, linhas_arquivo))
+
+            print(f'{codec:<8} {tempos[0]:>10.3f} {tempos[1]:>11.3f}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
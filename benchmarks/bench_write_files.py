@@ -0,0 +1,75 @@
+"""
+Compara o tempo de envio do `write_arrow` e o tempo de leitura da tabela no Athena
+para diferentes opcoes de arquivos (`WriteOptions`).
+
+Cada combinacao grava a mesma tabela no S3, cria a tabela externa e executa uma
+consulta de agregacao, registrando o tempo de execucao do motor e os bytes lidos.
+Necessita de credenciais AWS configuradas.
+
+Uso:
+    python benchmarks/bench_write_files.py s3_staging_dir schema location [linhas]
+"""
+
+from __future__ import annotations
+import sys
+import time
+
+import numpy as np
+import pyarrow as pa
+
+from athena_mvsh import Athena, CursorParquetDuckdb, WriteOptions
+
+
+COMBINACOES = {
+    'arquivo_unico': WriteOptions(),
+    'arquivos_128mb': WriteOptions(file_size_bytes='128MB'),
+    'arquivos_256mb': WriteOptions(file_size_bytes='256MB'),
+    'por_thread': WriteOptions(per_thread_output=True),
+    'row_group_1m': WriteOptions(file_size_bytes='256MB', row_group_size=1_000_000),
+}
+
+
+def gerar_tabela(linhas: int) -> pa.Table:
+    rng = np.random.default_rng(42)
+    return pa.table(
+        {
+            'id': np.arange(linhas, dtype='int64'),
+            'valor': rng.normal(size=linhas),
+            'qtd': rng.integers(0, 1_000, size=linhas, dtype='int32'),
+            'categoria': pa.array(rng.choice(['A', 'B', 'C', 'D'], size=linhas)),
+            'texto': pa.array([f'produto-{i % 50_000}' for i in range(linhas)]),
+        }
+    )
+
+
+def main(
+    s3_staging_dir: str, schema: str, location: str, linhas: int = 20_000_000
+) -> None:
+    tbl = gerar_tabela(linhas)
+    location = location if location.endswith('/') else location + '/'
+
+    print(f'{"opcoes":<16} {"envio(s)":>9} {"athena(s)":>10} {"MB lidos":>9}')
+
+    for nome, options in COMBINACOES.items():
+        cursor = CursorParquetDuckdb(s3_staging_dir, write_options=options)
+        table_name = f'bench_write_{nome}'
+
+        with Athena(cursor) as athena:
+            inicio = time.perf_counter()
+            athena.write_arrow(tbl, table_name, schema, f'{location}{table_name}/')
+            t_envio = time.perf_counter() - inicio
+
+            athena.execute(
+                f'SELECT categoria, count(*), sum(valor) FROM {schema}.{table_name} GROUP BY 1'
+            ).fetchall()
+
+            stats = cursor.get_query_execution['QueryExecution']['Statistics']
+            t_athena = stats['EngineExecutionTimeInMillis'] / 1000
+            lidos = stats['DataScannedInBytes'] / 1024**2
+
+        print(f'{nome:<16} {t_envio:>9.2f} {t_athena:>10.2f} {lidos:>9.1f}')
+
+
+if __name__ == '__main__':
+    s3_staging_dir, schema, location, *resto = sys.argv[1:]
+    main(s3_staging_dir, schema, location, *map(int, resto))
@@ -0,0 +1,157 @@
+import re
+import threading
+from botocore.exceptions import ClientError
+from pytest import fixture
+from athena_mvsh import CursorParquetDuckdb
+
+
+class FakeAthenaClient:
+    """Cliente do Athena em memoria: registra as consultas e responde com `results` e `types`."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.tables: dict[str, dict] = {}
+        self.results: dict[str, list[tuple]] = {}
+        self.types: dict[str, list[str]] = {}
+        self.metadata_error: ClientError = None
+        self.failures: list[list] = []
+
+    def fail(self, pattern: str, times: int = 1, error: Exception = None) -> None:
+        """As proximas `times` consultas com `pattern` falham (status FAILED ou `error`)."""
+
+        self.failures.append([pattern, times, error])
+
+    def start_query_execution(self, **kwargs) -> dict:
+        self.queries.append(' '.join(kwargs['QueryString'].split()))
+        return {'QueryExecutionId': str(len(self.queries) - 1)}
+
+    def get_query_execution(self, QueryExecutionId: str) -> dict:
+        query = self.queries[int(QueryExecutionId)]
+        for failure in self.failures:
+            pattern, times, error = failure
+            if times and re.search(pattern, query):
+                failure[1] -= 1
+                if error:
+                    raise error
+                return {'QueryExecution': {'Status': {'State': 'FAILED'}}}
+
+        return {
+            'QueryExecution': {
+                'Status': {'State': 'SUCCEEDED'},
+                'Statistics': {'DataScannedInBytes': 0},
+            }
+        }
+
+    def get_query_results(self, QueryExecutionId: str, **kwargs) -> dict:
+        query = self.queries[int(QueryExecutionId)]
+        rows = next(
+            (
+                rows
+                for pattern, rows in self.results.items()
+                if re.search(pattern, query)
+            ),
+            [],
+        )
+        width = len(rows[0]) if rows else 1
+        types = next(
+            (
+                types
+                for pattern, types in self.types.items()
+                if re.search(pattern, query)
+            ),
+            ['varchar'] * width,
+        )
+
+        return {
+            'ResultSet': {
+                'ResultSetMetadata': {'ColumnInfo': [{'Type': tipo} for tipo in types]},
+                'Rows': [{'Data': []}]
+                + [
+                    {'Data': [{'VarCharValue': value} for value in row]} for row in rows
+                ],
+            }
+        }
+
+    def get_table_metadata(self, **kwargs) -> dict:
+        if self.metadata_error:
+            raise self.metadata_error
+
+        table_name = kwargs['TableName']
+        if table_name not in self.tables:
+            raise client_error(
+                'MetadataException', f'Entity Not Found: Table {table_name} not found'
+            )
+
+        return {'TableMetadata': self.tables[table_name]}
+
+
+class FakeS3Client:
+    """Cliente do S3 em memoria para listagem e remocao de objetos."""
+
+    def __init__(self, keys: list[str] = None, errors: set[str] = None) -> None:
+        self.keys = sorted(keys or [])
+        self.errors = errors or set()
+        self.deletes: list[list[str]] = []
+        self.lock = threading.Lock()
+
+    def get_paginator(self, name: str):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket: str, Prefix: str):
+                keys = [key for key in client.keys if key.startswith(Prefix)]
+                for i in range(0, len(keys), 1_000):
+                    yield {'Contents': [{'Key': key} for key in keys[i : i + 1_000]]}
+
+        return Paginator()
+
+    def delete_objects(self, Bucket: str, Delete: dict) -> dict:
+        keys = [obj['Key'] for obj in Delete['Objects']]
+        errors = [
+            {'Key': key, 'Code': 'AccessDenied', 'Message': 'Access Denied'}
+            for key in keys
+            if key in self.errors
+        ]
+
+        with self.lock:
+            self.deletes.append(keys)
+            removed = set(keys) - self.errors
+            self.keys = [key for key in self.keys if key not in removed]
+
+        return {'Errors': errors} if errors else {}
+
+
+def client_error(code: str, message: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': message}}, 'Operation')
+
+
+@fixture
+def athena_client() -> FakeAthenaClient:
+    return FakeAthenaClient()
+
+
+@fixture
+def s3_client() -> FakeS3Client:
+    return FakeS3Client()
+
+
+@fixture
+def cursor_duckdb(
+    tmp_path, monkeypatch, athena_client, s3_client
+) -> CursorParquetDuckdb:
+    """Cursor DuckDB com os clientes da AWS em memoria e DuckDB local, sem httpfs."""
+
+    monkeypatch.chdir(tmp_path)
+
+    cursor = CursorParquetDuckdb(
+        's3://bucket/staging/',
+        region_name='us-east-1',
+        aws_access_key_id='key',
+        aws_secret_access_key='secret',
+        poll_interval=0,
+    )
+    cursor.cliente = athena_client
+    cursor.get_client_s3 = lambda: s3_client
+    cursor._CursorParquetDuckdb__configure_duckdb = lambda con: None
+
+    return cursor
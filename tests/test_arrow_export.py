@@ -0,0 +1,72 @@
+import sys
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from pytest import mark, raises
+from athena_mvsh import Athena
+from athena_mvsh.error import ProgrammingError
+
+
+TABLE = pa.table({'id': list(range(10)), 'nome': [f'n{i}' for i in range(10)]})
+
+
+class StubCursor:
+    def __init__(self, table: pa.Table = TABLE) -> None:
+        self.table = table
+
+    def to_arrow_reader(self, query, result_reuse_enable=False, batch_size=None):
+        return pa.RecordBatchReader.from_batches(
+            self.table.schema, self.table.to_batches(max_chunksize=batch_size)
+        )
+
+
+def athena_stub(cursor=None) -> Athena:
+    athena = Athena(cursor or StubCursor())
+    athena.query = 'SELECT 1'
+    athena.result_reuse_enable = False
+
+    return athena
+
+
+def test_arrow_c_stream():
+    reader = pa.RecordBatchReader.from_stream(athena_stub())
+
+    assert reader.read_all().equals(TABLE)
+
+
+def test_arrow_c_stream_old_pyarrow():
+    class OldReader:
+        pass
+
+    class OldCursor(StubCursor):
+        def to_arrow_reader(self, *args, **kwargs):
+            return OldReader()
+
+    with raises(ProgrammingError):
+        athena_stub(OldCursor()).__arrow_c_stream__()
+
+
+def test_to_polars_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'polars', None)
+
+    with raises(ImportError):
+        athena_stub().to_polars()
+
+
+@mark.parametrize('compression', [None, 'lz4', 'zstd'])
+def test_to_ipc(tmp_path, compression):
+    path = tmp_path / 'dados.arrow'
+    athena_stub().to_ipc(path, compression=compression, batch_size=3)
+
+    with pa.memory_map(str(path)) as source:
+        reader = ipc.open_file(source)
+        assert reader.num_record_batches == 4
+        assert reader.read_all().equals(TABLE)
+
+
+@mark.parametrize('compression', [None, 'lz4'])
+def test_to_ipc_stream(compression):
+    sink = pa.BufferOutputStream()
+    athena_stub().to_ipc_stream(sink, compression=compression, batch_size=4)
+
+    tbl = ipc.open_stream(sink.getvalue()).read_all()
+    assert tbl.equals(TABLE)
@@ -0,0 +1,29 @@
+from athena_mvsh.cursores import ChunkIterator
+
+
+def gerar_blocos(total: int, chunk_size: int, tamanhos: list):
+    inicio = 0
+    size = None
+    while inicio < total:
+        fim = min(total, inicio + (size or chunk_size))
+        tamanhos.append(fim - inicio)
+        size = yield [(i,) for i in range(inicio, fim)]
+        inicio = fim
+
+
+def test_chunk_fetchmany():
+    tamanhos = []
+    rows = ChunkIterator(gerar_blocos(25, 4, tamanhos))
+
+    assert next(rows) == (0,)
+    assert rows.fetchmany(10) == [(i,) for i in range(1, 11)]
+    assert tamanhos == [4, 7]
+
+    assert rows.fetchall() == [(i,) for i in range(11, 25)]
+    assert rows.fetchmany(5) == []
+    assert next(rows, None) is None
+
+
+def test_chunk_iter():
+    rows = ChunkIterator(gerar_blocos(10, 3, []))
+    assert list(rows) == [(i,) for i in range(10)]
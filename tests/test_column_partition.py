@@ -1,5 +1,5 @@
 from pytest import mark
-from athena_mvsh.converter import partition_func_iceberg
+from athena_mvsh.converter import partition_func_iceberg, partition_slice_iceberg
 
 
 @mark.parametrize(
@@ -92,3 +92,16 @@ def test_partition_buckets(coluna, esperada):
 def test_partition_truncate(coluna, esperada):
     colunas = partition_func_iceberg(coluna)
     assert esperada == colunas
+
+
+@mark.parametrize(
+    'coluna,esperada',
+    [
+        (['coluna'], ['"coluna"']),
+        (['`coluna`', 'day(data)'], ['"coluna"', 'date_trunc(\'day\', "data")']),
+        (['MONTH("data")'], ['date_trunc(\'month\', "data")']),
+        (['bucket(16, id)', 'truncate(2, nome)', 'ano'], ['"ano"']),
+    ],
+)
+def test_partition_slice(coluna, esperada):
+    assert partition_slice_iceberg(coluna) == esperada
@@ -0,0 +1,67 @@
+import logging
+import re
+import pandas as pd
+from pytest import mark, raises
+from athena_mvsh.cursores.cursorparquetduckdb import WriteOptions
+from athena_mvsh.error import DatabaseError
+from tests.conftest import FakeS3Client
+
+
+KEYS = [f'vendas/part_{i:04d}.parquet' for i in range(2_500)]
+
+
+def list_objects(cursor, prefix):
+    return cursor._CursorParquetDuckdb__list_objects('bucket', prefix)
+
+
+def delete_objects(cursor, pages):
+    return cursor._CursorParquetDuckdb__delete_objects('bucket', pages)
+
+
+@mark.parametrize('prefix,sizes', [('vendas/', [1_000, 1_000, 500]), ('outra/', [])])
+def test_list_objects(cursor_duckdb, s3_client, prefix, sizes):
+    s3_client.keys = ['outra_tabela/x.parquet', *KEYS]
+
+    assert [len(page) for page in list_objects(cursor_duckdb, prefix)] == sizes
+
+
+def test_delete_objects(cursor_duckdb, s3_client):
+    s3_client.keys = list(KEYS)
+
+    assert (
+        delete_objects(cursor_duckdb, list_objects(cursor_duckdb, 'vendas/')) == 2_500
+    )
+    assert sorted(len(keys) for keys in s3_client.deletes) == [500, 1_000, 1_000]
+    assert not s3_client.keys
+
+
+def test_delete_objects_errors(cursor_duckdb, s3_client, caplog):
+    s3_client.keys = list(KEYS)
+    s3_client.errors = {KEYS[10], KEYS[2_400]}
+
+    with (
+        caplog.at_level(logging.INFO),
+        raises(DatabaseError, match='Failed to delete 2 objects'),
+    ):
+        delete_objects(cursor_duckdb, list_objects(cursor_duckdb, 'vendas/'))
+
+    # NOTE: A contagem considera somente as chaves apagadas
+    assert 'Objects deleted in s3://bucket/: 2498' in caplog.text
+    assert s3_client.keys == sorted(s3_client.errors)
+
+
+def test_background_delete_fresh_prefix(cursor_duckdb, athena_client, tmp_path):
+    s3_client = FakeS3Client([f'vendas/{key}' for key in KEYS[:3]])
+    cursor_duckdb.get_client_s3 = lambda: s3_client
+    cursor_duckdb.write_options = WriteOptions(background_delete=True)
+    athena_client.tables['vendas'] = {'Parameters': {'location': 's3://bucket/vendas/'}}
+
+    (tmp_path / 'vendas').mkdir()
+    df = pd.DataFrame({'id': [1, 2], 'loja': ['a', 'b']})
+    cursor_duckdb.write_dataframe(df, 'vendas', 'sch', f'{tmp_path}/vendas', ['loja'])
+    cursor_duckdb._CursorParquetDuckdb__delete_executor.shutdown(wait=True)
+
+    # NOTE: A nova tabela nao usa o local com os arquivos antigos ainda em remocao
+    [create] = [q for q in athena_client.queries if q.startswith('CREATE')]
+    assert re.search(rf"LOCATION '{tmp_path}/vendas/[0-9a-f-]{{36}}/'", create)
+    assert not s3_client.keys
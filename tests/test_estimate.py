@@ -0,0 +1,29 @@
+from pytest import mark
+from athena_mvsh.utils import estimate_result_rows
+
+
+@mark.parametrize(
+    'query,esperada',
+    [
+        ('SELECT * FROM test_table LIMIT 10', 10),
+        ('select * from test_table limit 10;', 10),
+        ('SELECT * FROM test_table ORDER BY id FETCH FIRST 5 ROWS ONLY', 5),
+        ('SELECT * FROM (SELECT * FROM test_table LIMIT 5)', None),
+        ('SELECT * FROM test_table', None),
+        ('SELECT 1', 1),
+        ("SELECT current_date, 'a, b' AS texto", 1),
+        ('SELECT count(*) FROM test_table', 1),
+        ('SELECT COUNT(*) AS total, max(valor) FROM test_table WHERE id > 1', 1),
+        ('SELECT count(*) FROM test_table GROUP BY id', None),
+        ('SELECT count(*) OVER (PARTITION BY id) FROM test_table', None),
+        ('SELECT id, count(*) FROM test_table', None),
+        ('SELECT count(*) FROM a UNION ALL SELECT count(*) FROM b', None),
+        (
+            'with temp AS (SELECT * FROM test_table) SELECT * FROM temp LIMIT 100',
+            100,
+        ),
+        ('with temp AS (SELECT * FROM test_table) SELECT count(*) FROM temp', None),
+    ],
+)
+def test_estimate_rows(query, esperada):
+    assert estimate_result_rows(query) == esperada
@@ -1,4 +1,10 @@
-from athena_mvsh.formatador import cast_format
+from athena_mvsh.formatador import (
+    cast_format,
+    format_rows_predicate,
+    format_between,
+    format_in,
+    format_partition_spec,
+)
 from datetime import datetime, date
 from decimal import Decimal
 import textwrap
@@ -161,3 +167,36 @@ def test_return_cast():
     )
 
     assert all([[1, 2, 3, 4, 5] == entrada, {'num': [1, 2, 3, 4, 5]} == entrada_dict])
+
+
+def test_rows_predicate():
+    rst = format_rows_predicate(
+        ['"ano"', 'date_trunc(\'day\', "data")'],
+        [(2024, datetime(2024, 1, 1)), ('a', None)],
+    )
+
+    assert rst == (
+        '("ano" = 2024 AND date_trunc(\'day\', "data") = '
+        "TIMESTAMP '2024-01-01 00:00:00.000000') OR "
+        '("ano" = \'a\' AND date_trunc(\'day\', "data") IS NULL)'
+    )
+
+
+def test_prune_predicate():
+    assert format_between('t."data"', date(2025, 1, 1), date(2025, 1, 31)) == (
+        "t.\"data\" BETWEEN DATE '2025-01-01' AND DATE '2025-01-31'"
+    )
+    assert format_between('t."valor"', 0.1, 2.5) == 't."valor" BETWEEN 0.1 AND 2.5'
+    assert format_in('t."loja"', ['a', "b'c"]) == "t.\"loja\" IN ('a', 'b''c')"
+    assert format_in('t."id"', [1, 2]) == 't."id" IN (1, 2)'
+
+
+def test_partition_spec():
+    rst = format_partition_spec(
+        {'loja': "a'b", 'ano': 2024}, 's3://b/t/loja=a%27b/ano=2024/'
+    )
+
+    assert rst == (
+        "PARTITION (`loja` = 'a\\'b', `ano` = '2024') "
+        "LOCATION 's3://b/t/loja=a%27b/ano=2024/'"
+    )
@@ -0,0 +1,32 @@
+from pytest import mark, raises
+from athena_mvsh.utils import hive_partitions
+
+
+@mark.parametrize(
+    'files,esperado',
+    [
+        (
+            [
+                's3://b/t/ano=2024/loja=x%2F1/data_0.parquet',
+                's3://b/t/ano=2024/loja=x%2F1/data_1.parquet',
+                's3://b/t/ano=2025/loja=a/data_0.parquet',
+            ],
+            {
+                's3://b/t/ano=2024/loja=x%2F1/': {'ano': '2024', 'loja': 'x/1'},
+                's3://b/t/ano=2025/loja=a/': {'ano': '2025', 'loja': 'a'},
+            },
+        ),
+        (
+            ['C:\\dados\\ano=2024\\loja=a\\data_0.parquet'],
+            {'C:/dados/ano=2024/loja=a/': {'ano': '2024', 'loja': 'a'}},
+        ),
+        ([], {}),
+    ],
+)
+def test_hive_partitions(files, esperado):
+    assert hive_partitions(files, ['ano', 'loja']) == esperado
+
+
+def test_hive_partitions_invalido():
+    with raises(ValueError):
+        hive_partitions(['s3://b/t/ano=2024/data_0.parquet'], ['ano', 'loja'])
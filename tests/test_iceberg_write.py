@@ -0,0 +1,143 @@
+import pandas as pd
+from pytest import fixture, mark, raises
+from athena_mvsh.error import DatabaseError, ProgrammingError
+from tests.conftest import client_error
+
+
+TEMP_LOCATION = 's3://bucket/staging/temp/temp__vendas/'
+
+
+@fixture
+def cursor_iceberg(cursor_duckdb, athena_client, monkeypatch):
+    """Cursor com o staging local substituido, somente os comandos do Athena sao gerados."""
+
+    cursor_duckdb._CursorParquetDuckdb__create_table_external = (
+        lambda *args, **kwargs: [('id', 'BIGINT'), ('loja', 'STRING')]
+    )
+    athena_client.tables['temp__vendas'] = {'Parameters': {'location': TEMP_LOCATION}}
+    athena_client.results[r'SELECT DISTINCT'] = [('1',), ('2',), ('3',)]
+    monkeypatch.setattr(cursor_duckdb, 'PARTITIONS_PER_INSERT', 1)
+
+    return cursor_duckdb
+
+
+def write(cursor):
+    cursor.write_table_iceberg(
+        pd.DataFrame({'id': [1], 'loja': ['1']}),
+        'vendas',
+        'sch',
+        partitions=['loja'],
+        max_concurrent_inserts=2,
+    )
+
+
+def queries(athena_client, prefix):
+    return [query for query in athena_client.queries if query.startswith(prefix)]
+
+
+def test_insert_slices_retry_failed(cursor_iceberg, athena_client):
+    athena_client.fail(r"INSERT .*\"loja\" = '2'", times=1)
+
+    write(cursor_iceberg)
+
+    inserts = queries(athena_client, 'INSERT INTO')
+    assert len(inserts) == 4
+    assert sum('"loja" = \'2\'' in query for query in inserts) == 2
+
+
+def test_insert_slices_ambiguous_no_retry(cursor_iceberg, athena_client):
+    error = client_error('ThrottlingException', 'Rate exceeded')
+    athena_client.fail(r"INSERT .*\"loja\" = '2'", times=1, error=error)
+
+    with raises(DatabaseError, match='Slice 2/3'):
+        write(cursor_iceberg)
+
+    inserts = queries(athena_client, 'INSERT INTO')
+    assert sum('"loja" = \'2\'' in query for query in inserts) == 1
+
+    # NOTE: Tabela temporaria removida no inicio e apos o erro
+    assert len(queries(athena_client, 'DROP TABLE `sch`.`temp__vendas`')) == 2
+
+
+@mark.parametrize(
+    'partitions,match',
+    [
+        (None, 'partitions is required'),
+        ([], 'partitions is required'),
+        (['bucket(16, id)'], 'identity and time'),
+        (['loja', 'truncate(2, nome)'], 'identity and time'),
+    ],
+)
+def test_overwrite_partitions_invalid(cursor_iceberg, athena_client, partitions, match):
+    with raises(ProgrammingError, match=match):
+        cursor_iceberg.write_table_iceberg(
+            pd.DataFrame({'id': [1]}),
+            'vendas',
+            'sch',
+            partitions=partitions,
+            if_exists='overwrite_partitions',
+        )
+
+    assert not athena_client.queries
+
+
+@mark.parametrize(
+    'partitions',
+    [['bucket(16, id)'], ['loja', 'truncate(2, nome)'], ['day(dt)', 'bucket(4, id)']],
+)
+def test_insert_slices_transform_invalid(cursor_iceberg, athena_client, partitions):
+    # NOTE: Valores de identidade nao limitam as particoes de bucket e truncate
+    with raises(ProgrammingError, match='max_concurrent_inserts supports only'):
+        cursor_iceberg.write_table_iceberg(
+            pd.DataFrame({'id': [1]}),
+            'vendas',
+            'sch',
+            partitions=partitions,
+            max_concurrent_inserts=2,
+        )
+
+    assert not athena_client.queries
+
+
+def overwrite(cursor, partitions=('loja',)):
+    cursor.write_table_iceberg(
+        pd.DataFrame({'id': [1], 'loja': ['1']}),
+        'vendas',
+        'sch',
+        partitions=list(partitions),
+        if_exists='overwrite_partitions',
+    )
+
+
+def test_overwrite_partitions_missing_table(cursor_iceberg, athena_client):
+    overwrite(cursor_iceberg)
+
+    # NOTE: Sem a tabela destino equivale a 'replace', sem DELETE
+    assert len(queries(athena_client, 'CREATE TABLE `sch`.`vendas`')) == 1
+    assert not queries(athena_client, 'DELETE')
+
+
+def test_overwrite_partitions_delete(cursor_iceberg, athena_client, monkeypatch):
+    athena_client.tables['vendas'] = {'Parameters': {'location': 's3://bucket/vendas/'}}
+    athena_client.results[r'SELECT DISTINCT'] = [
+        ('1', '2025-01-01'),
+        ('2', '2025-01-01'),
+        (None, '2025-01-02'),
+    ]
+    monkeypatch.setattr(cursor_iceberg, 'PARTITIONS_PER_INSERT', 2)
+
+    overwrite(cursor_iceberg, ['loja', 'day(data)'])
+
+    assert queries(athena_client, 'DELETE') == [
+        'DELETE FROM "sch"."vendas" WHERE '
+        "(\"loja\" = '1' AND date_trunc('day', \"data\") = '2025-01-01') OR "
+        "(\"loja\" = '2' AND date_trunc('day', \"data\") = '2025-01-01')",
+        'DELETE FROM "sch"."vendas" WHERE '
+        '("loja" IS NULL AND date_trunc(\'day\', "data") = \'2025-01-02\')',
+    ]
+    assert not queries(athena_client, 'CREATE TABLE')
+
+    # NOTE: O DELETE antecede o INSERT dos dados novos
+    first_insert = athena_client.queries.index(queries(athena_client, 'INSERT')[0])
+    last_delete = athena_client.queries.index(queries(athena_client, 'DELETE')[-1])
+    assert last_delete < first_insert
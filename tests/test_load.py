@@ -0,0 +1,93 @@
+import duckdb
+import logging
+from pytest import fixture, raises
+from athena_mvsh.error import DatabaseError
+
+
+@fixture
+def manifest(cursor_duckdb, tmp_path) -> list[str]:
+    """Dois arquivos locais no lugar do manifesto do UNLOAD."""
+
+    files = []
+    for name, rows in [('a', '(1, 10), (2, 20)'), ('b', '(3, 30)')]:
+        path = tmp_path / f'{name}.parquet'
+        duckdb.sql(f"COPY (FROM (VALUES {rows}) t(id, valor)) TO '{path}'")
+        files.append(str(path))
+
+    cursor_duckdb.get_bucket_s3 = lambda: None
+    cursor_duckdb.unload_location = lambda bucket_s3: ('bucket', 'key', files)
+
+    return files
+
+
+def fail_reads(cursor, file: str, times: int) -> list[str]:
+    """As primeiras `times` leituras de `file` falham, as demais usam o leitor original."""
+
+    read_manifest = cursor._CursorParquetDuckdb__read_manifest
+    calls = []
+
+    def read(con, path):
+        calls.append(path)
+        if path == file and calls.count(path) <= times:
+            raise duckdb.IOException(f'Read failed: {path}')
+        return read_manifest(con, path)
+
+    cursor._CursorParquetDuckdb__read_manifest = read
+    return calls
+
+
+def load(cursor, tmp_path):
+    cursor.to_partition_create_table_db(
+        str(tmp_path / 'db.duckdb'), 'SELECT * FROM vendas', 2, table_name='vendas'
+    )
+
+
+def test_parallel_load_retry(cursor_duckdb, manifest, tmp_path, caplog):
+    calls = fail_reads(cursor_duckdb, manifest[1], times=1)
+
+    with caplog.at_level(logging.WARNING):
+        load(cursor_duckdb, tmp_path)
+
+    # NOTE: Somente o arquivo com falha e lido novamente
+    assert sorted(calls) == sorted([*manifest, manifest[1]])
+    assert 'Retry 1/3 file: b.parquet' in caplog.text
+
+    with duckdb.connect(str(tmp_path / 'db.duckdb')) as con:
+        assert con.sql('FROM vendas ORDER BY id').fetchall() == [
+            (1, 10),
+            (2, 20),
+            (3, 30),
+        ]
+
+
+def test_parallel_load_keeps_table(cursor_duckdb, manifest, tmp_path):
+    load(cursor_duckdb, tmp_path)
+    fail_reads(cursor_duckdb, manifest[1], times=3)
+
+    with raises(DatabaseError, match='Failed to read file b.parquet'):
+        load(cursor_duckdb, tmp_path)
+
+    # NOTE: Com erro a transacao e desfeita e a tabela anterior e mantida
+    with duckdb.connect(str(tmp_path / 'db.duckdb')) as con:
+        assert con.sql('SELECT count(*) FROM vendas').fetchone() == (3,)
+
+
+def test_to_duckdb_relation(cursor_duckdb, manifest, tmp_path):
+    con = duckdb.connect()
+    rel = cursor_duckdb.to_duckdb('SELECT * FROM vendas', con=con)
+
+    assert isinstance(rel, duckdb.DuckDBPyRelation)
+    assert rel.columns == ['id', 'valor']
+
+    # NOTE: A relacao e lazy, os arquivos sao lidos somente na consulta
+    duckdb.sql(f"COPY (SELECT 4 AS id, 40 AS valor) TO '{manifest[1]}'")
+    assert rel.filter('id > 1').order('id').fetchall() == [(2, 20), (4, 40)]
+    assert con.sql('SELECT count(*) FROM rel').fetchone() == (3,)
+
+
+def test_to_duckdb_empty(cursor_duckdb):
+    cursor_duckdb.get_bucket_s3 = lambda: None
+    cursor_duckdb.unload_location = lambda bucket_s3: (None, None, [])
+
+    with raises(DatabaseError, match='Query returned no files'):
+        cursor_duckdb.to_duckdb('SELECT * FROM vendas')
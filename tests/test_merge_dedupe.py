@@ -0,0 +1,75 @@
+import duckdb
+import pandas as pd
+from pytest import mark, raises
+from athena_mvsh.error import ProgrammingError
+from athena_mvsh.utils import predicate_columns
+
+
+SOURCE = pd.DataFrame(
+    {
+        'id': [1, 1, 2, 3, 3, 3],
+        'valor': ['a1', 'a2', 'b', 'c1', 'c2', 'c3'],
+        'atualizado': pd.array([10, 20, 5, None, 30, 15], dtype='Int64'),
+    }
+)
+
+
+@mark.parametrize(
+    'predicate,esperada',
+    [
+        ('t.id = s.id', {'id'}),
+        ('t."id" = s."ID" AND t.loja = s.`Loja`', {'id', 'loja'}),
+        ('t.id = s . id AND t.dt >= src.dt', {'id'}),
+        ('t.id = ss.id', set()),
+    ],
+)
+def test_predicate_columns(predicate, esperada):
+    assert predicate_columns(predicate, 's') == esperada
+
+
+def test_dedupe_relation(cursor_duckdb):
+    with duckdb.connect() as con:
+        rel = cursor_duckdb._CursorParquetDuckdb__dedupe_relation(
+            con, SOURCE, ['id'], ['atualizado']
+        )
+
+        # NOTE: Uma linha por chave, a de maior `atualizado` (nulos por ultimo)
+        assert rel.order('id').fetchall() == [(1, 'a2', 20), (2, 'b', 5), (3, 'c2', 30)]
+
+
+def test_merge_dedupe_source(cursor_duckdb, athena_client):
+    staged = []
+
+    def create_table_external(schema, table_name, location, data, *args, **kwargs):
+        staged.extend(data.order('id').fetchall())
+        return [('id', 'BIGINT'), ('valor', 'STRING'), ('atualizado', 'DOUBLE')]
+
+    cursor_duckdb._CursorParquetDuckdb__create_table_external = create_table_external
+
+    cursor_duckdb.merge_table_iceberg(
+        'vendas',
+        SOURCE,
+        'sch',
+        't.id = s.id',
+        dedupe_by=['id'],
+        order_by=['atualizado'],
+    )
+
+    assert [row[:2] for row in staged] == [(1, 'a2'), (2, 'b'), (3, 'c2')]
+    assert any(query.startswith('MERGE INTO') for query in athena_client.queries)
+
+
+@mark.parametrize(
+    'predicate,dedupe_by',
+    [('t.id = s.id', ['id', 'valor']), ('t.valor = s.valor', ['id'])],
+)
+def test_merge_dedupe_not_in_predicate(
+    cursor_duckdb, athena_client, predicate, dedupe_by
+):
+    # NOTE: Linhas com o mesmo `id` e `valor` diferente ainda correspondem a mesma linha
+    with raises(ProgrammingError, match='dedupe_by not used in predicate'):
+        cursor_duckdb.merge_table_iceberg(
+            'vendas', SOURCE, 'sch', predicate, dedupe_by=dedupe_by
+        )
+
+    assert not athena_client.queries
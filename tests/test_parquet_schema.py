@@ -0,0 +1,107 @@
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyarrow.fs as fs
+from pytest import mark, raises
+from athena_mvsh.converter import (
+    convert_tp_duckdb,
+    map_convert_duckdb_athena,
+    read_parquet_schema,
+)
+from athena_mvsh.error import ProgrammingError
+
+
+@mark.parametrize(
+    'data',
+    [
+        pa.table({'id': [1], 'nome': ['a'], 'valor': [1.5]}),
+        pa.table(
+            {'u': pa.array([1], pa.uint32()), 'ts': pa.array([1], pa.timestamp('ns'))}
+        ),
+        pa.table({'d': pa.array([1], pa.decimal128(10, 2)), 'l': [[1, 2]]}),
+        pa.table({'s': [{'a': 1, 'b': 'x'}], 'dt': pa.array([1], pa.date32())}),
+        pa.Table.from_pandas(
+            pd.DataFrame({'cat': pd.Categorical(['a', 'b']), 'n': [1, 2]}),
+            preserve_index=False,
+        ),
+    ],
+)
+def test_map_convert_duckdb_athena_footer(data, tmp_path):
+    files = [str(tmp_path / f'{i}.parquet') for i in range(3)]
+    for file in files:
+        pq.write_table(data, file)
+
+    con = duckdb.connect()
+    con.sql(f'CREATE TEMP TABLE esperado AS FROM read_parquet({files!r}) LIMIT 1')
+    esperado = [
+        (col, convert_tp_duckdb(tipo))
+        for col, tipo, *_ in con.sql('DESCRIBE esperado').fetchall()
+    ]
+
+    glob = map_convert_duckdb_athena(con, str(tmp_path / '*.parquet'))
+    footer = map_convert_duckdb_athena(con, files)
+
+    assert esperado == footer == glob
+
+
+@mark.parametrize(
+    'tables',
+    [
+        [pa.table({'id': [1]}), pa.table({'id': ['a']})],
+        [pa.table({'id': [1]}), pa.table({'codigo': [1]})],
+        [pa.table({'id': [1], 'nome': ['a']}), pa.table({'nome': ['a'], 'id': [1]})],
+    ],
+)
+def test_read_parquet_schema_conflict(tables, tmp_path):
+    files = [str(tmp_path / f'{i}.parquet') for i in range(len(tables))]
+    for file, table in zip(files, tables):
+        pq.write_table(table, file)
+
+    with raises(ProgrammingError):
+        read_parquet_schema(files)
+
+
+def test_read_parquet_schema_null(tmp_path):
+    files = [str(tmp_path / f'{i}.parquet') for i in range(2)]
+    pq.write_table(pa.table({'id': pa.nulls(1)}), files[0])
+    pq.write_table(pa.table({'id': [1]}), files[1])
+
+    assert read_parquet_schema(files) == pa.schema([('id', pa.int64())])
+
+
+def write_files(tmp_path, tables, folder='bucket') -> list[str]:
+    (tmp_path / folder).mkdir()
+    for i, table in enumerate(tables):
+        pq.write_table(table, tmp_path / folder / f'{i}.parquet')
+
+    return [f's3://{folder}/{i}.parquet' for i in range(len(tables))]
+
+
+def test_map_convert_s3_footer(tmp_path):
+    # NOTE: O S3 e simulado por um filesystem local com o bucket como diretorio
+    filesystem = fs.SubTreeFileSystem(str(tmp_path), fs.LocalFileSystem())
+    files = write_files(
+        tmp_path,
+        [
+            pa.table({'id': pa.nulls(1), 'nome': ['a']}),
+            pa.table({'id': [1], 'nome': ['b']}),
+        ],
+    )
+
+    con = duckdb.connect()
+    assert map_convert_duckdb_athena(con, files, filesystem) == [
+        ('id', 'BIGINT'),
+        ('nome', 'STRING'),
+    ]
+
+
+@mark.parametrize('remote', [True, False])
+def test_map_convert_conflict(tmp_path, remote):
+    filesystem = fs.SubTreeFileSystem(str(tmp_path), fs.LocalFileSystem())
+    files = write_files(tmp_path, [pa.table({'id': [1]}), pa.table({'id': ['a']})])
+
+    # NOTE: Glob local ou lista do S3, todos os rodapes sao comparados
+    path = files if remote else str(tmp_path / 'bucket' / '*.parquet')
+    with raises(ProgrammingError, match='conflicts with'):
+        map_convert_duckdb_athena(duckdb.connect(), path, filesystem)
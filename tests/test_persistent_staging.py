@@ -0,0 +1,143 @@
+import hashlib
+import pandas as pd
+from pytest import fixture, mark, raises
+from athena_mvsh import WriteOptions
+from athena_mvsh.error import DatabaseError, ProgrammingError
+from athena_mvsh.utils import parse_output_location
+
+
+STAGE_LOCATION = 's3://bucket/staging/stage/stage__vendas/'
+OTHER_BATCH = 'staging/stage/stage__vendas/__batch_id=outro/part_0.parquet'
+
+COLS = [('id', 'BIGINT'), ('loja', 'STRING')]
+COLS_NEW = [('id', 'BIGINT'), ('loja', 'STRING'), ('valor', 'DOUBLE')]
+
+
+def stage_name(cols_map: list[tuple]) -> str:
+    layout = ','.join(f'{col} {tipo.lower()}' for col, tipo in cols_map)
+    return f'stage__vendas__{hashlib.md5(layout.encode()).hexdigest()[:8]}'
+
+
+@fixture
+def cursor_stage(cursor_duckdb, s3_client):
+    """Cursor com staging permanente: o lote e gravado somente no S3 em memoria."""
+
+    cursor_duckdb.write_options = WriteOptions(persistent_staging=True)
+    cursor_duckdb.cols_map = COLS
+    cursor_duckdb.batches = []
+    s3_client.keys = [OTHER_BATCH]
+
+    def create_table_external(schema, table_name, location, *args, **kwargs):
+        cursor_duckdb.batches.append(location)
+        s3_client.keys.append(f'{parse_output_location(location)[1]}part_0.parquet')
+        return cursor_duckdb.cols_map
+
+    cursor_duckdb._CursorParquetDuckdb__create_table_external = create_table_external
+
+    return cursor_duckdb
+
+
+def write(cursor):
+    cursor.write_table_iceberg(
+        pd.DataFrame({'id': [1]}), 'vendas', 'sch', if_exists='append'
+    )
+
+
+def merge(cursor):
+    cursor.merge_table_iceberg(
+        'vendas', pd.DataFrame({'id': [1]}), 'sch', 't.id = s.id'
+    )
+
+
+def wait(cursor):
+    cursor._CursorParquetDuckdb__delete_executor.shutdown(wait=True)
+
+
+def queries(athena_client, prefix):
+    return [query for query in athena_client.queries if query.startswith(prefix)]
+
+
+def stage_meta(cols_map: list[tuple]) -> dict:
+    return {
+        'Parameters': {'location': STAGE_LOCATION},
+        'Columns': [{'Name': col, 'Type': tipo.lower()} for col, tipo in cols_map],
+        'PartitionKeys': [{'Name': '__batch_id', 'Type': 'string'}],
+    }
+
+
+def test_layout_change_keeps_batches(cursor_stage, athena_client, s3_client):
+    athena_client.tables[stage_name(COLS)] = stage_meta(COLS)
+    cursor_stage.cols_map = COLS_NEW
+
+    write(cursor_stage)
+    wait(cursor_stage)
+
+    # NOTE: Novo layout em uma tabela propria, a tabela antiga e seus lotes sao mantidos
+    assert not queries(athena_client, 'DROP TABLE')
+    [create] = queries(athena_client, 'CREATE EXTERNAL TABLE')
+    assert f'`sch`.`{stage_name(COLS_NEW)}`' in create
+    assert f"LOCATION '{STAGE_LOCATION}'" in create
+
+    [batch] = cursor_stage.batches
+    assert batch.startswith(f'{STAGE_LOCATION}__batch_id=')
+    [alter] = queries(athena_client, f'ALTER TABLE `sch`.`{stage_name(COLS_NEW)}` ADD')
+    assert f"LOCATION '{batch}'" in alter
+
+    # NOTE: Somente o lote da escrita e removido apos o INSERT
+    prefix = parse_output_location(batch)[1]
+    assert all(key.startswith(prefix) for keys in s3_client.deletes for key in keys)
+    assert s3_client.keys == [OTHER_BATCH]
+
+
+def test_compatible_glue_types(cursor_stage, athena_client):
+    athena_client.tables[stage_name(COLS)] = stage_meta(
+        [('id', 'bigint'), ('loja', 'string')]
+    )
+
+    write(cursor_stage)
+    write(cursor_stage)
+
+    # NOTE: Tipos do Glue em minusculas nao recriam a tabela, o layout fica em cache
+    assert not queries(athena_client, 'CREATE EXTERNAL TABLE')
+    assert not queries(athena_client, 'DROP TABLE')
+    assert (
+        len(queries(athena_client, f'ALTER TABLE `sch`.`{stage_name(COLS)}` ADD')) == 2
+    )
+
+
+def test_incompatible_stage_table(cursor_stage, athena_client, s3_client):
+    athena_client.tables[stage_name(COLS)] = stage_meta(
+        [('id', 'string'), ('loja', 'string')]
+    )
+
+    with raises(ProgrammingError, match='does not match the data columns'):
+        write(cursor_stage)
+    wait(cursor_stage)
+
+    assert not queries(athena_client, 'DROP TABLE')
+    assert not queries(athena_client, 'ALTER TABLE')
+    assert s3_client.keys == [OTHER_BATCH]
+
+
+@mark.parametrize(
+    'func,pattern',
+    [
+        (write, r'INSERT INTO'),
+        (merge, r'MERGE INTO'),
+        (write, r'ADD IF NOT EXISTS'),
+    ],
+)
+def test_batch_cleanup_on_error(cursor_stage, athena_client, s3_client, func, pattern):
+    athena_client.fail(pattern, times=10)
+
+    with raises(DatabaseError):
+        func(cursor_stage)
+    wait(cursor_stage)
+
+    # NOTE: Particao e arquivos do lote removidos, sem tocar na tabela temporaria
+    [batch] = cursor_stage.batches
+    batch_id = batch.rstrip('/').split('=')[-1]
+    [drop] = queries(athena_client, f'ALTER TABLE `sch`.`{stage_name(COLS)}` DROP')
+    assert drop.endswith(f"DROP IF EXISTS PARTITION (`__batch_id` = '{batch_id}')")
+    assert not any('temp__' in query for query in athena_client.queries)
+    assert s3_client.keys == [OTHER_BATCH]
@@ -0,0 +1,138 @@
+from pytest import mark
+from athena_mvsh import Athena
+from athena_mvsh.cursores import CursorBaseParquet
+from athena_mvsh.cursores.cursores import ChunkIterator
+
+
+ROWS = [(i,) for i in range(2_500)]
+
+
+class StubParquet(CursorBaseParquet):
+    def __init__(self, chunked: bool = False) -> None:
+        self.unload_mode = 'auto'
+        self.chunked = chunked
+        self.queries = []
+
+    def __chunks(self, query):
+        self.queries.append(('unload', query))
+        size = yield ROWS[:100]
+        offset = 100
+        while offset < len(ROWS):
+            chunk = ROWS[offset : offset + (size or 100)]
+            offset += len(chunk)
+            size = yield chunk
+
+    def execute(self, query, result_reuse_enable=False):
+        def unload():
+            self.queries.append(('unload', query))
+            yield from ROWS
+
+        if self.chunked:
+            return ChunkIterator(self.__chunks(query))
+
+        return unload()
+
+    def execute_paged(self, query, result_reuse_enable=False):
+        self.queries.append(('paged', query))
+        size = int(query.rsplit('LIMIT', 1)[1])
+        return [ROWS[:size]]
+
+
+# NOTE: Somente os metodos usados pelo fetch sao implementados
+StubParquet.__abstractmethods__ = frozenset()
+
+
+def test_preview_large_result():
+    cursor = StubParquet()
+    athena = Athena(cursor).execute('SELECT id FROM vendas;')
+
+    # NOTE: A previa indica mais linhas, o resultado vem somente do UNLOAD
+    assert athena.fetchmany(10) == ROWS[:10]
+    assert cursor.queries == [
+        ('paged', 'SELECT * FROM (\nSELECT id FROM vendas\n) LIMIT 11'),
+        ('unload', 'SELECT id FROM vendas;'),
+    ]
+
+
+@mark.parametrize('chunked', [False, True])
+def test_preview_single_execution(chunked):
+    cursor = StubParquet(chunked)
+    athena = Athena(cursor).execute('SELECT id FROM vendas')
+
+    rows = []
+    while batch := athena.fetchmany(500):
+        rows.extend(batch)
+
+    assert rows == ROWS
+    assert [kind for kind, __ in cursor.queries] == ['paged', 'unload']
+
+
+def test_preview_other_order():
+    class Shuffled(StubParquet):
+        def execute_paged(self, query, result_reuse_enable=False):
+            self.queries.append(('paged', query))
+            return [ROWS[::-1][:11]]
+
+    cursor = Shuffled()
+    athena = Athena(cursor).execute('SELECT id FROM vendas')
+
+    # NOTE: Linhas da previa em outra ordem nao geram duplicadas nem faltantes
+    rows = athena.fetchmany(10) + athena.fetchall()
+    assert rows == ROWS
+
+
+@mark.parametrize('fetch', ['fetchone', 'fetchall'])
+def test_preview_then_fetch(fetch):
+    athena = Athena(StubParquet()).execute('SELECT id FROM vendas')
+    athena.fetchmany(3)
+
+    rest = getattr(athena, fetch)()
+
+    assert rest == (ROWS[3] if fetch == 'fetchone' else ROWS[3:])
+
+
+@mark.parametrize('total', [5, 10])
+def test_preview_complete_result(total):
+    class Small(StubParquet):
+        def execute_paged(self, query, result_reuse_enable=False):
+            self.queries.append(('paged', query))
+            return [ROWS[:total]]
+
+    cursor = Small()
+    athena = Athena(cursor).execute('SELECT id FROM vendas LIMIT 10')
+
+    assert athena.fetchmany(10) == ROWS[:total]
+    assert athena.fetchmany(10) == []
+    assert [kind for kind, __ in cursor.queries] == ['paged']
+
+
+def test_preview_complex_columns():
+    class Complex(StubParquet):
+        def execute_paged(self, query, result_reuse_enable=False):
+            self.queries.append(('paged', query))
+            return None
+
+    cursor = Complex()
+    athena = Athena(cursor).execute('SELECT tags FROM vendas LIMIT 5')
+
+    assert athena.fetchmany(10) == ROWS[:10]
+    assert [kind for kind, __ in cursor.queries] == ['paged', 'unload']
+
+
+@mark.parametrize(
+    'tipo,esperado',
+    [
+        ('bigint', [[(3,)]]),
+        ('array', None),
+        ('map', None),
+        ('row', None),
+        ('json', None),
+    ],
+)
+def test_paged_complex_types(cursor_duckdb, athena_client, tipo, esperado):
+    athena_client.results['SELECT'] = [('3',)]
+    athena_client.types['SELECT'] = [tipo]
+
+    # NOTE: Colunas complexas vem como texto na API paginada, o UNLOAD retorna listas e structs
+    assert cursor_duckdb.execute_paged('SELECT x FROM vendas LIMIT 1') == esperado
+    assert len(athena_client.queries) == 1
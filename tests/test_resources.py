@@ -0,0 +1,44 @@
+import os
+from pytest import mark
+from athena_mvsh import ResourceProfile
+
+
+def test_resources_default():
+    profile = ResourceProfile()
+
+    assert profile.config() == {
+        'preserve_insertion_order': False,
+        'threads': (os.cpu_count() or 1) * 5,
+    }
+    assert profile.http_settings() == {}
+
+
+def test_resources_limits():
+    profile = ResourceProfile(
+        threads=4,
+        memory_limit='8GB',
+        temp_directory='/tmp/spill',
+        max_s3_requests=16,
+        http_timeout=60,
+    )
+
+    assert profile.config() == {
+        'preserve_insertion_order': False,
+        'threads': 4,
+        'memory_limit': '8GB',
+        'temp_directory': '/tmp/spill',
+    }
+    assert profile.http_settings() == {
+        's3_uploader_thread_limit': 16,
+        'http_timeout': 60,
+    }
+
+
+@mark.parametrize(
+    'max_s3_requests,workers,esperado',
+    [(None, 8, 8), (4, 8, 4), (16, 8, 8)],
+)
+def test_resources_s3_workers(max_s3_requests, workers, esperado):
+    profile = ResourceProfile(max_s3_requests=max_s3_requests)
+
+    assert profile.s3_workers(workers) == esperado
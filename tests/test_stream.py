@@ -0,0 +1,59 @@
+import duckdb
+import pandas as pd
+import pyarrow as pa
+from pytest import mark, raises
+from athena_mvsh.converter import relation_reader, to_record_batch_reader
+from athena_mvsh.error import ProgrammingError
+
+
+def gerar_dataframes():
+    for i in range(3):
+        yield pd.DataFrame({'id': [i, i + 10], 'nome': ['a', 'b']})
+
+
+@mark.parametrize(
+    'data',
+    [
+        gerar_dataframes(),
+        iter(pa.table({'id': [0, 10, 1, 11, 2, 12]}).to_batches(max_chunksize=2)),
+        (pa.table({'id': [i, i + 10]}) for i in range(3)),
+    ],
+)
+def test_stream_iterable(data):
+    reader = to_record_batch_reader(data)
+
+    assert isinstance(reader, pa.RecordBatchReader)
+    assert reader.read_all().num_rows == 6
+
+
+def test_stream_reader_relation():
+    tbl = pa.table({'id': [1, 2, 3]})
+    reader = tbl.to_reader()
+
+    assert to_record_batch_reader(reader) is reader
+
+    rel = duckdb.sql('SELECT range AS id FROM range(5)')
+    assert to_record_batch_reader(rel).read_all().num_rows == 5
+
+
+def test_stream_cast_schema():
+    data = [pd.DataFrame({'valor': [1.5]}), pd.DataFrame({'valor': [2]})]
+    tbl = to_record_batch_reader(iter(data)).read_all()
+
+    assert tbl.schema.field('valor').type == pa.float64()
+
+
+@mark.parametrize('data', [iter([]), iter([{'id': 1}])])
+def test_stream_invalid(data):
+    with raises(ProgrammingError):
+        to_record_batch_reader(data).read_all()
+
+
+def test_relation_reader_fallback():
+    class OldRelation:
+        def fetch_record_batch(self, batch_size):
+            return pa.table({'id': [1, 2, 3]}).to_reader(max_chunksize=batch_size)
+
+    reader = relation_reader(OldRelation(), 2)
+
+    assert [batch.num_rows for batch in reader] == [2, 1]
@@ -0,0 +1,93 @@
+import duckdb
+from pytest import mark, raises
+from athena_mvsh.error import ProgrammingError
+from athena_mvsh.utils import query_watermark
+
+
+@mark.parametrize(
+    'query,value,esperada',
+    [
+        ('SELECT * FROM vendas', None, 'SELECT * FROM vendas'),
+        ('SELECT * FROM vendas;', None, 'SELECT * FROM vendas'),
+        (
+            'SELECT * FROM vendas',
+            "TIMESTAMP '2024-01-01 00:00:00.000000'",
+            'SELECT * FROM (\nSELECT * FROM vendas\n) '
+            'WHERE "atualizado" > TIMESTAMP \'2024-01-01 00:00:00.000000\'',
+        ),
+        (
+            '\n    SELECT id FROM vendas;\n',
+            '10',
+            'SELECT * FROM (\nSELECT id FROM vendas\n) WHERE "atualizado" > 10',
+        ),
+    ],
+)
+def test_query_watermark(query, value, esperada):
+    assert query_watermark(query, 'atualizado', value) == esperada
+
+
+def sync_rows(cursor, tmp_path, name, rows):
+    path = tmp_path / f'{name}.parquet'
+    duckdb.sql(
+        f"COPY (FROM (VALUES {', '.join(map(str, rows))}) t(id, valor, atualizado)) TO '{path}'"
+    )
+
+    cursor.get_bucket_s3 = lambda: None
+    cursor.unload_location = lambda bucket_s3: ('bucket', 'key', [str(path)])
+
+    return cursor.sync_to_duckdb(
+        str(tmp_path / 'db.duckdb'),
+        'SELECT * FROM vendas',
+        'id',
+        'atualizado',
+        table_name='vendas',
+    )
+
+
+def test_sync_to_duckdb(cursor_duckdb, athena_client, tmp_path):
+    assert (
+        sync_rows(cursor_duckdb, tmp_path, 'carga_1', [(1, 'a', 10), (2, 'b', 20)]) == 2
+    )
+    assert 'WHERE' not in athena_client.queries[-1]
+
+    # NOTE: A chave 2 aparece tres vezes, somente a versao mais recente e mantida
+    rows = ["(2, 'b0', NULL)", (2, 'b2', 40), (2, 'b1', 30), (3, 'c', 35)]
+    assert sync_rows(cursor_duckdb, tmp_path, 'carga_2', rows) == 2
+    assert 'WHERE "atualizado" > 20' in athena_client.queries[-1]
+
+    with duckdb.connect(str(tmp_path / 'db.duckdb')) as con:
+        assert con.sql('FROM vendas ORDER BY id').fetchall() == [
+            (1, 'a', 10),
+            (2, 'b2', 40),
+            (3, 'c', 35),
+        ]
+        assert con.sql(
+            'SELECT table_name, watermark FROM __athena_sync_state'
+        ).fetchall() == [('vendas', '40')]
+
+
+@mark.parametrize('value', ["TIME '10:00:00'", 'uuid()'])
+def test_sync_watermark_type(cursor_duckdb, tmp_path, value):
+    path = tmp_path / 'carga.parquet'
+    duckdb.sql(
+        f"COPY (SELECT 1 AS id, 'a' AS valor, {value} AS atualizado) TO '{path}'"
+    )
+
+    cursor_duckdb.get_bucket_s3 = lambda: None
+    cursor_duckdb.unload_location = lambda bucket_s3: ('bucket', 'key', [str(path)])
+
+    with raises(ProgrammingError, match='Watermark column atualizado type'):
+        cursor_duckdb.sync_to_duckdb(
+            str(tmp_path / 'db.duckdb'),
+            'SELECT * FROM vendas',
+            'id',
+            'atualizado',
+            table_name='vendas',
+        )
+
+    # NOTE: Nenhuma tabela ou marca d'agua e gravada
+    with duckdb.connect(str(tmp_path / 'db.duckdb')) as con:
+        assert con.sql(
+            "SELECT count(*) FROM information_schema.tables WHERE table_name = 'vendas'"
+        ).fetchone() == (0,)
+        assert con.sql('SELECT count(*) FROM __athena_sync_state').fetchone() == (0,)
@@ -0,0 +1,56 @@
+import time
+from pytest import raises
+from athena_mvsh.utils import TaskGraph
+
+
+def passo(nome: str, segundos: float, ordem: list):
+    def executar():
+        time.sleep(segundos)
+        ordem.append(nome)
+        return nome.upper()
+
+    return executar
+
+
+def test_task_graph_ordem():
+    ordem = []
+    graph = TaskGraph()
+    graph.add('drop', passo('drop', 0.02, ordem))
+    graph.add('stage', passo('stage', 0.10, ordem))
+    graph.add('create', passo('create', 0.01, ordem), after=['drop', 'stage'])
+    graph.add('insert', passo('insert', 0.01, ordem), after=['create'])
+
+    resultados = graph.run()
+
+    assert ordem == ['drop', 'stage', 'create', 'insert']
+    assert resultados == {
+        'drop': 'DROP',
+        'stage': 'STAGE',
+        'create': 'CREATE',
+        'insert': 'INSERT',
+    }
+    assert [nome for nome, __ in graph.critical_path()] == ['stage', 'create', 'insert']
+
+
+def test_task_graph_erro():
+    ordem = []
+
+    def falhar():
+        raise ValueError('falha')
+
+    graph = TaskGraph()
+    graph.add('stage', falhar)
+    graph.add('lento', passo('lento', 0.05, ordem))
+    graph.add('insert', passo('insert', 0, ordem), after=['stage'])
+
+    with raises(ValueError, match='falha'):
+        graph.run()
+
+    assert ordem == ['lento']
+
+
+def test_task_graph_dependencia_desconhecida():
+    graph = TaskGraph()
+
+    with raises(ValueError):
+        graph.add('insert', lambda: None, after=['stage'])
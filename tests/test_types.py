@@ -1,5 +1,14 @@
+import datetime
 import pandas as pd
-from athena_mvsh.converter import map_convert_df_athena
+import pyarrow as pa
+from athena_mvsh.converter import (
+    athena_type_df,
+    map_convert_df_athena,
+    to_arrow_schema,
+    is_athena_compatible,
+    to_athena_type_ddl,
+    to_athena_arrow_schema,
+)
 from pytest import mark
 
 
@@ -65,3 +74,123 @@ def test_types_pandas(esperado):
     saida = map_convert_df_athena(df)
 
     assert saida == esperado
+
+
+def test_types_arrow_schema():
+    column_info = (
+        {'Name': 'id', 'Type': 'bigint', 'Nullable': 'NOT_NULL'},
+        {'Name': 'valor', 'Type': 'decimal', 'Precision': 10, 'Scale': 2},
+        {'Name': 'nome', 'Type': 'varchar', 'Nullable': 'NULLABLE'},
+        {'Name': 'periodo', 'Type': 'timestamp', 'Nullable': 'UNKNOWN'},
+        {'Name': 'tags', 'Type': 'array', 'Nullable': 'NULLABLE'},
+    )
+
+    schema = to_arrow_schema(column_info)
+
+    assert schema == pa.schema(
+        [
+            pa.field('id', pa.int64(), False),
+            pa.field('valor', pa.decimal128(10, 2)),
+            pa.field('nome', pa.string()),
+            pa.field('periodo', pa.timestamp('us')),
+            pa.field('tags', pa.string()),
+        ]
+    )
+
+
+@mark.parametrize(
+    'type_,esperada',
+    [
+        (pa.int64(), True),
+        (pa.string(), True),
+        (pa.decimal128(10, 2), True),
+        (pa.timestamp('us'), True),
+        (pa.timestamp('ms', tz='UTC'), True),
+        (pa.timestamp('ns'), False),
+        (pa.uint32(), False),
+        (pa.time64('us'), False),
+        (pa.list_(pa.int32()), True),
+        (pa.list_(pa.uint8()), False),
+        (pa.struct([('a', pa.string()), ('b', pa.timestamp('ns'))]), False),
+        (pa.map_(pa.string(), pa.float64()), True),
+        (pa.dictionary(pa.int32(), pa.string()), True),
+    ],
+)
+def test_types_athena_compatible(type_, esperada):
+    assert is_athena_compatible(type_) == esperada
+
+
+@mark.parametrize(
+    'type_,esperada',
+    [
+        (pa.bool_(), 'BOOLEAN'),
+        (pa.int32(), 'INT'),
+        (pa.int64(), 'BIGINT'),
+        (pa.float64(), 'DOUBLE'),
+        (pa.large_string(), 'STRING'),
+        (pa.binary(), 'BINARY'),
+        (pa.date32(), 'DATE'),
+        (pa.timestamp('us', tz='UTC'), 'TIMESTAMP'),
+        (pa.decimal128(18, 4), 'DECIMAL(18,4)'),
+        (pa.list_(pa.string()), 'ARRAY<STRING>'),
+        (pa.map_(pa.string(), pa.int64()), 'MAP<STRING,BIGINT>'),
+        (
+            pa.struct([('a', pa.int16()), ('b', pa.list_(pa.float32()))]),
+            'STRUCT<a:SMALLINT,b:ARRAY<FLOAT>>',
+        ),
+    ],
+)
+def test_types_athena_ddl(type_, esperada):
+    assert to_athena_type_ddl(type_) == esperada
+
+
+def test_types_athena_arrow_schema():
+    schema = pa.schema(
+        [
+            ('u8', pa.uint8()),
+            ('u32', pa.uint32()),
+            ('ns', pa.timestamp('ns', tz='UTC')),
+            ('cat', pa.dictionary(pa.int32(), pa.string())),
+            ('itens', pa.list_(pa.uint16())),
+            ('texto', pa.string()),
+        ]
+    )
+
+    assert to_athena_arrow_schema(schema) == pa.schema(
+        [
+            ('u8', pa.int16()),
+            ('u32', pa.int64()),
+            ('ns', pa.timestamp('us', tz='UTC')),
+            ('cat', pa.string()),
+            ('itens', pa.list_(pa.int32())),
+            ('texto', pa.string()),
+        ]
+    )
+
+
+@mark.parametrize(
+    'col',
+    [
+        pd.Series([1, None], dtype='Int32'),
+        pd.Series([None], dtype='boolean'),
+        pd.Series(['a'], dtype='category'),
+        pd.Series([1.0], dtype='float32[pyarrow]'),
+        pd.Series(pd.to_datetime(['2023-01-01']).tz_localize('UTC')),
+        pd.Series([1, None], dtype=object),
+        pd.Series([datetime.date(2023, 1, 1), None]),
+        pd.Series([datetime.timedelta(1)], dtype=object),
+        pd.Series([b'a']),
+        pd.Series([None]),
+        pd.Series([1, 'a']),
+    ],
+)
+def test_types_pandas_dtype(col):
+    esperada = athena_type_df(pd.api.types.infer_dtype(col, skipna=True), col.dtype)
+
+    assert map_convert_df_athena(pd.DataFrame({'col': col})) == [('col', esperada)]
+
+
+def test_types_pandas_sample():
+    col = pd.Series([None] * 5_000 + [datetime.date(2023, 1, 1)] * 10)
+
+    assert map_convert_df_athena(pd.DataFrame({'col': col})) == [('col', 'DATE')]
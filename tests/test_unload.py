@@ -0,0 +1,45 @@
+from pytest import mark, raises
+from athena_mvsh.cursores import UnloadOptions
+from athena_mvsh.error import ProgrammingError
+
+
+@mark.parametrize(
+    'opcoes,esperada',
+    [
+        (
+            UnloadOptions(),
+            ["format = 'PARQUET'", "compression = 'ZSTD'"],
+        ),
+        (
+            UnloadOptions(compression='snappy'),
+            ["format = 'PARQUET'", "compression = 'SNAPPY'"],
+        ),
+        (
+            UnloadOptions(compression_level=3),
+            ["format = 'PARQUET'", "compression = 'ZSTD'", 'compression_level = 3'],
+        ),
+        (
+            UnloadOptions(compression='LZ4', partitioned_by=['ano', 'mes']),
+            [
+                "format = 'PARQUET'",
+                "compression = 'LZ4'",
+                "partitioned_by = ARRAY['ano', 'mes']",
+            ],
+        ),
+    ],
+)
+def test_unload_properties(opcoes, esperada):
+    assert opcoes.properties() == esperada
+
+
+@mark.parametrize(
+    'kwargs',
+    [
+        {'compression': 'SNAPPY', 'compression_level': 3},
+        {'compression': 'ZSTD', 'compression_level': 0},
+        {'compression': 'ZSTD', 'compression_level': 23},
+    ],
+)
+def test_unload_invalid_level(kwargs):
+    with raises(ProgrammingError):
+        UnloadOptions(**kwargs)
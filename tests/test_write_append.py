@@ -0,0 +1,159 @@
+import pandas as pd
+from pytest import fixture, mark, raises
+from athena_mvsh.converter import normalize_type_ddl
+from athena_mvsh.error import DatabaseError, ProgrammingError
+from athena_mvsh.utils import is_not_found_error
+from tests.conftest import client_error
+
+
+COLS_MAP = [('id', 'BIGINT'), ('valor', 'DOUBLE'), ('loja', 'STRING')]
+
+
+def table_meta(location: str, **kwargs) -> dict:
+    meta = {
+        'Parameters': {'location': location},
+        'Columns': [
+            {'Name': 'id', 'Type': 'bigint'},
+            {'Name': 'valor', 'Type': 'double'},
+        ],
+        'PartitionKeys': [{'Name': 'loja', 'Type': 'string'}],
+    }
+
+    return meta | kwargs
+
+
+@mark.parametrize(
+    'tipo,esperado',
+    [
+        ('STRING', 'string'),
+        ('INTEGER', 'int'),
+        ('DECIMAL(10, 2)', 'decimal(10,2)'),
+        ('MAP<STRING, INTEGER>', 'map<string,int>'),
+        ('STRUCT<a:INT,b:VARCHAR>', 'struct<a:int,b:string>'),
+        ('varchar(10)', 'varchar(10)'),
+    ],
+)
+def test_normalize_type_ddl(tipo, esperado):
+    assert normalize_type_ddl(tipo) == esperado
+
+
+@mark.parametrize(
+    'error,esperado',
+    [
+        (client_error('MetadataException', 'Table vendas not found'), True),
+        (client_error('EntityNotFoundException', 'Entity Not Found'), True),
+        (client_error('ThrottlingException', 'Rate exceeded'), False),
+        (client_error('AccessDeniedException', 'User is not authorized'), False),
+        (ValueError('not found'), False),
+    ],
+)
+def test_is_not_found_error(error, esperado):
+    assert is_not_found_error(error) is esperado
+
+
+@mark.parametrize(
+    'meta,partitions,match',
+    [
+        (
+            table_meta(
+                's3://b/t/',
+                Parameters={'location': 's3://b/t/', 'table_type': 'ICEBERG'},
+            ),
+            ['loja'],
+            'Iceberg',
+        ),
+        (table_meta('s3://b/t/'), None, 'Partitions'),
+        (table_meta('s3://b/t/'), ['valor'], 'Partitions'),
+        (
+            table_meta('s3://b/t/', Columns=[{'Name': 'id', 'Type': 'bigint'}]),
+            ['loja'],
+            'Columns',
+        ),
+        (
+            table_meta(
+                's3://b/t/',
+                Columns=[
+                    {'Name': 'id', 'Type': 'bigint'},
+                    {'Name': 'valor', 'Type': 'decimal(10,2)'},
+                ],
+            ),
+            ['loja'],
+            'valor DOUBLE != decimal\\(10,2\\)',
+        ),
+    ],
+)
+def test_append_location_mismatch(cursor_duckdb, meta, partitions, match):
+    with raises(ProgrammingError, match=match):
+        cursor_duckdb._CursorParquetDuckdb__append_location(meta, COLS_MAP, partitions)
+
+
+def test_append_location(cursor_duckdb):
+    meta = table_meta(
+        's3://b/t',
+        Columns=[{'Name': 'id', 'Type': 'BIGINT'}, {'Name': 'valor', 'Type': 'double'}],
+    )
+
+    assert (
+        cursor_duckdb._CursorParquetDuckdb__append_location(meta, COLS_MAP, ['loja'])
+        == 's3://b/t/'
+    )
+
+
+@fixture
+def vendas(tmp_path, athena_client):
+    location = tmp_path / 'vendas'
+    (location / 'loja=a').mkdir(parents=True)
+    (location / 'loja=a' / 'antigo.parquet').write_bytes(b'')
+
+    athena_client.tables['vendas'] = table_meta(f'{location}/')
+
+    return location
+
+
+def append(cursor, valores):
+    df = pd.DataFrame(
+        {'id': range(len(valores)), 'valor': [1.5] * len(valores), 'loja': valores}
+    )
+    cursor.write_dataframe(df, 'vendas', 'sch', partitions=['loja'], if_exists='append')
+
+
+def test_append_keeps_files(cursor_duckdb, athena_client, vendas):
+    append(cursor_duckdb, ['a', 'b'])
+    append(cursor_duckdb, ['a'])
+
+    # NOTE: FILENAME_PATTERN com uuid e OVERWRITE_OR_IGNORE, os arquivos existentes sao mantidos
+    files = sorted(path.name for path in (vendas / 'loja=a').iterdir())
+    assert len(files) == 3
+    assert 'antigo.parquet' in files
+    assert all(name.startswith('part_') for name in files if name != 'antigo.parquet')
+
+    assert not [q for q in athena_client.queries if q.startswith(('DROP', 'CREATE'))]
+    assert any(
+        q.startswith('ALTER TABLE `sch`.`vendas` ADD IF NOT EXISTS')
+        and "`loja` = 'b'" in q
+        for q in athena_client.queries
+    )
+
+
+def test_append_metadata_error_never_drops(cursor_duckdb, athena_client, vendas):
+    athena_client.metadata_error = client_error('ThrottlingException', 'Rate exceeded')
+
+    with raises(DatabaseError, match='Rate exceeded'):
+        append(cursor_duckdb, ['a'])
+
+    assert not athena_client.queries
+    assert sorted(path.name for path in (vendas / 'loja=a').iterdir()) == [
+        'antigo.parquet'
+    ]
+
+
+def test_append_missing_table_creates(cursor_duckdb, athena_client, tmp_path):
+    (tmp_path / 'novo').mkdir()
+    df = pd.DataFrame({'id': [1], 'valor': [1.5]})
+    cursor_duckdb.write_dataframe(
+        df, 'vendas', 'sch', f'{tmp_path}/novo', if_exists='append'
+    )
+
+    assert [q.split('(')[0].strip() for q in athena_client.queries] == [
+        'CREATE EXTERNAL TABLE `sch`.`vendas`'
+    ]
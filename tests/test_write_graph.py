@@ -0,0 +1,124 @@
+import threading
+import time
+import pandas as pd
+from pytest import mark, raises
+from athena_mvsh import WriteOptions
+from athena_mvsh.error import DatabaseError
+
+
+P = '_CursorParquetDuckdb__'
+
+
+def record(cursor, events, name, result=None, secs=0.0, error=None):
+    original = getattr(cursor, P + name)
+
+    def step(*args, **kwargs):
+        events.append((name, 'start', time.perf_counter()))
+        time.sleep(secs)
+        events.append((name, 'end', time.perf_counter()))
+        if error:
+            raise error
+        return result if result is not None else original(*args, **kwargs)
+
+    setattr(cursor, P + name, step)
+
+
+def at(events, name, kind):
+    return next(t for step, k, t in events if step == name and k == kind)
+
+
+def test_write_external_order(cursor_duckdb, athena_client):
+    events = []
+    athena_client.tables['vendas'] = {'Parameters': {'location': 's3://bucket/vendas/'}}
+    record(
+        cursor_duckdb, events, 'drop_table_snapshot', ('bucket', [['vendas/a']]), 0.02
+    )
+    record(cursor_duckdb, events, 'purge_objects', 0, 0.05)
+    record(cursor_duckdb, events, 'create_table_external', [('id', 'BIGINT')], 0.02)
+
+    cursor_duckdb.write_dataframe(pd.DataFrame({'id': [1]}), 'vendas', 'sch')
+
+    # NOTE: Escrita apos a listagem do DROP, em paralelo com a remocao dos arquivos
+    assert at(events, 'create_table_external', 'start') >= at(
+        events, 'drop_table_snapshot', 'end'
+    )
+    assert at(events, 'create_table_external', 'start') < at(
+        events, 'purge_objects', 'end'
+    )
+
+
+@mark.parametrize('persistent', [False, True])
+def test_write_iceberg_order(cursor_duckdb, athena_client, persistent):
+    cursor_duckdb.write_options = WriteOptions(persistent_staging=persistent)
+    events = []
+    cols_map = [('id', 'BIGINT')]
+    record(cursor_duckdb, events, 'drop_table_snapshot', ('bucket', [['x']]), 0.01)
+    record(cursor_duckdb, events, 'purge_objects', 0, 0.05)
+    record(cursor_duckdb, events, 'create_table_external', cols_map, 0.01)
+    record(cursor_duckdb, events, 'create_table_iceberg', 0)
+    record(cursor_duckdb, events, 'insert_table_iceberg', 0)
+    record(cursor_duckdb, events, 'delete_table', 0)
+
+    cursor_duckdb.write_table_iceberg(pd.DataFrame({'id': [1]}), 'vendas', 'sch')
+
+    purges = [t for step, k, t in events if step == 'purge_objects' and k == 'end']
+    assert len(purges) == (1 if persistent else 2)
+
+    # NOTE: O staging inicia apos as listagens do DROP, o destino pode conter o staging
+    snapshots = [
+        t for step, k, t in events if step == 'drop_table_snapshot' and k == 'end'
+    ]
+    assert at(events, 'create_table_external', 'start') >= max(snapshots)
+    assert at(events, 'create_table_external', 'start') < max(purges)
+
+    # NOTE: A tabela destino e criada apos a remocao dos arquivos antigos e do staging
+    create = at(events, 'create_table_iceberg', 'start')
+    assert create >= max(purges)
+    assert create >= at(events, 'create_table_external', 'end')
+    assert at(events, 'insert_table_iceberg', 'start') >= at(
+        events, 'create_table_iceberg', 'end'
+    )
+    if not persistent:
+        assert at(events, 'delete_table', 'start') >= at(
+            events, 'insert_table_iceberg', 'end'
+        )
+
+
+def test_write_iceberg_error(cursor_duckdb, athena_client):
+    events = []
+    record(cursor_duckdb, events, 'drop_table_snapshot', ('bucket', [['x']]))
+    record(cursor_duckdb, events, 'purge_objects', 0, 0.05)
+    record(
+        cursor_duckdb,
+        events,
+        'create_table_external',
+        error=DatabaseError('stage failed'),
+    )
+    record(cursor_duckdb, events, 'create_table_iceberg', 0)
+    record(cursor_duckdb, events, 'delete_table', 0)
+
+    with raises(DatabaseError, match='stage failed'):
+        cursor_duckdb.write_table_iceberg(pd.DataFrame({'id': [1]}), 'vendas', 'sch')
+
+    steps = [step for step, k, __ in events if k == 'end']
+
+    # NOTE: Passos em execucao terminam, os dependentes nao iniciam e o staging e removido
+    assert steps.count('purge_objects') >= 1
+    assert 'create_table_iceberg' not in steps
+    assert steps[-1] == 'delete_table'
+
+
+def test_query_state_per_thread(cursor_duckdb, athena_client):
+    cursor_duckdb.start_query_execution('SELECT 1')
+    main_state = cursor_duckdb.get_query_execution
+
+    threads = [
+        threading.Thread(target=cursor_duckdb.start_query_execution, args=('SELECT 2',))
+        for __ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cursor_duckdb.get_query_execution is main_state
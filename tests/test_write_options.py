@@ -0,0 +1,42 @@
+from athena_mvsh import WriteOptions
+
+
+def test_write_options_default():
+    options = WriteOptions()
+
+    assert not options.is_multi_file
+    assert options.copy_options() == []
+
+
+def test_write_options_row_group():
+    options = WriteOptions(row_group_size=100_000)
+
+    assert not options.is_multi_file
+    assert options.copy_options() == ['ROW_GROUP_SIZE 100000']
+
+
+def test_write_options_multi_file():
+    options = WriteOptions(
+        file_size_bytes='256MB', row_group_size=100_000, per_thread_output=True
+    )
+
+    assert options.is_multi_file
+    assert options.copy_options() == [
+        'ROW_GROUP_SIZE 100000',
+        "FILE_SIZE_BYTES '256MB'",
+        'PER_THREAD_OUTPUT true',
+        "FILENAME_PATTERN 'part_{uuid}'",
+        'OVERWRITE_OR_IGNORE true',
+    ]
+
+
+def test_write_options_partitioned():
+    options = WriteOptions(file_size_bytes=1024, row_group_size=100_000)
+
+    assert options.copy_options(partitioned=True) == ['ROW_GROUP_SIZE 100000']
+    assert options.copy_options() == [
+        'ROW_GROUP_SIZE 100000',
+        'FILE_SIZE_BYTES 1024',
+        "FILENAME_PATTERN 'part_{uuid}'",
+        'OVERWRITE_OR_IGNORE true',
+    ]